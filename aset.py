@@ -0,0 +1,81 @@
+"""Aset statis tampilan: CSS tema dan logo warung.
+
+CSS tema disimpan sebagai file di folder ``tema`` dan diringkas (komentar dan
+spasi dibuang) sekali per proses. Logo diperkecil ke lebar tampilnya lalu
+di-encode sekali. Semua hasil di-cache bersama semua sesi dengan kunci waktu
+ubah file, jadi file yang diganti di disk langsung terpakai tanpa restart.
+
+Streamlit tetap mengirim ulang elemen di setiap rerun (elemen yang tidak
+digambar ulang akan hilang), jadi yang dihemat adalah ukuran dan kerja
+membangunnya: teks CSS yang dikirim selalu sama persis dan sudah ringkas.
+"""
+import base64
+import io
+import os
+import re
+
+import streamlit as st
+
+FOLDER_TEMA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tema")
+
+
+# --- CSS ---
+def ringkas_css(css):
+    """Membuang komentar dan spasi yang tidak berpengaruh pada aturan CSS."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    # Titik dua hanya dirapatkan di dalam deklarasi; di selector (".a :hover") spasinya bermakna
+    css = re.sub(r"\{[^{}]*\}", lambda m: re.sub(r"\s*:\s*", ":", m.group(0)), css)
+    return css.replace(";}", "}").strip()
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _css_berkas(path, mtime):
+    with open(path, encoding="utf-8") as f:
+        return ringkas_css(f.read())
+
+
+def css_tema(nama):
+    """CSS ringkas dari ``tema/<nama>``."""
+    path = os.path.join(FOLDER_TEMA, nama)
+    return _css_berkas(path, os.path.getmtime(path))
+
+
+def pasang_css(nama):
+    st.markdown(f"<style>{css_tema(nama)}</style>", unsafe_allow_html=True)
+
+
+# --- Gambar ---
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _gambar_kecil(path, mtime, lebar):
+    # Pillow sudah ikut terpasang bersama streamlit; hanya dimuat jika ada gambar yang perlu diperkecil
+    from PIL import Image
+
+    with Image.open(path) as gambar:
+        if gambar.width <= lebar:
+            with open(path, "rb") as f:
+                return f.read()
+        tinggi = round(gambar.height * lebar / gambar.width)
+        kecil = gambar.convert("RGB").resize((lebar, tinggi), Image.LANCZOS)
+    buffer = io.BytesIO()
+    kecil.save(buffer, format="JPEG", quality=85, optimize=True)
+    return buffer.getvalue()
+
+
+def gambar_kecil(path, lebar):
+    """Isi file gambar (JPEG) yang sudah diperkecil ke ``lebar`` piksel, atau None jika file tidak ada."""
+    if not os.path.exists(path):
+        return None
+    return _gambar_kecil(path, os.path.getmtime(path), lebar)
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _base64_berkas(path, mtime):
+    with open(path, "rb") as f:
+        return base64.b64encode(f.read()).decode()
+
+
+def get_base64_image(image_path):
+    """Mengkonversi gambar ke base64 (di-cache selama file tidak berubah)"""
+    return _base64_berkas(image_path, os.path.getmtime(image_path))
@@ -0,0 +1,159 @@
+"""Bagan akun (chart of accounts) warteg.
+
+Setiap akun mendapat ID integer, tipe, dan saldo normal SEKALI saja, yaitu
+saat akun itu pertama kali dicatat. Laporan cukup mengelompokkan per ID dan
+membaca tipe dari bagan ini, tanpa mencocokkan teks nama akun baris demi
+baris setiap kali halaman dibuka.
+"""
+import numpy as np
+import pandas as pd
+
+# --- Tipe akun ---
+ASET_LANCAR = "aset_lancar"
+ASET_TETAP = "aset_tetap"
+KEWAJIBAN = "kewajiban"
+MODAL = "modal"
+PRIVE = "prive"
+PENDAPATAN = "pendapatan"
+BEBAN = "beban"
+IKHTISAR = "ikhtisar"
+LAINNYA = "lainnya"
+
+# Akun sementara yang ditutup di akhir periode (tidak masuk NSSP)
+TIPE_NOMINAL = {PENDAPATAN, BEBAN, PRIVE, IKHTISAR}
+
+SALDO_NORMAL_DEBIT = "D"
+SALDO_NORMAL_KREDIT = "K"
+_TIPE_SALDO_KREDIT = {KEWAJIBAN, MODAL, PENDAPATAN, IKHTISAR}
+
+# Nama akun baku (huruf kecil) yang sudah pasti tipenya
+_AKUN_BAKU = {
+    "kas": ASET_LANCAR,
+    "piutang usaha": ASET_LANCAR,
+    "perlengkapan": ASET_LANCAR,
+    "persediaan": ASET_LANCAR,
+    "peralatan": ASET_TETAP,
+    "kendaraan": ASET_TETAP,
+    "bangunan": ASET_TETAP,
+    "akumulasi penyusutan": ASET_TETAP,
+    "akumulasi penyusutan peralatan": ASET_TETAP,
+    "utang usaha": KEWAJIBAN,
+    "utang bank": KEWAJIBAN,
+    "utang gaji": KEWAJIBAN,
+    "utang pakan": KEWAJIBAN,
+}
+
+# Kata kunci di dalam nama akun; urutan menentukan prioritas
+_KATA_KUNCI = [
+    ("ikhtisar", IKHTISAR),
+    ("pendapatan", PENDAPATAN),
+    ("beban", BEBAN),
+    ("prive", PRIVE),
+    ("modal", MODAL),
+    ("ekuitas", MODAL),
+    ("akumulasi", ASET_TETAP),
+    ("utang", KEWAJIBAN),
+    ("kewajiban", KEWAJIBAN),
+]
+
+# Awalan nama akun untuk varian akun harta (misalnya "Kas Kecil", "Peralatan Dapur")
+_AWALAN = [
+    ("kas ", ASET_LANCAR),
+    ("piutang", ASET_LANCAR),
+    ("persediaan", ASET_LANCAR),
+    ("perlengkapan", ASET_LANCAR),
+    ("peralatan", ASET_TETAP),
+    ("kendaraan", ASET_TETAP),
+    ("bangunan", ASET_TETAP),
+    ("tanah", ASET_TETAP),
+    ("gedung", ASET_TETAP),
+    ("mesin", ASET_TETAP),
+]
+
+
+def klasifikasi(nama):
+    """Mengembalikan (tipe, saldo_normal) untuk sebuah nama akun."""
+    kecil = str(nama).strip().lower()
+    tipe = _AKUN_BAKU.get(kecil)
+    if tipe is None:
+        tipe = next((t for kata, t in _KATA_KUNCI if kata in kecil), None)
+    if tipe is None:
+        tipe = next((t for awalan, t in _AWALAN if kecil.startswith(awalan)), LAINNYA)
+
+    # Akumulasi penyusutan adalah akun kontra aset: saldo normalnya kredit
+    if tipe in _TIPE_SALDO_KREDIT or "akumulasi" in kecil:
+        return tipe, SALDO_NORMAL_KREDIT
+    return tipe, SALDO_NORMAL_DEBIT
+
+
+class DaftarKode:
+    """Daftar nilai unik dengan kode integer (urutan kemunculan)."""
+
+    def __init__(self, nilai=()):
+        self.nilai = []
+        self.kode = {}
+        for v in nilai:
+            self.kode_untuk(v)
+
+    def _baru(self, nilai):
+        """Dipanggil sekali untuk setiap nilai yang baru pertama kali muncul."""
+
+    def kode_untuk(self, nilai):
+        kode = self.kode.get(nilai)
+        if kode is None:
+            kode = len(self.nilai)
+            self.kode[nilai] = kode
+            self.nilai.append(nilai)
+            self._baru(nilai)
+        return kode
+
+    def kode_banyak(self, nilai):
+        """Versi vektor dari kode_untuk untuk satu kolom sekaligus."""
+        unik, invers = np.unique(np.asarray(nilai, dtype=object), return_inverse=True)
+        peta = np.array([self.kode_untuk(v) for v in unik], dtype=np.int32)
+        return peta[invers.reshape(-1)] if len(unik) else np.empty(0, np.int32)
+
+    def categorical(self, kode):
+        """Categorical dengan kategori terurut abjad, seperti groupby pada kolom teks."""
+        cat = pd.Categorical.from_codes(kode, categories=pd.Index(self.nilai, dtype=object))
+        return cat.reorder_categories(sorted(self.nilai))
+
+
+class BaganAkun(DaftarKode):
+    """Registri akun: nama -> ID, dengan tipe dan saldo normal yang dihitung sekali."""
+
+    def __init__(self, nilai=(), tipe=None):
+        self.tipe = []
+        self.saldo_normal = []
+        # Tipe yang sudah tersimpan (misalnya dari snapshot) tidak diklasifikasi ulang
+        self._tipe_tersimpan = dict(tipe or {})
+        super().__init__(nilai)
+
+    def _baru(self, nilai):
+        if nilai in self._tipe_tersimpan:
+            tipe, normal = self._tipe_tersimpan.pop(nilai)
+        else:
+            tipe, normal = klasifikasi(nilai)
+        self.tipe.append(tipe)
+        self.saldo_normal.append(normal)
+
+    def atur_tipe(self, nama, tipe, saldo_normal=None):
+        """Mengganti tipe akun secara manual (mis. akun dengan nama tidak baku)."""
+        kode = self.kode_untuk(nama)
+        self.tipe[kode] = tipe
+        self.saldo_normal[kode] = saldo_normal or (
+            SALDO_NORMAL_KREDIT if tipe in _TIPE_SALDO_KREDIT else SALDO_NORMAL_DEBIT
+        )
+
+    def info(self, nama):
+        """Data akun: id, nama, tipe, dan saldo_normal."""
+        kode = self.kode[nama]
+        return {"id": kode, "nama": nama, "tipe": self.tipe[kode], "saldo_normal": self.saldo_normal[kode]}
+
+    def ke_state(self):
+        """Bentuk sederhana untuk pickle: {nama: (tipe, saldo_normal)} sesuai urutan ID."""
+        return {nama: (self.tipe[i], self.saldo_normal[i]) for i, nama in enumerate(self.nilai)}
+
+    @classmethod
+    def dari_state(cls, state):
+        return cls(list(state), tipe=state)
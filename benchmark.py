@@ -0,0 +1,172 @@
+"""Benchmark jalur laporan dan ekspor Excel di atas jurnal sintetis.
+
+    python benchmark.py                                   # 1rb, 10rb, dan 100rb baris
+    python benchmark.py --baris 1000000 --kasus neraca_saldo buku_besar
+
+Setiap kasus dijalankan ``--ulang`` kali per ukuran jurnal. Waktu tercepat dan
+mediannya ditambahkan ke file hasil (JSON Lines) bersama versi kode (commit
+git), lalu dibandingkan dengan hasil terakhir dari versi lain pada ukuran dan
+kasus yang sama, jadi regresi antar versi langsung terlihat.
+
+Semua laporan di aplikasi berasal dari satu agregasi (``hitung_laporan``),
+jadi kasus laporan mengukur jalur lengkap yang dijalani halamannya: agregasi
+ditambah penyusunan tabel laporan itu.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from buku_jurnal import BukuJurnal
+from ekspor_excel import cache_ekspor, excel_laporan
+from jurnal_sintetis import buat_jurnal_sintetis
+from laporan import hitung_laporan
+
+UKURAN_BAWAAN = [1_000, 10_000, 100_000]
+FILE_HASIL = "hasil_benchmark.jsonl"
+
+# Kasus yang lebih lambat dari ini (relatif terhadap versi pembanding) ditandai regresi
+AMBANG_REGRESI = 0.20
+
+
+# --- Kasus ---
+def _buku_besar(jurnal):
+    # Seperti halaman Buku Stok, untuk setiap akun: mutasi urut tanggal dan saldo berjalannya
+    for akun in jurnal.daftar_akun():
+        df = jurnal.mutasi_akun(akun)
+        np.cumsum(df["Debit"].to_numpy() - df["Kredit"].to_numpy())
+
+
+def _simpan_excel(jurnal):
+    # Isi simpan_semua_ke_excel tanpa session_state Streamlit. Cache ekspor dikosongkan
+    # supaya yang diukur adalah pembuatan file, bukan pengambilan dari cache.
+    cache_ekspor.kosongkan()
+    return excel_laporan(jurnal)
+
+
+KASUS = {
+    "neraca_saldo": lambda jurnal: hitung_laporan(jurnal).neraca_saldo,
+    "buku_besar": _buku_besar,
+    "laba_rugi": lambda jurnal: hitung_laporan(jurnal).laba_bersih,
+    "perubahan_modal": lambda jurnal: hitung_laporan(jurnal).modal_akhir,
+    "posisi_keuangan": lambda jurnal: hitung_laporan(jurnal).total_aktiva,
+    "jurnal_penutup": lambda jurnal: hitung_laporan(jurnal).jurnal_penutup,
+    "nssp": lambda jurnal: hitung_laporan(jurnal).nssp,
+    "simpan_semua_ke_excel": _simpan_excel,
+}
+
+
+def ukur(fungsi, ulang):
+    """Daftar durasi (detik) ``ulang`` kali pemanggilan fungsi()."""
+    durasi = []
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        fungsi()
+        durasi.append(time.perf_counter() - mulai)
+    return durasi
+
+
+# --- Hasil ---
+def versi_kode():
+    """Commit git kode yang diukur (ditandai -dirty jika ada perubahan belum di-commit)."""
+    folder = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=folder,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        kotor = subprocess.run(["git", "diff", "--quiet", "HEAD"], cwd=folder).returncode != 0
+    except (OSError, subprocess.CalledProcessError):
+        return "tidak-diketahui"
+    return commit + ("-dirty" if kotor else "")
+
+
+def baca_hasil(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(baris) for baris in f if baris.strip()]
+
+
+def pembanding(riwayat, versi, baris, kasus):
+    """Hasil terakhir dari versi lain untuk ukuran dan kasus yang sama, atau None."""
+    for hasil in reversed(riwayat):
+        if hasil["versi"] != versi and hasil["baris"] == baris and hasil["kasus"] == kasus:
+            return hasil
+    return None
+
+
+def jalankan(daftar_ukuran, daftar_kasus, ulang, path_hasil, versi, seed=0):
+    riwayat = baca_hasil(path_hasil)
+    lingkungan = {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "mesin": platform.machine(),
+    }
+    hasil_baru = []
+
+    for baris in daftar_ukuran:
+        df = buat_jurnal_sintetis(baris, seed=seed)
+        print(f"\n=== {len(df):,} baris ===")
+
+        jurnal = None
+
+        def muat():
+            nonlocal jurnal
+            jurnal = BukuJurnal.dari_frame(df)
+
+        pengukuran = [("muat_jurnal", ukur(muat, ulang))]
+        pengukuran += [(nama, ukur(lambda: KASUS[nama](jurnal), ulang)) for nama in daftar_kasus]
+
+        for kasus, durasi in pengukuran:
+            hasil = {
+                "waktu": datetime.now().isoformat(timespec="seconds"),
+                "versi": versi,
+                "baris": len(df),
+                "kasus": kasus,
+                "ulang": ulang,
+                "detik_min": min(durasi),
+                "detik_median": statistics.median(durasi),
+                **lingkungan,
+            }
+            hasil_baru.append(hasil)
+
+            catatan = ""
+            lama = pembanding(riwayat, versi, hasil["baris"], kasus)
+            if lama is not None and lama["detik_min"] > 0:
+                rasio = hasil["detik_min"] / lama["detik_min"]
+                catatan = f"x{rasio:.2f} vs {lama['versi']}"
+                if rasio > 1 + AMBANG_REGRESI:
+                    catatan += "  <-- REGRESI"
+            print(f"{kasus:<24}{hasil['detik_min'] * 1000:>12.2f} ms{hasil['detik_median'] * 1000:>12.2f} ms  {catatan}")
+
+    with open(path_hasil, "a", encoding="utf-8") as f:
+        for hasil in hasil_baru:
+            f.write(json.dumps(hasil) + "\n")
+    print(f"\n{len(hasil_baru)} hasil ditambahkan ke {path_hasil} (versi {versi})")
+    return hasil_baru
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark laporan dan ekspor Excel di atas jurnal sintetis.")
+    parser.add_argument("--baris", type=int, nargs="+", default=UKURAN_BAWAAN,
+                        help="Ukuran jurnal yang diukur (jumlah baris), misalnya 1000 1000000.")
+    parser.add_argument("--kasus", nargs="+", choices=list(KASUS), default=list(KASUS),
+                        help="Kasus yang diukur (bawaan: semua). Ekspor Excel 1 juta baris butuh beberapa menit.")
+    parser.add_argument("--ulang", type=int, default=3, help="Pengulangan per kasus (bawaan: 3).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed jurnal sintetis.")
+    parser.add_argument("--hasil", default=FILE_HASIL, help=f"File hasil JSON Lines (bawaan: {FILE_HASIL}).")
+    parser.add_argument("--versi", default=None, help="Label versi (bawaan: commit git).")
+    args = parser.parse_args(argv)
+
+    jalankan(args.baris, args.kasus, max(args.ulang, 1), args.hasil, args.versi or versi_kode(), args.seed)
+
+
+if __name__ == "__main__":
+    main()
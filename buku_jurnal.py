@@ -0,0 +1,767 @@
+"""Penyimpanan jurnal umum dalam bentuk kolom bertipe.
+
+``BukuJurnal`` menggantikan list of dict di ``st.session_state.jurnal``.
+Setiap kolom disimpan sebagai array numpy yang kapasitasnya digandakan saat
+penuh (append amortized O(1)). Akun dan Ref disimpan sebagai kode integer
+ke daftar kategori, Tanggal sebagai datetime64, Debit/Kredit sebagai int64
+dalam sen (lihat ``uang``), jadi semua total dan saldo eksak. Semua nominal
+yang masuk ke dan keluar dari jurnal ini dalam sen.
+Kode Akun adalah ID dari ``BaganAkun``, sehingga tipe dan saldo normal akun
+sudah diketahui tanpa membaca namanya lagi.
+``frame()`` memberikan DataFrame yang memakai array tersebut langsung
+(tanpa salinan) dan di-cache sampai isi jurnal berubah.
+Setiap baris punya ID tetap (naik sesuai urutan pencatatan) sehingga hasil
+edit bisa diterapkan per baris lewat ``terapkan_perubahan``.
+Kueri rentang tanggal (per jurnal atau per akun) memakai ``IndeksTanggal``.
+Total Debit/Kredit per (akun, ref) dipelihara ``SaldoBerjalan`` setiap kali
+baris ditambah, diubah, atau dihapus, jadi neraca saldo cukup O(jumlah akun).
+Jurnal dari snapshot kolumnar (``dari_state`` dengan kolom tunda) baru
+membaca kolom teks seperti Keterangan saat pertama dipakai (``KolomJurnal``).
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from bagan_akun import BaganAkun, DaftarKode
+from uang import ke_sen_array
+
+KOLOM_JURNAL = ["Tanggal", "Keterangan", "Akun", "Ref", "Debit", "Kredit"]
+
+_DTYPE_TANGGAL = "datetime64[s]"
+_KAPASITAS_AWAL = 64
+
+# Batas jumlah pasangan (akun, ref) untuk agregasi bincount langsung
+_BATAS_BINCOUNT = 1 << 22
+
+# Perubahan sampai sebanyak ini baris dijumlahkan ke SaldoBerjalan satu per satu (tanpa agregasi numpy)
+_BATAS_SALDO_PER_BARIS = 64
+
+# Baris baru boleh menunggu di luar indeks tanggal sampai sebanyak ini
+# (atau 1/8 jumlah baris terindeks) sebelum indeks dibangun ulang
+_EKOR_INDEKS_MIN = 1024
+
+
+def _ke_tanggal(nilai):
+    """Mengubah string/date/Timestamp menjadi datetime64 harian."""
+    ts = pd.Timestamp(nilai)
+    if pd.isna(ts):
+        return np.datetime64("NaT", "s")
+    return np.datetime64(ts.normalize().to_datetime64(), "s")
+
+
+def _ke_sen(nilai):
+    """Nominal (sudah dalam sen) sebagai int; kosong atau bukan angka menjadi 0."""
+    if isinstance(nilai, (int, np.integer)):
+        return int(nilai)
+    try:
+        angka = float(nilai)
+    except (TypeError, ValueError):
+        return 0
+    return 0 if np.isnan(angka) else int(round(angka))
+
+
+def _ke_teks(nilai):
+    if nilai is None or (isinstance(nilai, float) and np.isnan(nilai)):
+        return ""
+    return str(nilai)
+
+
+def sidik_frame(df):
+    """Sidik isi jurnal (hex): sama jika dan hanya jika isi dan urutan barisnya sama."""
+    # Resolusi tanggal disamakan supaya jurnal yang sama dari backend lain bersidik sama
+    df = df[KOLOM_JURNAL].astype({"Tanggal": _DTYPE_TANGGAL, "Debit": np.int64, "Kredit": np.int64})
+    per_baris = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return hashlib.blake2b(per_baris.tobytes(), digest_size=16).hexdigest()
+
+
+def _kunci_tanggal(tanggal):
+    """Tanggal sebagai int untuk pengurutan; NaT paling akhir seperti np.sort."""
+    return np.iinfo(np.int64).max if np.isnat(tanggal) else int(tanggal.astype(np.int64))
+
+
+def _lebih_awal(a, b):
+    return (_kunci_tanggal(a[0]), a[1]) < (_kunci_tanggal(b[0]), b[1])
+
+
+def _rentang(tanggal_urut, mulai, akhir, lo=0, hi=None):
+    """Batas [a, b) pada array tanggal terurut untuk mulai <= Tanggal <= akhir."""
+    hi = len(tanggal_urut) if hi is None else hi
+    a = lo if mulai is None else np.searchsorted(tanggal_urut[lo:hi], _ke_tanggal(mulai), "left") + lo
+    if akhir is not None:
+        b = np.searchsorted(tanggal_urut[lo:hi], _ke_tanggal(akhir), "right") + lo
+    elif mulai is not None:
+        # Tanggal kosong (NaT, di akhir urutan) tidak termasuk rentang "sejak mulai"
+        b = np.searchsorted(tanggal_urut[lo:hi], np.datetime64("NaT", "s"), "left") + lo
+    else:
+        b = hi
+    return a, max(a, b)
+
+
+def _cocok_tanggal(tanggal, mulai, akhir):
+    cocok = np.ones(len(tanggal), dtype=bool)
+    if mulai is not None:
+        cocok &= tanggal >= _ke_tanggal(mulai)
+    if akhir is not None:
+        cocok &= tanggal <= _ke_tanggal(akhir)
+    return cocok
+
+
+def _agregat(akun, ref, debit, kredit, jumlah_akun, jumlah_ref):
+    """(ID akun, ID ref, jumlah baris, total Debit, total Kredit) untuk setiap pasangan (akun, ref) yang ada."""
+    jumlah_ref = max(jumlah_ref, 1)
+    kunci = akun.astype(np.int64) * jumlah_ref + ref
+    ruang = jumlah_akun * jumlah_ref
+    # Bobot bincount selalu float64; penjumlahan sen dilakukan dengan np.add.at ke int64 supaya tetap eksak
+    if ruang <= _BATAS_BINCOUNT:
+        banyak = np.bincount(kunci, minlength=ruang)
+        kunci_ada = np.flatnonzero(banyak)
+        invers = np.cumsum(banyak > 0)[kunci] - 1
+        banyak = banyak[kunci_ada]
+    else:
+        kunci_ada, invers, banyak = np.unique(kunci, return_inverse=True, return_counts=True)
+    total_debit = np.zeros(len(kunci_ada), dtype=np.int64)
+    total_kredit = np.zeros(len(kunci_ada), dtype=np.int64)
+    np.add.at(total_debit, invers, debit)
+    np.add.at(total_kredit, invers, kredit)
+    id_akun, id_ref = np.divmod(kunci_ada, jumlah_ref)
+    return id_akun, id_ref, banyak, total_debit, total_kredit
+
+
+def _nilai_sel(kolom, nilai):
+    """Nilai satu sel hasil edit dalam bentuk simpanan kolom (Akun/Ref masih teks)."""
+    if kolom == "Tanggal":
+        return _ke_tanggal(nilai)
+    if kolom in ("Debit", "Kredit"):
+        return _ke_sen(nilai)
+    return _ke_teks(nilai)
+
+
+class IndeksTanggal:
+    """Posisi baris urut Tanggal dan urut (Akun, Tanggal) untuk n baris pertama jurnal.
+
+    Urutan stabil: baris bertanggal sama tetap urut pencatatan, tanggal kosong
+    (NaT) di akhir. Rentang dicari dengan searchsorted, jadi "akun X antara D1
+    dan D2" cukup O(log n + k). ``kumulatif_akun`` (Debit - Kredit berjalan
+    per akun) membuat saldo akun sebelum suatu tanggal O(log n).
+    """
+
+    def __init__(self, tanggal, akun, neto, jumlah_akun):
+        self.n = len(tanggal)
+        urut = np.argsort(tanggal, kind="stable")
+        self.urut = urut
+        self.tanggal_urut = tanggal[urut]
+
+        urut_akun = urut[np.argsort(akun[urut], kind="stable")]
+        self.urut_akun = urut_akun
+        self.tanggal_urut_akun = tanggal[urut_akun]
+        self.batas_akun = np.searchsorted(akun[urut_akun], np.arange(jumlah_akun + 1))
+        self.kumulatif_akun = np.concatenate(([0], np.cumsum(neto[urut_akun]))).astype(np.int64)
+        self._letak_akun = None
+
+    def geser_neto(self, posisi, selisih):
+        """Memperbarui kumulatif_akun setelah Debit - Kredit beberapa baris berubah sebesar ``selisih``.
+
+        Hanya baris terindeks (posisi < n) yang dihitung; baris ekor dibaca langsung dari kolom.
+        """
+        terindeks = posisi < self.n
+        if not terindeks.any():
+            return
+        if self._letak_akun is None:
+            self._letak_akun = np.empty(self.n, dtype=np.int64)
+            self._letak_akun[self.urut_akun] = np.arange(self.n)
+        tambah = np.zeros(self.n + 1, dtype=np.int64)
+        np.add.at(tambah, self._letak_akun[posisi[terindeks]] + 1, selisih[terindeks])
+        self.kumulatif_akun += np.cumsum(tambah)
+
+    def irisan_akun(self, kode):
+        """Batas [lo, hi) baris akun ``kode`` di urut_akun (kosong untuk akun yang lebih baru)."""
+        if kode + 1 >= len(self.batas_akun):
+            return 0, 0
+        return self.batas_akun[kode], self.batas_akun[kode + 1]
+
+
+class SaldoBerjalan:
+    """Jumlah baris, total Debit, dan total Kredit per (kode akun, kode ref) seluruh jurnal.
+
+    Diperbarui setiap baris ditambah, diubah, atau dihapus, jadi neraca saldo
+    tanpa rentang tanggal tidak perlu menjumlah ulang seluruh baris. Untuk
+    periode berjalan ("sejak tanggal X") total baris di luar rentang itu
+    (bertanggal sebelum X atau kosong) di-cache per X, dan hanya dibuang jika
+    ada baris bertanggal sebelum X (atau kosong) yang berubah.
+    """
+
+    def __init__(self):
+        self.total = {}
+        self.luar = {}
+
+    @staticmethod
+    def _tambah_ke(total, kunci, banyak, debit, kredit):
+        isi = total.get(kunci)
+        if isi is None:
+            total[kunci] = [banyak, debit, kredit]
+            return
+        isi[0] += banyak
+        isi[1] += debit
+        isi[2] += kredit
+        if isi[0] == 0:
+            del total[kunci]
+
+    def tambah(self, akun, ref, debit, kredit, tanda=1, total=None):
+        """Menambahkan (tanda=1) atau mengurangkan (tanda=-1) baris-baris ke total."""
+        total = self.total if total is None else total
+        if len(akun) <= _BATAS_SALDO_PER_BARIS:
+            for a, r, d, k in zip(akun.tolist(), ref.tolist(), debit.tolist(), kredit.tolist()):
+                self._tambah_ke(total, (a, r), tanda, d * tanda, k * tanda)
+            return
+        agregat = _agregat(akun, ref, debit, kredit, int(akun.max()) + 1, int(ref.max()) + 1)
+        for a, r, b, d, k in zip(*(arr.tolist() for arr in agregat)):
+            self._tambah_ke(total, (a, r), b * tanda, d * tanda, k * tanda)
+
+    def buang_luar(self, tanggal):
+        """Membuang cache 'luar rentang sejak X' yang ikut berubah karena baris bertanggal ``tanggal`` berubah."""
+        if not self.luar or not len(tanggal):
+            return
+        if np.isnat(tanggal).any():
+            self.luar = {}
+            return
+        # Baris bertanggal t termasuk luar rentang "sejak X" jika t < X
+        paling_awal = tanggal.min()
+        self.luar = {x: total for x, total in self.luar.items() if x <= paling_awal}
+
+    def larik(self, kurangi=None):
+        """Isi total (dikurangi ``kurangi`` jika ada) sebagai array (ID akun, ID ref, Debit, Kredit)."""
+        total = self.total
+        if kurangi:
+            total = {kunci: list(isi) for kunci, isi in total.items()}
+            for kunci, (banyak, debit, kredit) in kurangi.items():
+                self._tambah_ke(total, kunci, -banyak, -debit, -kredit)
+        kunci = np.array(list(total), dtype=np.int64).reshape(-1, 2)
+        isi = np.array(list(total.values()), dtype=np.int64).reshape(-1, 3)
+        return kunci[:, 0], kunci[:, 1], isi[:, 1], isi[:, 2]
+
+
+class KolomJurnal(dict):
+    """Kolom BukuJurnal (nama -> array); kolom di ``tunda`` baru dimuat saat pertama diakses.
+
+    ``tunda`` berisi {nama: fungsi tanpa argumen yang mengembalikan array
+    kolom itu}. Laporan hanya memakai kolom numerik, jadi misalnya Keterangan
+    dari snapshot tidak pernah diubah menjadi objek Python kecuali ada halaman
+    yang menampilkannya atau jurnal diubah.
+    """
+
+    def __init__(self, kolom, tunda=None):
+        super().__init__(kolom)
+        self.tunda = dict(tunda or {})
+
+    def __missing__(self, nama):
+        muat = self.tunda.pop(nama, None)
+        if muat is None:
+            raise KeyError(nama)
+        arr = self[nama] = muat()
+        return arr
+
+    def __contains__(self, nama):
+        return super().__contains__(nama) or nama in self.tunda
+
+    def lengkap(self):
+        """Memuat semua kolom tunda (dipakai sebelum semua kolom dibaca sekaligus)."""
+        for nama in list(self.tunda):
+            self[nama]
+        return self
+
+    def items(self):
+        return super(KolomJurnal, self.lengkap()).items()
+
+    def values(self):
+        return super(KolomJurnal, self.lengkap()).values()
+
+
+class BukuJurnal:
+    """Jurnal umum kolumnar dengan append amortized O(1)."""
+
+    def __init__(self, baris=None):
+        self._versi = 0
+        self._id_berikut = 0
+        self._kosongkan_kolom()
+        if baris is not None:
+            self.extend(baris)
+
+    def _kosongkan_kolom(self):
+        self._n = 0
+        self._kol = None
+        self._akun = BaganAkun()
+        self._ref = DaftarKode()
+        self._alokasi(_KAPASITAS_AWAL)
+        self._cache_frame = None
+        self._cache_sidik = (None, None)
+        self._cache_indeks = None
+        self._saldo = None
+
+    # --- Kapasitas ---
+    def _alokasi(self, kapasitas):
+        lama = self._kol
+        baru = {
+            "Tanggal": np.empty(kapasitas, dtype=_DTYPE_TANGGAL),
+            "Keterangan": np.empty(kapasitas, dtype=object),
+            "Akun": np.empty(kapasitas, dtype=np.int32),
+            "Ref": np.empty(kapasitas, dtype=np.int32),
+            "Debit": np.empty(kapasitas, dtype=np.int64),
+            "Kredit": np.empty(kapasitas, dtype=np.int64),
+            "ID": np.empty(kapasitas, dtype=np.int64),
+        }
+        if lama is not None:
+            for nama, arr in baru.items():
+                arr[:self._n] = lama[nama][:self._n]
+        self._kol = baru
+        self._kapasitas = kapasitas
+        self._kolom_dibagi = set()
+
+    def _pastikan_kapasitas(self, tambahan):
+        perlu = self._n + tambahan
+        if perlu > self._kapasitas:
+            self._alokasi(max(perlu, self._kapasitas * 2))
+
+    def _berubah(self):
+        self._versi += 1
+        self._cache_frame = None
+
+    def _catat_saldo(self, posisi, tanda=1):
+        """Menambahkan/mengurangkan baris ``posisi`` ke SaldoBerjalan (jika sudah dibangun)."""
+        saldo = self._saldo
+        if saldo is None:
+            return
+        kol = self._kol
+        saldo.tambah(kol["Akun"][posisi], kol["Ref"][posisi], kol["Debit"][posisi], kol["Kredit"][posisi], tanda)
+        saldo.buang_luar(kol["Tanggal"][posisi])
+
+    def _saldo_berjalan(self):
+        """SaldoBerjalan terkini; dibangun sekali dari seluruh baris saat pertama kali dibutuhkan."""
+        if self._saldo is None:
+            self._saldo = SaldoBerjalan()
+            self._catat_saldo(slice(0, self._n))
+        return self._saldo
+
+    # --- Penambahan data ---
+    def append(self, baris):
+        """Menambahkan satu baris jurnal (dict dengan kolom KOLOM_JURNAL)."""
+        self._pastikan_kapasitas(1)
+        i = self._n
+        kol = self._kol
+        kol["Tanggal"][i] = _ke_tanggal(baris.get("Tanggal"))
+        kol["Keterangan"][i] = _ke_teks(baris.get("Keterangan"))
+        kol["Akun"][i] = self._akun.kode_untuk(_ke_teks(baris.get("Akun")))
+        kol["Ref"][i] = self._ref.kode_untuk(_ke_teks(baris.get("Ref")))
+        kol["Debit"][i] = _ke_sen(baris.get("Debit"))
+        kol["Kredit"][i] = _ke_sen(baris.get("Kredit"))
+        kol["ID"][i] = self._id_berikut
+        self._id_berikut += 1
+        self._n += 1
+        self._catat_saldo(slice(i, i + 1))
+        self._berubah()
+
+    def extend(self, daftar_baris):
+        """Menambahkan banyak baris (iterable of dict atau DataFrame)."""
+        if isinstance(daftar_baris, pd.DataFrame):
+            self._tambah_frame(daftar_baris)
+        else:
+            for baris in daftar_baris:
+                self.append(baris)
+
+    def _kolom_frame(self, df):
+        """Kolom DataFrame sebagai array siap simpan (Akun/Ref sudah menjadi kode)."""
+        m = len(df)
+
+        def teks(nama):
+            if nama not in df:
+                return np.full(m, "", dtype=object)
+            return df[nama].astype(object).where(df[nama].notna(), "").astype(str).to_numpy(dtype=object)
+
+        def sen(nama):
+            if nama not in df:
+                return np.zeros(m, dtype=np.int64)
+            if df[nama].dtype == np.int64:
+                return df[nama].to_numpy()
+            return np.rint(pd.to_numeric(df[nama], errors="coerce").fillna(0).to_numpy(dtype=np.float64)).astype(np.int64)
+
+        tanggal = pd.to_datetime(df["Tanggal"], errors="coerce").dt.normalize()
+        return {
+            "Tanggal": tanggal.to_numpy(dtype=_DTYPE_TANGGAL),
+            "Keterangan": teks("Keterangan"),
+            "Akun": self._akun.kode_banyak(teks("Akun")),
+            "Ref": self._ref.kode_banyak(teks("Ref")),
+            "Debit": sen("Debit"),
+            "Kredit": sen("Kredit"),
+        }
+
+    def _tambah_frame(self, df):
+        m = len(df)
+        if m == 0:
+            return
+        self._pastikan_kapasitas(m)
+        a, b = self._n, self._n + m
+        for nama, arr in self._kolom_frame(df).items():
+            self._kol[nama][a:b] = arr
+        self._kol["ID"][a:b] = np.arange(self._id_berikut, self._id_berikut + m)
+        self._id_berikut += m
+        self._n = b
+        self._catat_saldo(slice(a, b))
+        self._berubah()
+
+    def kosongkan(self):
+        """Menghapus semua baris; versi tetap naik supaya cache lama tidak terpakai."""
+        self._kosongkan_kolom()
+        self._berubah()
+
+    def ganti_isi(self, df):
+        """Mengganti seluruh isi jurnal (dipakai saat menyimpan hasil editor)."""
+        self._kosongkan_kolom()
+        self.extend(df)
+        self._berubah()
+
+    def posisi_id(self, id_baris):
+        """Posisi baris untuk setiap ID yang masih ada (kolom ID selalu naik: cukup searchsorted)."""
+        id_baris = np.asarray(id_baris, dtype=np.int64)
+        semua = self._kol["ID"][:self._n]
+        posisi = np.searchsorted(semua, id_baris)
+        ada = posisi < self._n
+        ada[ada] = semua[posisi[ada]] == id_baris[ada]
+        return id_baris[ada], posisi[ada]
+
+    def ada_baris_sebelum(self, id_baris, tanggal):
+        """True jika ada baris dengan ID di ``id_baris`` yang bertanggal sebelum ``tanggal``."""
+        _, posisi = self.posisi_id(list(id_baris))
+        return bool((self._kol["Tanggal"][posisi] < _ke_tanggal(tanggal)).any())
+
+    def terapkan_perubahan(self, ubah=None, tambah=None, hapus=None):
+        """Menerapkan hasil edit per baris; mengembalikan ID baris yang ditambahkan.
+
+        ``ubah`` adalah {ID: {kolom: nilai baru}}, ``tambah`` daftar baris (dict)
+        baru, ``hapus`` daftar ID. Baris lain tidak disentuh. ID yang sudah tidak
+        ada diabaikan, jadi memutar ulang perubahan yang sama tetap aman.
+        """
+        ubah = ubah or {}
+        if ubah:
+            id_ubah, posisi = self.posisi_id(list(ubah))
+            kolom_ubah = {k for i in id_ubah for k in ubah[int(i)] if k in KOLOM_JURNAL}
+
+            ubah_saldo = bool(kolom_ubah & {"Tanggal", "Akun", "Ref", "Debit", "Kredit"})
+            if ubah_saldo:
+                self._catat_saldo(posisi, -1)
+
+            # Kolom yang masih dipakai bersama frame() disalin dulu: frame lama (misalnya
+            # milik ekspor di latar belakang) tetap memegang isi sebelum diedit.
+            # Kolom lain ditulis langsung, jadi biaya edit sebanding baris yang diedit.
+            neto_lama = self._kol["Debit"][posisi] - self._kol["Kredit"][posisi]
+            for nama in kolom_ubah & self._kolom_dibagi:
+                self._kol[nama] = self._kol[nama].copy()
+            self._kolom_dibagi -= kolom_ubah
+            for i, pos in zip(id_ubah, posisi):
+                for kolom, nilai in ubah[int(i)].items():
+                    if kolom not in KOLOM_JURNAL:
+                        continue
+                    nilai = _nilai_sel(kolom, nilai)
+                    if kolom == "Akun":
+                        nilai = self._akun.kode_untuk(nilai)
+                    elif kolom == "Ref":
+                        nilai = self._ref.kode_untuk(nilai)
+                    self._kol[kolom][pos] = nilai
+            if ubah_saldo:
+                self._catat_saldo(posisi)
+
+            # Indeks tanggal: cukup geser saldo kumulatif jika hanya nominal yang berubah
+            ind = self._cache_indeks
+            if kolom_ubah & {"Tanggal", "Akun"}:
+                self._cache_indeks = None
+            elif ind is not None and kolom_ubah & {"Debit", "Kredit"}:
+                neto_baru = self._kol["Debit"][posisi] - self._kol["Kredit"][posisi]
+                ind.geser_neto(posisi, neto_baru - neto_lama)
+            self._berubah()
+
+        if hapus:
+            _, posisi = self.posisi_id(hapus)
+            if len(posisi):
+                self._catat_saldo(posisi, -1)
+                n = self._n
+                simpan = np.ones(n, dtype=bool)
+                simpan[posisi] = False
+                self._kol = {nama: arr[:n][simpan] for nama, arr in self._kol.items()}
+                self._kolom_dibagi = set()
+                self._n = self._kapasitas = int(simpan.sum())
+                self._cache_indeks = None
+                self._berubah()
+
+        id_awal = self._id_berikut
+        if tambah:
+            self.extend(tambah)
+        return list(range(id_awal, self._id_berikut))
+
+    @classmethod
+    def dari_frame(cls, df):
+        """Membuat BukuJurnal baru dari DataFrame (misalnya hasil st.data_editor)."""
+        jurnal = cls()
+        jurnal.extend(df)
+        return jurnal
+
+    # --- Pembacaan ---
+    def __len__(self):
+        return self._n
+
+    @property
+    def versi(self):
+        """Naik setiap kali isi jurnal berubah; cocok sebagai kunci cache."""
+        return self._versi
+
+    def _view(self, nama):
+        v = self._kol[nama][:self._n]
+        v.flags.writeable = False
+        return v
+
+    def frame(self):
+        """DataFrame jurnal. Kolom numerik dan tanggal memakai array internal tanpa salinan."""
+        if self._cache_frame is None:
+            # Sampai kolom ini disalin oleh edit berikutnya, frame ini ikut memegangnya
+            self._kolom_dibagi = set(KOLOM_JURNAL)
+            self._cache_frame = pd.DataFrame({
+                "Tanggal": self._view("Tanggal"),
+                "Keterangan": self._view("Keterangan"),
+                "Akun": self._akun.categorical(self._view("Akun")),
+                "Ref": self._ref.categorical(self._view("Ref")),
+                "Debit": self._view("Debit"),
+                "Kredit": self._view("Kredit"),
+            }, columns=KOLOM_JURNAL, copy=False)
+        return self._cache_frame
+
+    def sidik(self):
+        """Sidik isi jurnal untuk kunci cache lintas sesi (dihitung ulang hanya jika versi berubah)."""
+        if self._cache_sidik[0] != self._versi:
+            self._cache_sidik = (self._versi, sidik_frame(self.frame()))
+        return self._cache_sidik[1]
+
+    def total_mutasi(self):
+        """(total Debit, total Kredit) seluruh jurnal, dalam sen (dari SaldoBerjalan: O(jumlah akun))."""
+        total = self._saldo_berjalan().total.values()
+        return sum(isi[1] for isi in total), sum(isi[2] for isi in total)
+
+    def halaman(self, awal, ukuran, cari="", akun=None, mulai=None, akhir=None, urut=None, menurun=False):
+        """Satu halaman jurnal setelah disaring dan diurutkan: (DataFrame, jumlah baris cocok).
+
+        Indeks DataFrame adalah ID baris (dipakai lagi oleh ``terapkan_perubahan``).
+        ``cari`` dicocokkan ke Keterangan, Akun, dan Ref (tanpa beda huruf besar/kecil),
+        ``akun`` membatasi ke daftar nama akun, ``urut`` salah satu KOLOM_JURNAL
+        (None berarti urutan pencatatan).
+        """
+        kol = self._kol
+        if mulai is not None or akhir is not None:
+            posisi = self.posisi_rentang(mulai, akhir)
+            if urut != "Tanggal":
+                posisi = np.sort(posisi)
+        elif urut == "Tanggal":
+            posisi = self.posisi_rentang()
+        else:
+            posisi = np.arange(self._n)
+
+        if akun:
+            kode = [self._akun.kode[a] for a in akun if a in self._akun.kode]
+            posisi = posisi[np.isin(kol["Akun"][posisi], kode)]
+        if cari:
+            cari = cari.lower()
+            cocok = pd.Series(kol["Keterangan"][posisi], dtype=object).str.lower().str.contains(cari, regex=False)
+            cocok = np.array(cocok.fillna(False), dtype=bool)
+            for nama, daftar in (("Akun", self._akun), ("Ref", self._ref)):
+                kode = [k for k, v in enumerate(daftar.nilai) if cari in v.lower()]
+                if kode:
+                    cocok |= np.isin(kol[nama][posisi], kode)
+            posisi = posisi[cocok]
+
+        # Urut Tanggal menaik sudah diberikan indeks tanggal; sisanya diurutkan di sini
+        if urut is not None and (urut != "Tanggal" or menurun):
+            nilai = pd.Series(self.frame()[urut].to_numpy()[posisi])
+            if urut in ("Akun", "Ref"):
+                nilai = nilai.astype(object)
+            posisi = posisi[nilai.sort_values(ascending=not menurun, kind="stable").index.to_numpy()]
+        elif menurun:
+            posisi = posisi[::-1]
+
+        pilih = posisi[awal:awal + ukuran]
+        hasil = self.frame().iloc[pilih].set_axis(pd.Index(self._kol["ID"][pilih], name="ID"))
+        return hasil, len(posisi)
+
+    # --- Indeks tanggal ---
+    def _indeks(self):
+        """IndeksTanggal terkini; baris yang lebih baru dari indeks menjadi 'ekor'."""
+        ind = self._cache_indeks
+        if ind is None or self._n - ind.n > max(_EKOR_INDEKS_MIN, ind.n // 8):
+            n = self._n
+            kol = self._kol
+            ind = IndeksTanggal(kol["Tanggal"][:n], kol["Akun"][:n], kol["Debit"][:n] - kol["Kredit"][:n],
+                                len(self._akun.nilai))
+            self._cache_indeks = ind
+        return ind
+
+    def _ekor(self, ind, mulai=None, akhir=None, kode_akun=None):
+        """Posisi baris ekor (belum terindeks) yang cocok dengan rentang dan akun."""
+        tanggal = self._kol["Tanggal"][ind.n:self._n]
+        cocok = _cocok_tanggal(tanggal, mulai, akhir)
+        if kode_akun is not None:
+            cocok &= self._kol["Akun"][ind.n:self._n] == kode_akun
+        return np.flatnonzero(cocok) + ind.n
+
+    def _gabung_urut(self, posisi, ekor):
+        if not len(ekor):
+            return posisi
+        posisi = np.concatenate([posisi, ekor])
+        return posisi[np.argsort(self._kol["Tanggal"][posisi], kind="stable")]
+
+    def posisi_rentang(self, mulai=None, akhir=None):
+        """Posisi baris dengan mulai <= Tanggal <= akhir (inklusif), urut tanggal."""
+        ind = self._indeks()
+        a, b = _rentang(ind.tanggal_urut, mulai, akhir)
+        return self._gabung_urut(ind.urut[a:b], self._ekor(ind, mulai, akhir))
+
+    def posisi_akun(self, akun, mulai=None, akhir=None):
+        """Posisi baris satu akun dalam rentang tanggal, urut tanggal: O(log n + k)."""
+        kode = self._akun.kode.get(akun)
+        if kode is None:
+            return np.empty(0, dtype=np.int64)
+        ind = self._indeks()
+        lo, hi = ind.irisan_akun(kode)
+        a, b = _rentang(ind.tanggal_urut_akun, mulai, akhir, lo, hi)
+        return self._gabung_urut(ind.urut_akun[a:b], self._ekor(ind, mulai, akhir, kode))
+
+    def batas_tanggal(self):
+        """(tanggal pertama, tanggal terakhir) yang terisi, atau (None, None)."""
+        ind = self._indeks()
+        tanggal = np.concatenate([ind.tanggal_urut, self._kol["Tanggal"][ind.n:self._n]])
+        tanggal = tanggal[~np.isnat(tanggal)]
+        if not len(tanggal):
+            return None, None
+        return pd.Timestamp(tanggal.min()), pd.Timestamp(tanggal.max())
+
+    def saldo_akun_sebelum(self, akun, tanggal):
+        """Debit - Kredit akun dari semua baris bertanggal sebelum ``tanggal``: O(log n)."""
+        kode = self._akun.kode.get(akun)
+        if kode is None:
+            return 0
+        ind = self._indeks()
+        lo, hi = ind.irisan_akun(kode)
+        b = np.searchsorted(ind.tanggal_urut_akun[lo:hi], _ke_tanggal(tanggal), "left") + lo
+        saldo = ind.kumulatif_akun[b] - ind.kumulatif_akun[lo]
+        ekor = self._ekor(ind, akhir=_ke_tanggal(tanggal) - np.timedelta64(1, "s"), kode_akun=kode)
+        return int(saldo + self._kol["Debit"][ekor].sum() - self._kol["Kredit"][ekor].sum())
+
+    def daftar_akun(self):
+        """Nama akun urut kemunculan pertama berdasarkan tanggal (dari indeks per akun)."""
+        ind = self._indeks()
+        pertama = {}
+        for kode in range(len(ind.batas_akun) - 1):
+            lo, hi = ind.irisan_akun(kode)
+            if lo < hi:
+                pertama[kode] = (ind.tanggal_urut_akun[lo], ind.urut_akun[lo])
+        for pos in range(ind.n, self._n):
+            kode = int(self._kol["Akun"][pos])
+            kandidat = (self._kol["Tanggal"][pos], pos)
+            if kode not in pertama or _lebih_awal(kandidat, pertama[kode]):
+                pertama[kode] = kandidat
+
+        urutan = sorted(pertama, key=lambda k: (_kunci_tanggal(pertama[k][0]), pertama[k][1]))
+        return [self._akun.nilai[k] for k in urutan]
+
+    def info_akun(self, akun):
+        """ID, tipe, dan saldo normal akun dari bagan akun."""
+        return self._akun.info(akun)
+
+    def saldo_per_akun(self, mulai=None, akhir=None):
+        """Total Debit dan Kredit per (ID akun, Ref), beserta tipe akunnya.
+
+        ``mulai``/``akhir`` (inklusif) membatasi transaksi yang dijumlahkan. Tanpa
+        ``akhir`` (seluruh jurnal, atau periode berjalan sejak ``mulai``) total
+        dibaca dari SaldoBerjalan; rentang lain dijumlahkan dari indeks tanggal.
+        """
+        if akhir is None:
+            saldo = self._saldo_berjalan()
+            luar = None
+            if mulai is not None:
+                batas = _ke_tanggal(mulai)
+                if batas not in saldo.luar:
+                    saldo.luar[batas] = self._total_luar(mulai)
+                luar = saldo.luar[batas]
+            return self._frame_saldo(*saldo.larik(luar))
+
+        pilih = self.posisi_rentang(mulai, akhir)
+        id_akun, id_ref, _, debit, kredit = _agregat(
+            self._kol["Akun"][pilih], self._kol["Ref"][pilih], self._kol["Debit"][pilih], self._kol["Kredit"][pilih],
+            len(self._akun.nilai), len(self._ref.nilai),
+        )
+        return self._frame_saldo(id_akun, id_ref, debit, kredit)
+
+    def _total_luar(self, mulai):
+        """Total per (akun, ref) baris di luar rentang 'sejak mulai' (bertanggal sebelum mulai atau kosong)."""
+        luar = np.ones(self._n, dtype=bool)
+        luar[self.posisi_rentang(mulai)] = False
+        kol = {nama: self._kol[nama][:self._n][luar] for nama in ("Akun", "Ref", "Debit", "Kredit")}
+        total = {}
+        self._saldo.tambah(kol["Akun"], kol["Ref"], kol["Debit"], kol["Kredit"], total=total)
+        return total
+
+    def _frame_saldo(self, id_akun, id_ref, debit, kredit):
+        bagan = self._akun
+        return pd.DataFrame({
+            "ID": id_akun,
+            "Akun": np.asarray(bagan.nilai, dtype=object)[id_akun],
+            "Ref": np.asarray(self._ref.nilai, dtype=object)[id_ref],
+            "Debit": debit,
+            "Kredit": kredit,
+            "Tipe": np.asarray(bagan.tipe, dtype=object)[id_akun],
+            "Normal": np.asarray(bagan.saldo_normal, dtype=object)[id_akun],
+        }).sort_values(by=["Akun", "Ref"], ignore_index=True)
+
+    def mutasi_akun(self, akun, mulai=None, akhir=None):
+        """Baris jurnal satu akun dalam rentang tanggal, urut tanggal (untuk buku besar)."""
+        return self.frame().iloc[self.posisi_akun(akun, mulai, akhir)]
+
+    def baris_akun(self, daftar_akun, mulai=None, akhir=None):
+        """Baris jurnal untuk beberapa akun sekaligus, urut sesuai pencatatan."""
+        posisi = [self.posisi_akun(akun, mulai, akhir) for akun in daftar_akun]
+        posisi = np.sort(np.concatenate(posisi)) if posisi else np.empty(0, dtype=np.int64)
+        return self.frame().iloc[posisi]
+
+    # --- Pickle: simpan hanya bagian yang terisi ---
+    @classmethod
+    def dari_state(cls, state, tunda=None):
+        """BukuJurnal dari bentuk ``__getstate__``; kolom di ``tunda`` dimuat saat pertama dipakai (lihat KolomJurnal)."""
+        jurnal = cls.__new__(cls)
+        jurnal.__setstate__({**state, "kolom": KolomJurnal(state["kolom"], tunda)})
+        return jurnal
+
+    def __getstate__(self):
+        n = self._n
+        return {
+            "kolom": {nama: arr[:n].copy() for nama, arr in self._kol.items()},
+            "bagan": self._akun.ke_state(),
+            "ref": list(self._ref.nilai),
+            "versi": self._versi,
+            "id_berikut": self._id_berikut,
+        }
+
+    def __setstate__(self, state):
+        kolom = state["kolom"]
+        self._n = len(kolom["Tanggal"])
+        # Snapshot lama belum punya ID baris: beri ID sesuai urutan
+        if "ID" not in kolom:
+            kolom["ID"] = np.arange(self._n, dtype=np.int64)
+        # Snapshot lama menyimpan nominal sebagai rupiah float64
+        for nama in ("Debit", "Kredit"):
+            if kolom[nama].dtype != np.int64:
+                kolom[nama] = ke_sen_array(kolom[nama])
+        self._id_berikut = state.get("id_berikut", self._n)
+        self._kol = kolom
+        self._kapasitas = self._n
+        self._kolom_dibagi = set()
+        self._akun = BaganAkun.dari_state(state["bagan"]) if "bagan" in state else BaganAkun(state["akun"])
+        self._ref = DaftarKode(state["ref"])
+        self._versi = state.get("versi", 0)
+        self._cache_frame = None
+        self._cache_sidik = (None, None)
+        self._cache_indeks = None
+        self._saldo = None
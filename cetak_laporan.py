@@ -0,0 +1,205 @@
+"""Cetak laporan keuangan dari baris perintah, tanpa Streamlit (misalnya batch malam hari).
+
+    python cetak_laporan.py data_warung/warteg_bahari --format xlsx csv json
+    python cetak_laporan.py data_warung --keluaran laporan_malam --pekerja 4
+
+Sumber jurnal yang dikenali:
+
+- folder data warung (snapshot ``session_state.parquet``/``.pkl`` + ``jurnal.log`` dan/atau ``warteg.db``),
+- database SQLite (``.db``/``.sqlite``),
+- file transaksi ``.csv``/``.xlsx`` dengan format yang sama seperti halaman impor.
+
+Folder yang bukan folder data warung dianggap kumpulan buku: setiap isinya
+(subfolder warung atau file di atas) diproses terpisah di process pool.
+Isi laporan sama dengan ``simpan_semua_ke_excel``: ``hitung_laporan`` (dengan
+periode yang sudah ditutup) lalu ``susun_sheet``. Format ``csv`` menulis satu
+file per sheet, ``json`` satu file berisi semua sheet. Dengan ``--gabung``,
+saldo semua buku juga dijumlahkan menjadi laporan gabungan outlet (lihat
+``konsolidasi``) di ``<keluaran>/_gabungan``. Jalankan dari folder
+aplikasi: snapshot backend SQLite menyimpan path database relatif terhadap folder itu.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from ekspor_excel import (
+    nama_file_excel,
+    susun_sheet,
+    susun_sheet_gabungan,
+    tulis_csv,
+    tulis_json,
+    tulis_laporan_excel,
+    tulis_pandas,
+)
+from konsolidasi import SaldoOutlet, gabungkan, nama_outlet, perbandingan, perbandingan_akun
+from laporan import saldo_laporan, susun_laporan
+from penyimpanan import daftar_buku, muat_buku
+from uang import ke_rupiah
+
+FORMAT = ("xlsx", "csv", "json")
+
+FOLDER_KELUARAN = "laporan_batch"
+FOLDER_GABUNGAN = "_gabungan"
+FILE_RINGKASAN = "ringkasan.json"
+
+
+# --- Pemrosesan ---
+def cek_seimbang(laporan):
+    """Dua cek keseimbangan dengan nama sendiri, sama untuk setiap buku dan laporan gabungan."""
+    return {
+        "neraca_saldo_seimbang": laporan.total_debit == laporan.total_kredit,
+        "posisi_seimbang": laporan.total_aktiva == laporan.total_pasiva,
+    }
+
+
+def proses_buku(path, keluaran, daftar_format, tanggal_tutup):
+    """Menulis laporan satu sumber jurnal ke ``keluaran/<nama buku>/``; mengembalikan ringkasannya.
+
+    Dijalankan di proses pekerja, jadi kesalahan dicatat di ringkasan, bukan dilempar.
+    Tabel saldonya ikut dikembalikan (kunci "saldo") untuk laporan gabungan.
+    """
+    mulai = time.perf_counter()
+    nama = nama_outlet(path)
+    ringkasan = {"buku": path, "baris": 0, "berkas": [], "galat": ""}
+    try:
+        jurnal, periode = muat_buku(path)
+        df_jurnal = jurnal.frame()
+        # Sama dengan hitung_laporan, tetapi tabel saldonya disimpan untuk digabung
+        saldo = saldo_laporan(jurnal, periode)
+        laporan = susun_laporan(saldo, tanggal_tutup)
+        folder = os.path.join(keluaran, nama)
+        os.makedirs(folder, exist_ok=True)
+
+        if "xlsx" in daftar_format:
+            tujuan = os.path.join(folder, nama_file_excel(df_jurnal))
+            tulis_laporan_excel(df_jurnal, laporan, tujuan)
+            ringkasan["berkas"].append(tujuan)
+        if "csv" in daftar_format:
+            ringkasan["berkas"] += tulis_csv(susun_sheet(df_jurnal, laporan), os.path.join(folder, "csv"))
+        if "json" in daftar_format:
+            tujuan = os.path.join(folder, "laporan.json")
+            tulis_json(susun_sheet(df_jurnal, laporan), tujuan)
+            ringkasan["berkas"].append(tujuan)
+
+        ringkasan.update(
+            baris=len(df_jurnal),
+            periode_tertutup=len(periode) if periode is not None else 0,
+            **cek_seimbang(laporan),
+            laba_bersih=ke_rupiah(laporan.laba_bersih),
+            modal_akhir=ke_rupiah(laporan.modal_akhir),
+            saldo=saldo,
+        )
+    except Exception as e:
+        ringkasan["galat"] = f"{type(e).__name__}: {e}"
+    ringkasan["detik"] = round(time.perf_counter() - mulai, 3)
+    return ringkasan
+
+
+def _cetak(ringkasan):
+    if ringkasan["galat"]:
+        print(f"GAGAL  {ringkasan['buku']}: {ringkasan['galat']}")
+        return
+    catatan = "" if ringkasan["neraca_saldo_seimbang"] else "  <-- TIDAK SEIMBANG"
+    print(f"OK     {ringkasan['buku']}: {ringkasan['baris']:,} baris, laba bersih "
+          f"Rp{ringkasan['laba_bersih']:,.2f}, {len(ringkasan['berkas'])} file, {ringkasan['detik']:.2f} dtk{catatan}")
+
+
+def tulis_gabungan(daftar_ringkasan, saldo, keluaran, daftar_format, tanggal_tutup):
+    """Menulis laporan gabungan dari saldo semua buku yang berhasil; mengembalikan ringkasannya (atau None)."""
+    hasil = gabungkan([SaldoOutlet(nama_outlet(r["buku"]), r["buku"], saldo=saldo[r["buku"]])
+                       for r in daftar_ringkasan if not r["galat"]], tanggal_tutup)
+    if hasil.gabungan is None:
+        return None
+    folder = os.path.join(keluaran, FOLDER_GABUNGAN)
+    os.makedirs(folder, exist_ok=True)
+
+    def daftar_sheet():
+        return susun_sheet_gabungan(hasil.gabungan, perbandingan(hasil), perbandingan_akun(hasil))
+
+    berkas = []
+    if "xlsx" in daftar_format:
+        # Hanya tabel saldo dan ringkasan (satu baris per akun), jadi cukup ditulis lewat pandas
+        berkas.append(os.path.join(folder, "laporan_gabungan.xlsx"))
+        tulis_pandas(daftar_sheet(), berkas[-1])
+    if "csv" in daftar_format:
+        berkas += tulis_csv(daftar_sheet(), os.path.join(folder, "csv"))
+    if "json" in daftar_format:
+        berkas.append(os.path.join(folder, "laporan_gabungan.json"))
+        tulis_json(daftar_sheet(), berkas[-1])
+    return {
+        "outlet": [o.nama for o in hasil.outlet],
+        **cek_seimbang(hasil.gabungan),
+        "laba_bersih": ke_rupiah(hasil.gabungan.laba_bersih),
+        "modal_akhir": ke_rupiah(hasil.gabungan.modal_akhir),
+        "berkas": berkas,
+    }
+
+
+def jalankan(daftar_path, keluaran, daftar_format, tanggal_tutup, pekerja, gabung=False):
+    """Memproses semua buku (paralel jika lebih dari satu) dan menulis ringkasan.json; mengembalikan ringkasannya."""
+    buku = daftar_buku(daftar_path)
+    if not buku:
+        raise ValueError("Tidak ada sumber jurnal yang dikenali.")
+    os.makedirs(keluaran, exist_ok=True)
+
+    pekerja = max(1, min(pekerja or os.cpu_count() or 1, len(buku)))
+    hasil = {}
+    if pekerja == 1:
+        for path in buku:
+            hasil[path] = proses_buku(path, keluaran, daftar_format, tanggal_tutup)
+            _cetak(hasil[path])
+    else:
+        with ProcessPoolExecutor(max_workers=pekerja) as pelaksana:
+            tugas = {pelaksana.submit(proses_buku, path, keluaran, daftar_format, tanggal_tutup): path for path in buku}
+            for selesai in as_completed(tugas):
+                hasil[tugas[selesai]] = selesai.result()
+                _cetak(hasil[tugas[selesai]])
+
+    daftar_ringkasan = [hasil[path] for path in buku]
+    saldo = {r["buku"]: r.pop("saldo", None) for r in daftar_ringkasan}
+    isi = {
+        "waktu": datetime.now().isoformat(timespec="seconds"),
+        "tanggal_tutup": tanggal_tutup,
+        "buku": daftar_ringkasan,
+    }
+    if gabung:
+        isi["gabungan"] = tulis_gabungan(daftar_ringkasan, saldo, keluaran, daftar_format, tanggal_tutup)
+        if isi["gabungan"] is not None:
+            print(f"GABUNG {len(isi['gabungan']['outlet'])} outlet: laba bersih Rp{isi['gabungan']['laba_bersih']:,.2f}, "
+                  f"{len(isi['gabungan']['berkas'])} file")
+    with open(os.path.join(keluaran, FILE_RINGKASAN), "w", encoding="utf-8") as f:
+        json.dump(isi, f, ensure_ascii=False, indent=2)
+    return daftar_ringkasan
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cetak laporan keuangan warteg tanpa Streamlit.")
+    parser.add_argument("sumber", nargs="+",
+                        help="Folder data warung, database .db, file .csv/.xlsx, atau folder berisi beberapa di antaranya.")
+    parser.add_argument("--keluaran", default=FOLDER_KELUARAN, help=f"Folder hasil (bawaan: {FOLDER_KELUARAN}).")
+    parser.add_argument("--format", nargs="+", choices=FORMAT, default=["xlsx"], help="Format hasil (bawaan: xlsx).")
+    parser.add_argument("--tanggal-tutup", default=None,
+                        help="Tanggal di Jurnal Penutup, YYYY-MM-DD (bawaan: hari ini).")
+    parser.add_argument("--pekerja", type=int, default=None,
+                        help="Jumlah proses untuk banyak buku sekaligus (bawaan: jumlah CPU).")
+    parser.add_argument("--gabung", action="store_true",
+                        help=f"Tambahkan laporan gabungan semua buku (konsolidasi outlet) di {FOLDER_GABUNGAN}.")
+    args = parser.parse_args(argv)
+
+    tanggal_tutup = args.tanggal_tutup or datetime.today().strftime("%Y-%m-%d")
+    try:
+        daftar_ringkasan = jalankan(args.sumber, args.keluaran, args.format, tanggal_tutup, args.pekerja, args.gabung)
+    except ValueError as e:
+        parser.error(str(e))
+    gagal = sum(1 for r in daftar_ringkasan if r["galat"])
+    print(f"\n{len(daftar_ringkasan) - gagal} buku selesai, {gagal} gagal. Ringkasan: "
+          f"{os.path.join(args.keluaran, FILE_RINGKASAN)}")
+    return 1 if gagal else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,537 @@
+"""Ekspor laporan keuangan ke file Excel.
+
+Isi workbook disusun sekali sebagai daftar sheet ``(nama, data)``. ``data``
+berupa DataFrame (sheet kecil) atau pasangan ``(kolom, baris)`` dengan
+``baris`` berupa generator, sehingga sheet besar tidak perlu dibangun
+utuh di memori. Ada dua mode penulisan:
+
+- ``pandas``: ``pd.ExcelWriter`` seperti semula (cocok untuk jurnal kecil).
+- ``streaming``: workbook openpyxl ``write_only``; baris langsung ditulis ke
+  file sementara, jadi memori puncak tidak bergantung pada panjang jurnal.
+
+Daftar sheet yang sama juga bisa ditulis sebagai CSV (satu file per sheet)
+atau JSON (satu file berisi semua sheet), dipakai ``cetak_laporan``.
+
+Semua sheet Buku Besar dibuat dari SATU pengurutan jurnal per akun, bukan
+penyaringan ulang seluruh jurnal untuk setiap akun.
+
+Hasil ekspor disimpan di ``cache_ekspor`` dengan kunci sidik isi jurnal, jadi
+jurnal yang belum berubah langsung mendapat file yang sama tanpa dibangun ulang.
+``mulai_ekspor`` menjalankan penulisan workbook di thread pekerja dan
+mencatat kemajuannya per sheet, sehingga halaman tidak perlu menunggu.
+
+openpyxl baru diimpor saat workbook benar-benar ditulis, jadi membuka
+aplikasi tidak ikut menanggung waktu impornya.
+
+Jurnal dan laporan menyimpan nominal dalam sen; angka di file Excel ditulis
+dalam rupiah, diubah tepat sebelum sheet disusun.
+"""
+import csv
+import dataclasses
+import io
+import json
+import os
+import re
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from laporan import hitung_laporan
+from uang import frame_rupiah, ke_rupiah
+
+# Mode ekspor: "otomatis" (streaming untuk jurnal besar), "streaming", atau "pandas"
+MODE_EKSPOR = os.environ.get("WARTEG_EKSPOR", "otomatis")
+
+# Mode otomatis memakai streaming mulai jumlah baris jurnal ini
+BATAS_BARIS_STREAMING = 20000
+
+# Batas total ukuran file Excel yang disimpan di cache ekspor (semua sesi)
+BATAS_CACHE_EKSPOR = int(os.environ.get("WARTEG_CACHE_EKSPOR_MB", "64")) * 1024 * 1024
+
+# Jumlah thread pekerja untuk ekspor di latar belakang (dipakai bersama semua sesi)
+PEKERJA_EKSPOR = 2
+
+# Jumlah pekerjaan ekspor selesai yang hasilnya tetap bisa diunduh
+SIMPAN_PEKERJAAN_SELESAI = 8
+
+# Jumlah baris yang dikonversi sekaligus saat menulis secara streaming
+_UKURAN_BLOK = 5000
+
+KOLOM_BUKU_BESAR = ["Tanggal", "Ref", "Deskripsi", "Mutasi Debit", "Mutasi Kredit", "Saldo Akhir"]
+
+
+def _baris_frame(df):
+    """Baris DataFrame sebagai list nilai Python, dikonversi per blok; NaN/NaT menjadi sel kosong."""
+    for awal in range(0, len(df), _UKURAN_BLOK):
+        blok = df.iloc[awal:awal + _UKURAN_BLOK].astype(object)
+        yield from blok.where(blok.notna(), None).to_numpy().tolist()
+
+
+# --- Penyusunan sheet ---
+def _sheet_buku_besar(df_jurnal):
+    """Sheet Buku Besar per akun (urut kemunculan akun) dari satu pengurutan jurnal."""
+    kode, daftar_akun = pd.factorize(df_jurnal["Akun"])
+    urutan = np.argsort(kode, kind="stable")
+    batas = np.searchsorted(kode[urutan], np.arange(len(daftar_akun) + 1))
+
+    tanggal = df_jurnal["Tanggal"].to_numpy()
+    ref = df_jurnal["Ref"].to_numpy(dtype=object)
+    debit = df_jurnal["Debit"].to_numpy(dtype=np.int64)
+    kredit = df_jurnal["Kredit"].to_numpy(dtype=np.int64)
+
+    def baris(akun, indeks):
+        # Saldo berjalan dijumlahkan dalam sen, baru ditulis sebagai rupiah
+        saldo = 0
+        for awal in range(0, len(indeks), _UKURAN_BLOK):
+            idx = indeks[awal:awal + _UKURAN_BLOK]
+            mutasi = np.cumsum(debit[idx] - kredit[idx]) + saldo
+            saldo = mutasi[-1]
+            yield from _baris_frame(pd.DataFrame({
+                "Tanggal": tanggal[idx],
+                "Ref": ref[idx],
+                "Deskripsi": akun,
+                "Mutasi Debit": ke_rupiah(debit[idx]),
+                "Mutasi Kredit": ke_rupiah(kredit[idx]),
+                "Saldo Akhir": ke_rupiah(mutasi),
+            }))
+
+    for i, akun in enumerate(daftar_akun):
+        indeks = urutan[batas[i]:batas[i + 1]]
+        yield f"Buku Besar - {akun[:25]}", (KOLOM_BUKU_BESAR, baris(akun, indeks))
+
+
+def _sheet_laba_rugi(laporan):
+    laba_rugi_data = []
+    if laporan.total_pendapatan > 0:
+        laba_rugi_data.append({"Kategori": "Pendapatan", "Deskripsi": "Total Pendapatan", "Nominal": laporan.total_pendapatan})
+
+    # Rincian semua beban
+    for akun, jumlah in laporan.beban_per_akun.itertuples(index=False):
+        if jumlah > 0:
+            laba_rugi_data.append({"Kategori": "Beban", "Deskripsi": akun, "Nominal": jumlah})
+
+    if not laba_rugi_data:
+        return pd.DataFrame([{"Kategori": "Info", "Deskripsi": "Tidak ada data Laba Rugi", "Nominal": 0}])
+    laba_rugi_data.append({"Kategori": "", "Deskripsi": "Laba/Rugi Bersih", "Nominal": laporan.laba_bersih})
+    return pd.DataFrame(laba_rugi_data)
+
+
+def _sheet_perubahan_modal(laporan):
+    return pd.DataFrame([
+        {"Deskripsi": "Modal Awal", "Jumlah": laporan.modal_awal},
+        {"Deskripsi": "Laba Bersih", "Jumlah": laporan.laba_bersih},
+        {"Deskripsi": "Prive", "Jumlah": laporan.prive},
+        {"Deskripsi": "Modal Akhir", "Jumlah": laporan.modal_akhir}
+    ])
+
+
+def _sheet_posisi_keuangan(laporan):
+    neraca_data = []
+    neraca_data.append({"Kategori": "Aktiva", "Akun": "Aktiva Lancar", "Jumlah": ""})
+    for acc, balance in laporan.aktiva_lancar:
+        neraca_data.append({"Kategori": "Aktiva", "Akun": acc, "Jumlah": balance})
+
+    neraca_data.append({"Kategori": "Aktiva", "Akun": "Aktiva Tetap", "Jumlah": ""})
+    for acc, balance in laporan.aktiva_tetap:
+        neraca_data.append({"Kategori": "Aktiva", "Akun": acc, "Jumlah": balance})
+
+    neraca_data.append({"Kategori": "Aktiva", "Akun": "TOTAL AKTIVA", "Jumlah": laporan.total_aktiva})
+
+    neraca_data.append({"Kategori": "Pasiva", "Akun": "Kewajiban", "Jumlah": ""})
+    for acc, balance in laporan.kewajiban:
+        neraca_data.append({"Kategori": "Pasiva", "Akun": acc, "Jumlah": balance})
+
+    neraca_data.append({"Kategori": "Pasiva", "Akun": "Ekuitas", "Jumlah": ""})
+    neraca_data.append({"Kategori": "Pasiva", "Akun": "Modal Akhir", "Jumlah": laporan.modal_akhir})
+    neraca_data.append({"Kategori": "Pasiva", "Akun": "TOTAL PASIVA", "Jumlah": laporan.total_pasiva})
+    return pd.DataFrame(neraca_data)
+
+
+def _sheet_nssp(laporan):
+    df_nssp = laporan.nssp.rename(columns={"Debit": "Saldo Debit", "Kredit": "Saldo Kredit"})
+    total_nssp_row = pd.DataFrame({
+        "Ref": ["TOTAL"], "Akun": [""],
+        "Saldo Debit": [df_nssp["Saldo Debit"].sum()],
+        "Saldo Kredit": [df_nssp["Saldo Kredit"].sum()]
+    })
+    return pd.concat([df_nssp, total_nssp_row], ignore_index=True)
+
+
+def _laporan_rupiah(laporan):
+    """Salinan HasilLaporan dengan semua nominal (sen) diubah ke rupiah untuk ditulis ke Excel."""
+    def posisi(daftar):
+        return [(akun, ke_rupiah(nilai)) for akun, nilai in daftar]
+
+    return dataclasses.replace(
+        laporan,
+        neraca_saldo=frame_rupiah(laporan.neraca_saldo, ("Debit", "Kredit", "Saldo Debit", "Saldo Kredit")),
+        pendapatan_per_akun=frame_rupiah(laporan.pendapatan_per_akun, ("Jumlah",)),
+        beban_per_akun=frame_rupiah(laporan.beban_per_akun, ("Jumlah",)),
+        aktiva_lancar=posisi(laporan.aktiva_lancar),
+        aktiva_tetap=posisi(laporan.aktiva_tetap),
+        kewajiban=posisi(laporan.kewajiban),
+        jurnal_penutup=frame_rupiah(laporan.jurnal_penutup),
+        nssp=frame_rupiah(laporan.nssp),
+        **{nama: ke_rupiah(getattr(laporan, nama)) for nama in (
+            "total_debit", "total_kredit", "total_pendapatan", "total_beban", "laba_bersih",
+            "modal_awal", "prive", "modal_akhir", "total_aktiva", "total_pasiva",
+        )},
+    )
+
+
+def nama_file_excel(df_jurnal):
+    """Nama file unduhan: laporan_keuangan_<tanggal transaksi pertama>.xlsx."""
+    try:
+        tanggal_pertama = pd.to_datetime(df_jurnal["Tanggal"]).min().strftime("%d-%b-%Y")
+        return f"laporan_keuangan_{tanggal_pertama}.xlsx"
+    except Exception:
+        return "laporan_keuangan_unknown_date.xlsx"
+
+
+def jumlah_sheet(df_jurnal):
+    """Banyaknya sheet yang dihasilkan susun_sheet (untuk menghitung kemajuan)."""
+    return 8 + df_jurnal["Akun"].nunique()
+
+
+def susun_sheet(df_jurnal, laporan):
+    """Generator (nama_sheet, data) untuk seluruh isi workbook laporan keuangan."""
+    laporan = _laporan_rupiah(laporan)
+
+    # --- JURNAL UMUM ---
+    yield "Jurnal Umum", frame_rupiah(df_jurnal)
+
+    # --- BUKU BESAR ---
+    yield from _sheet_buku_besar(df_jurnal)
+
+    # --- NERACA SALDO ---
+    yield "Neraca Saldo", laporan.neraca_saldo[["Ref", "Akun", "Saldo Debit", "Saldo Kredit"]]
+
+    # --- LAPORAN LABA RUGI ---
+    yield "Laporan Laba Rugi", _sheet_laba_rugi(laporan)
+
+    # --- LAPORAN PERUBAHAN MODAL ---
+    yield "Laporan Perubahan Modal", _sheet_perubahan_modal(laporan)
+
+    # --- LAPORAN POSISI KEUANGAN (NERACA) ---
+    yield "Laporan Posisi Keuangan", _sheet_posisi_keuangan(laporan)
+
+    # --- JURNAL PENUTUP ---
+    if not laporan.jurnal_penutup.empty:
+        yield "Jurnal Penutup", laporan.jurnal_penutup
+    else:
+        yield "Jurnal Penutup", pd.DataFrame([{"Info": "Tidak ada Jurnal Penutup"}])
+
+    # --- NERACA SALDO SETELAH PENUTUPAN (NSSP) ---
+    yield "NSSP", _sheet_nssp(laporan)
+
+
+def susun_sheet_gabungan(laporan, df_perbandingan, df_per_akun):
+    """Generator (nama_sheet, data) workbook konsolidasi outlet (lihat ``konsolidasi``).
+
+    ``df_perbandingan``/``df_per_akun`` adalah tabel berdampingan per outlet;
+    semua kolomnya nominal sen kecuali kolom nama (Pos, Kelompok, Akun).
+    """
+    laporan = _laporan_rupiah(laporan)
+
+    def rupiah(df):
+        return frame_rupiah(df, [k for k in df.columns if k not in ("Pos", "Kelompok", "Akun")])
+
+    yield "Perbandingan Outlet", rupiah(df_perbandingan)
+    yield "Perbandingan Per Akun", rupiah(df_per_akun)
+    yield "Neraca Saldo Gabungan", laporan.neraca_saldo[["Ref", "Akun", "Saldo Debit", "Saldo Kredit"]]
+    yield "Laba Rugi Gabungan", _sheet_laba_rugi(laporan)
+    yield "Perubahan Modal Gabungan", _sheet_perubahan_modal(laporan)
+    yield "Posisi Keuangan Gabungan", _sheet_posisi_keuangan(laporan)
+
+
+# --- Penulisan workbook ---
+def _header(ws, kolom):
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+
+    # Gaya header sama dengan yang dipakai pandas.to_excel
+    tepi = Side(style="thin")
+    font = Font(bold=True)
+    border = Border(left=tepi, right=tepi, top=tepi, bottom=tepi)
+    rata = Alignment(horizontal="center", vertical="top")
+    sel = []
+    for nama in kolom:
+        c = WriteOnlyCell(ws, value=nama)
+        c.font = font
+        c.border = border
+        c.alignment = rata
+        sel.append(c)
+    return sel
+
+
+def _kolom_baris(data):
+    """(kolom, generator baris) dari data sheet, baik DataFrame maupun pasangan (kolom, baris)."""
+    if isinstance(data, pd.DataFrame):
+        return list(data.columns), _baris_frame(data)
+    return data
+
+
+def tulis_streaming(daftar_sheet, tujuan):
+    """Menulis sheet baris demi baris ke workbook write-only (memori konstan)."""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    for nama, data in daftar_sheet:
+        kolom, baris = _kolom_baris(data)
+        ws = wb.create_sheet(title=nama)
+        ws.append(_header(ws, kolom))
+        for b in baris:
+            ws.append(b)
+    wb.save(tujuan)
+
+
+def tulis_pandas(daftar_sheet, tujuan):
+    """Menulis sheet lewat pd.ExcelWriter (seluruh workbook dibangun di memori)."""
+    with pd.ExcelWriter(tujuan, engine="openpyxl") as writer:
+        for nama, data in daftar_sheet:
+            if not isinstance(data, pd.DataFrame):
+                kolom, baris = data
+                data = pd.DataFrame(list(baris), columns=kolom)
+            data.to_excel(writer, sheet_name=nama, index=False)
+
+
+def tulis_csv(daftar_sheet, folder):
+    """Menulis setiap sheet ke ``folder/<nama sheet>.csv`` baris demi baris; mengembalikan daftar path."""
+    os.makedirs(folder, exist_ok=True)
+    daftar_path = []
+    for nama, data in daftar_sheet:
+        kolom, baris = _kolom_baris(data)
+        # Nama akun bisa berisi karakter yang tidak boleh ada di nama file
+        dasar = re.sub(r"[^\w -]", "_", nama).strip() or "_"
+        path, ke = os.path.join(folder, dasar + ".csv"), 1
+        while path in daftar_path:
+            ke += 1
+            path = os.path.join(folder, f"{dasar} ({ke}).csv")
+        # utf-8-sig supaya Excel langsung mengenali huruf non-ASCII
+        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            penulis = csv.writer(f)
+            penulis.writerow(kolom)
+            penulis.writerows(baris)
+        daftar_path.append(path)
+    return daftar_path
+
+
+def _nilai_json(nilai):
+    if hasattr(nilai, "isoformat"):
+        return nilai.isoformat()
+    if hasattr(nilai, "item"):
+        return nilai.item()
+    return str(nilai)
+
+
+def tulis_json(daftar_sheet, tujuan):
+    """Menulis semua sheet ke satu file JSON ``{nama sheet: [{kolom: nilai}, ...]}`` baris demi baris."""
+    with open(tujuan, "w", encoding="utf-8") as f:
+        f.write("{")
+        for ke, (nama, data) in enumerate(daftar_sheet):
+            kolom, baris = _kolom_baris(data)
+            f.write(("," if ke else "") + "\n" + json.dumps(nama, ensure_ascii=False) + ": [")
+            for i, b in enumerate(baris):
+                isi = json.dumps(dict(zip(kolom, b)), ensure_ascii=False, default=_nilai_json)
+                f.write(("," if i else "") + "\n  " + isi)
+            f.write("\n]")
+        f.write("\n}\n")
+
+
+def _dengan_kemajuan(daftar_sheet, kemajuan):
+    for ke, (nama, data) in enumerate(daftar_sheet):
+        kemajuan(ke, nama)
+        yield nama, data
+
+
+def tulis_laporan_excel(df_jurnal, laporan, tujuan, mode=None, kemajuan=None):
+    """Menulis workbook laporan ke ``tujuan`` (path atau file-like) sesuai mode ekspor.
+
+    ``kemajuan(ke, nama_sheet)`` dipanggil tepat sebelum setiap sheet ditulis.
+    """
+    mode = mode or MODE_EKSPOR
+    if mode == "otomatis":
+        mode = "streaming" if len(df_jurnal) >= BATAS_BARIS_STREAMING else "pandas"
+
+    daftar_sheet = susun_sheet(df_jurnal, laporan)
+    if kemajuan is not None:
+        daftar_sheet = _dengan_kemajuan(daftar_sheet, kemajuan)
+    if mode == "streaming":
+        tulis_streaming(daftar_sheet, tujuan)
+    else:
+        tulis_pandas(daftar_sheet, tujuan)
+
+
+# --- Cache hasil ekspor ---
+class CacheEkspor:
+    """Cache LRU isi file Excel (bytes) per kunci, dibatasi total ukuran byte."""
+
+    def __init__(self, batas_byte):
+        self.batas_byte = batas_byte
+        self._isi = OrderedDict()
+        self._ukuran = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._isi)
+
+    @property
+    def ukuran(self):
+        return self._ukuran
+
+    def ambil(self, kunci):
+        with self._lock:
+            data = self._isi.get(kunci)
+            if data is not None:
+                self._isi.move_to_end(kunci)
+            return data
+
+    def simpan(self, kunci, data):
+        """Menyimpan data; entri yang paling lama tidak dipakai dibuang sampai muat."""
+        if len(data) > self.batas_byte:
+            return
+        with self._lock:
+            lama = self._isi.pop(kunci, None)
+            if lama is not None:
+                self._ukuran -= len(lama)
+            self._isi[kunci] = data
+            self._ukuran += len(data)
+            while self._ukuran > self.batas_byte:
+                _, dibuang = self._isi.popitem(last=False)
+                self._ukuran -= len(dibuang)
+
+    def kosongkan(self):
+        with self._lock:
+            self._isi.clear()
+            self._ukuran = 0
+
+
+cache_ekspor = CacheEkspor(BATAS_CACHE_EKSPOR)
+
+
+def _kunci_ekspor(jurnal, tanggal_tutup, periode):
+    # Tanggal tutup ikut jadi kunci karena tercetak di sheet Jurnal Penutup
+    return (jurnal.sidik(), tanggal_tutup, periode.sidik() if periode is not None else ())
+
+
+def _buat_excel(kunci, df_jurnal, laporan, kemajuan=None):
+    buffer = io.BytesIO()
+    tulis_laporan_excel(df_jurnal, laporan, buffer, kemajuan=kemajuan)
+    data = buffer.getvalue()
+    cache_ekspor.simpan(kunci, data)
+    return data
+
+
+def excel_laporan(jurnal, tanggal_tutup=None, periode=None):
+    """Isi file Excel laporan lengkap (bytes), diambil dari cache jika jurnal belum berubah."""
+    if tanggal_tutup is None:
+        tanggal_tutup = datetime.today().strftime("%Y-%m-%d")
+
+    kunci = _kunci_ekspor(jurnal, tanggal_tutup, periode)
+    data = cache_ekspor.ambil(kunci)
+    if data is None:
+        data = _buat_excel(kunci, jurnal.frame(), hitung_laporan(jurnal, tanggal_tutup, periode))
+    return data
+
+
+# --- Ekspor di latar belakang ---
+_pelaksana = ThreadPoolExecutor(max_workers=PEKERJA_EKSPOR, thread_name_prefix="ekspor")
+_daftar_pekerjaan = {}
+_lock_pekerjaan = threading.Lock()
+
+ANTRE = "antre"
+BERJALAN = "berjalan"
+SELESAI = "selesai"
+GAGAL = "gagal"
+
+
+class PekerjaanEkspor:
+    """Status satu ekspor Excel yang dikerjakan thread pekerja."""
+
+    def __init__(self, kunci, total_sheet):
+        self.id = uuid.uuid4().hex
+        self.kunci = kunci
+        self.total_sheet = total_sheet
+        self.sheet_ke = 0
+        self.sheet_sekarang = ""
+        self.status = ANTRE
+        self.data = None
+        self.galat = None
+
+    @property
+    def selesai(self):
+        return self.status in (SELESAI, GAGAL)
+
+    @property
+    def persen(self):
+        """Kemajuan 0.0 - 1.0 berdasarkan jumlah sheet yang sudah mulai ditulis."""
+        if self.status == SELESAI:
+            return 1.0
+        return min(self.sheet_ke / max(self.total_sheet, 1), 1.0)
+
+    def _kemajuan(self, ke, nama):
+        self.sheet_ke = ke
+        self.sheet_sekarang = nama
+
+    def _jalankan(self, df_jurnal, laporan):
+        self.status = BERJALAN
+        try:
+            self.data = _buat_excel(self.kunci, df_jurnal, laporan, kemajuan=self._kemajuan)
+        except Exception as e:
+            self.galat = str(e)
+            self.status = GAGAL
+        else:
+            self.status = SELESAI
+
+
+def mulai_ekspor(jurnal, tanggal_tutup=None, periode=None):
+    """Memulai ekspor di thread pekerja dan mengembalikan PekerjaanEkspor-nya.
+
+    Laporan dihitung di thread pemanggil supaya isinya sesuai jurnal saat
+    tombol ditekan, meskipun transaksi baru dicatat selama file ditulis.
+    Jika jurnal yang sama sedang diekspor, pekerjaan itu yang dikembalikan.
+    """
+    if tanggal_tutup is None:
+        tanggal_tutup = datetime.today().strftime("%Y-%m-%d")
+
+    kunci = _kunci_ekspor(jurnal, tanggal_tutup, periode)
+    df_jurnal = jurnal.frame()
+    # Pemeriksaan dan pendaftaran dalam satu kunci: dua sesi yang menekan tombol
+    # bersamaan untuk jurnal yang sama tidak menulis workbook yang sama dua kali
+    with _lock_pekerjaan:
+        for pekerjaan in _daftar_pekerjaan.values():
+            if pekerjaan.kunci == kunci and pekerjaan.status != GAGAL:
+                return pekerjaan
+        pekerjaan = PekerjaanEkspor(kunci, jumlah_sheet(df_jurnal))
+        _daftar_pekerjaan[pekerjaan.id] = pekerjaan
+        # Pekerjaan selesai yang paling lama dilupakan supaya hasilnya tidak menumpuk
+        selesai = [p.id for p in _daftar_pekerjaan.values() if p.selesai]
+        for id_lama in selesai[:max(len(selesai) - SIMPAN_PEKERJAAN_SELESAI, 0)]:
+            del _daftar_pekerjaan[id_lama]
+
+    data = cache_ekspor.ambil(kunci)
+    if data is not None:
+        pekerjaan.data = data
+        pekerjaan.status = SELESAI
+        return pekerjaan
+    try:
+        laporan = hitung_laporan(jurnal, tanggal_tutup, periode)
+    except Exception as e:
+        # Pekerjaan yang sudah didaftarkan tidak boleh tertinggal dalam status antre
+        pekerjaan.galat = str(e)
+        pekerjaan.status = GAGAL
+        raise
+    _pelaksana.submit(pekerjaan._jalankan, df_jurnal, laporan)
+    return pekerjaan
+
+
+def ambil_pekerjaan(id_pekerjaan):
+    """PekerjaanEkspor dengan id tersebut, atau None (misalnya setelah server restart)."""
+    with _lock_pekerjaan:
+        return _daftar_pekerjaan.get(id_pekerjaan)
+
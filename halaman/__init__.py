@@ -0,0 +1,42 @@
+"""Halaman-halaman aplikasi, satu modul per menu.
+
+Modul halaman baru diimpor saat menunya pertama kali dibuka, jadi membuka
+Etalase Utama tidak ikut memuat kode Buku Pesanan, impor CSV, atau ekspor Excel.
+"""
+import importlib
+
+# Menu dengan ikon custom -> modul halaman di paket ini
+HALAMAN = {
+    "🏠 Etalase Utama": "etalase",              # Beranda
+    "📝 Buku Pesanan": "buku_pesanan",          # Jurnal Umum
+    "📚 Buku Stok": "buku_stok",                # Buku Besar
+    "🧮 Hitung Setoran": "hitung_setoran",      # Neraca Saldo
+    "💰 Untung Rugi": "untung_rugi",            # Laporan Laba Rugi
+    "📈 Modal Maju Mundur": "modal",            # Laporan Perubahan Modal
+    "🏦 Harta Karun": "harta_karun",            # Laporan Posisi Keuangan
+    "🌙 Tutup Warung": "tutup_warung",          # Jurnal Penutup
+    "☀️ Hitungan Besok Pagi": "besok_pagi",     # NSSP
+    "🏪 Gabungan Cabang": "gabungan",           # Konsolidasi outlet (hanya login berizin)
+    "📦 Bungkus Bawa Pulang": "bungkus",        # Unduh Data
+}
+
+DAFTAR_MENU = list(HALAMAN)
+
+# Gabungan Cabang membaca data outlet lain, jadi hanya untuk login yang diberi izin (lihat DAFTAR_PENGGUNA)
+MENU_GABUNGAN = "🏪 Gabungan Cabang"
+# Izin gabungan untuk pemilik: semua outlet di folder data boleh digabung
+SEMUA_OUTLET = "*"
+
+
+def daftar_menu(outlet_gabungan=()):
+    """Menu yang boleh dibuka; Gabungan Cabang hanya jika ``outlet_gabungan`` (kode outlet atau SEMUA_OUTLET) terisi."""
+    return [menu for menu in DAFTAR_MENU if menu != MENU_GABUNGAN or outlet_gabungan]
+
+
+def muat(menu):
+    """Modul halaman untuk menu (diimpor sekali, berikutnya diambil dari sys.modules)."""
+    return importlib.import_module(f"{__name__}.{HALAMAN[menu]}")
+
+
+def tampilkan(menu):
+    muat(menu).tampilkan()
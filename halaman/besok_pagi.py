@@ -0,0 +1,45 @@
+"""Halaman Hitungan Besok Pagi (Neraca Saldo Setelah Penutupan)."""
+import pandas as pd
+import streamlit as st
+
+from sesi import laporan_berjalan
+from uang import frame_rupiah, ke_rupiah
+
+
+def tampilkan():
+    st.header("☀️ Hitungan Besok Pagi (NSSP)")
+    st.info("""📊 Ini adalah saldo akhir akun-akun permanen (Harta, Utang, Modal) 
+        yang akan menjadi saldo awal untuk periode akuntansi berikutnya.""")
+
+    if "jurnal" not in st.session_state or not st.session_state.jurnal:
+        st.info("📭 Buku Pesanan masih kosong.")
+    else:
+        laporan = laporan_berjalan()
+
+        if not laporan.nssp.empty:
+            seimbang = laporan.nssp["Debit"].sum() == laporan.nssp["Kredit"].sum()
+            df_nssp = frame_rupiah(laporan.nssp)
+
+            total_debit_nssp = ke_rupiah(laporan.nssp["Debit"].sum())
+            total_kredit_nssp = ke_rupiah(laporan.nssp["Kredit"].sum())
+
+            total_row_nssp = pd.DataFrame({
+                "Ref": ["**TOTAL**"],
+                "Akun": ["Siap Jualan Besok! 🎉"],
+                "Debit": [total_debit_nssp],
+                "Kredit": [total_kredit_nssp]
+            })
+            df_nssp_final = pd.concat([df_nssp, total_row_nssp], ignore_index=True)
+
+            st.subheader("📋 Neraca Saldo Setelah Penutupan")
+            st.dataframe(df_nssp_final, use_container_width=True)
+
+            # Balance check
+            if seimbang:
+                st.success("""✅ **HITUNGAN BESOK PAGI SEIMBANG!**
+                    \nWarung siap buka untuk periode baru! ☀️""")
+            else:
+                st.error(f"""❌ **HITUNGAN BESOK PAGI TIDAK SEIMBANG**
+                    \n**Selisih:** Rp {abs(total_debit_nssp - total_kredit_nssp):,.2f}""")
+        else:
+            st.info("ℹ️ Tidak ada data akun permanen yang ditemukan.")
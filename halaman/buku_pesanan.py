@@ -0,0 +1,200 @@
+"""Halaman Buku Pesanan (Jurnal Umum)."""
+import time
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from impor_jurnal import impor_berkas
+from periode import DaftarPeriode
+from profil import ukur
+from uang import frame_rupiah, ke_rupiah, ke_sen
+from sesi import (
+    catat_jurnal, catat_jurnal_banyak, catat_perubahan_jurnal, perubahan_editor,
+    pilih_rentang_tanggal, simpan_session_state, ubah_data_warung,
+)
+
+
+# Pilihan jumlah baris per halaman di Buku Pesanan (hanya halaman ini yang dikirim ke browser)
+PILIHAN_BARIS_HALAMAN = [25, 50, 100, 500]
+URUTAN_JURNAL = {
+    "Urutan Catat": None, "Tanggal": "Tanggal", "Akun": "Akun",
+    "Ref": "Ref", "Debit": "Debit", "Kredit": "Kredit",
+}
+
+
+# Fungsi mengembalikan tampilan Buku Pesanan ke halaman pertama (saat saringan berubah)
+def ke_halaman_pertama():
+    st.session_state.halaman_jurnal = 1
+
+
+def tampilkan():
+    st.header("📝 Buku Pesanan (Jurnal Umum)")
+
+    if "jurnal" not in st.session_state:
+        st.session_state.jurnal = st.session_state.warung.jurnal_baru()
+
+    with st.form("form_jurnal", clear_on_submit=True):
+        st.subheader("➕ Input Pesanan Baru")
+        col1, col2 = st.columns(2)
+        with col1:
+            tanggal = st.date_input("📅 Tanggal Transaksi", value=datetime.today())
+            akun = st.text_input("🏷️ Nama Akun", placeholder="Contoh: Kas, Utang Usaha, Pendapatan")
+        with col2:
+            ref = st.text_input("🔢 Nomor Ref", placeholder="Contoh: 101, 201, 401")
+            keterangan = st.text_input("📋 Keterangan", placeholder="Contoh: Pembelian Bahan Baku")
+
+        st.markdown("**💵 Nominal Transaksi**")
+        c1, c2 = st.columns(2)
+        with c1:
+            debit = st.number_input("💰 Debit (Masuk/Biaya)", min_value=0.0, format="%.2f", step=1000.0)
+        with c2:
+            kredit = st.number_input("💸 Kredit (Keluar/Pendapatan)", min_value=0.0, format="%.2f", step=1000.0)
+
+        submitted = st.form_submit_button("✅ Tambahkan ke Buku Pesanan", use_container_width=True)
+
+        if submitted:
+            mulai_periode = st.session_state.periode.mulai_berjalan
+            if akun and ref: 
+                if debit == 0 and kredit == 0:
+                    st.warning("⚠️ Minimal salah satu nominal (Debit atau Kredit) harus diisi!")
+                elif mulai_periode is not None and pd.Timestamp(tanggal) < mulai_periode:
+                    st.error(f"❌ Periode sampai {st.session_state.periode.terakhir.akhir:%d-%m-%Y} sudah ditutup. "
+                             f"Gunakan tanggal mulai {mulai_periode:%d-%m-%Y}.")
+                else:
+                    catat_jurnal({
+                        "Tanggal": tanggal.strftime("%Y-%m-%d"),
+                        "Keterangan": keterangan, 
+                        "Akun": akun,
+                        "Ref": ref,
+                        "Debit": ke_sen(debit),
+                        "Kredit": ke_sen(kredit)
+                    })
+                    st.success("🎉 Pesanan berhasil dicatat!")
+                    time.sleep(0.5)
+                    st.rerun()
+            else:
+                st.error("❌ Nama Akun dan Nomor Ref harus diisi!")
+
+    # Impor banyak pesanan sekaligus (misalnya ekspor mesin kasir sebulan)
+    with st.expander("📥 Impor Banyak Pesanan dari CSV/Excel"):
+        st.info("""Kolom yang dibaca: **Tanggal, Keterangan, Akun, Ref, Debit, Kredit** 
+            (huruf besar/kecil bebas). Tanggal boleh 2024-01-31 atau 31/01/2024.""")
+        berkas = st.file_uploader("📂 Pilih file pesanan", type=["csv", "xlsx"])
+        lewati_salah = st.checkbox("Lewati baris yang tidak valid")
+        abaikan_timpang = st.checkbox("Tetap impor walau total Debit dan Kredit tidak seimbang")
+
+        if berkas is not None and st.button("📥 Impor ke Buku Pesanan", use_container_width=True):
+            with st.spinner("🔄 Memeriksa file pesanan..."):
+                hasil = impor_berkas(berkas, berkas.name, mulai=st.session_state.periode.mulai_berjalan)
+
+            if hasil.galat:
+                st.error(f"❌ {hasil.galat}")
+            else:
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Baris di File", f"{hasil.jumlah_baris:,}")
+                col2.metric("Baris Valid", f"{len(hasil.data):,}")
+                col3.metric("Baris Ditolak", f"{hasil.jumlah_ditolak:,}")
+                for pesan in hasil.peringatan:
+                    st.warning(f"⚠️ {pesan}")
+
+                if hasil.jumlah_ditolak and not lewati_salah:
+                    st.error("❌ Ada baris yang tidak valid. Perbaiki file, atau centang 'Lewati baris yang tidak valid'.")
+                    st.dataframe(hasil.ditolak, use_container_width=True)
+                elif not hasil.seimbang and not abaikan_timpang:
+                    st.error(f"""❌ Total Debit (Rp {ke_rupiah(hasil.total_debit):,.0f}) dan Kredit (Rp {ke_rupiah(hasil.total_kredit):,.0f}) 
+                        tidak seimbang. Impor dibatalkan.""")
+                elif hasil.data.empty:
+                    st.warning("⚠️ Tidak ada baris valid untuk diimpor.")
+                else:
+                    catat_jurnal_banyak(hasil.data)
+                    st.success(f"🎉 {len(hasil.data):,} pesanan berhasil diimpor!")
+
+    if st.session_state.jurnal:
+        jurnal = st.session_state.jurnal
+
+        st.subheader("📋 Daftar Pesanan Saat Ini")
+
+        # Saringan dan urutan diterapkan di server; hanya satu halaman yang dikirim
+        col1, col2, col3 = st.columns([2, 2, 1])
+        with col1:
+            cari = st.text_input("🔎 Cari (keterangan/akun/ref):", key="cari_jurnal", on_change=ke_halaman_pertama)
+        with col2:
+            akun_saring = st.multiselect("Akun:", jurnal.daftar_akun(), key="akun_jurnal", on_change=ke_halaman_pertama)
+        with col3:
+            baris_per_halaman = st.selectbox("Baris/halaman:", PILIHAN_BARIS_HALAMAN, index=1,
+                                             key="ukuran_jurnal", on_change=ke_halaman_pertama)
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            urutan = st.selectbox("Urutkan menurut:", list(URUTAN_JURNAL), key="urut_jurnal", on_change=ke_halaman_pertama)
+        with col2:
+            menurun = st.checkbox("Terbaru/terbesar dulu", key="menurun_jurnal", on_change=ke_halaman_pertama)
+        mulai, akhir = pilih_rentang_tanggal("rentang_jurnal", ikut_periode=False)
+
+        saringan = dict(cari=cari.strip(), akun=akun_saring, mulai=mulai, akhir=akhir,
+                        urut=URUTAN_JURNAL[urutan], menurun=menurun)
+        nomor_halaman = st.session_state.get("halaman_jurnal", 1)
+        with ukur("susun_dataframe"):
+            df_halaman, jumlah_cocok = jurnal.halaman((nomor_halaman - 1) * baris_per_halaman, baris_per_halaman, **saringan)
+        jumlah_halaman = max(1, -(-jumlah_cocok // baris_per_halaman))
+        if nomor_halaman > jumlah_halaman:
+            # Jurnal/saringan menyusut sejak halaman dipilih: pindah ke halaman terakhir
+            nomor_halaman = jumlah_halaman
+            with ukur("susun_dataframe"):
+                df_halaman, jumlah_cocok = jurnal.halaman((nomor_halaman - 1) * baris_per_halaman, baris_per_halaman, **saringan)
+        st.session_state.halaman_jurnal = nomor_halaman
+        st.number_input(f"Halaman (dari {jumlah_halaman:,}):", min_value=1, max_value=jumlah_halaman,
+                        step=1, key="halaman_jurnal")
+
+        awal = (nomor_halaman - 1) * baris_per_halaman
+        # Jurnal menyimpan sen; tabel dan editor menampilkan rupiah
+        df_halaman = frame_rupiah(df_halaman)
+        st.dataframe(df_halaman, use_container_width=True)
+        if jumlah_cocok:
+            st.caption(f"Baris {awal + 1:,}–{awal + len(df_halaman):,} dari {jumlah_cocok:,} pesanan"
+                       f" (seluruh jurnal: {len(jurnal):,})")
+        else:
+            st.caption("Tidak ada pesanan yang cocok dengan saringan.")
+
+        # Edit data (hanya baris di halaman ini)
+        with st.expander("✏️ Edit Pesanan (Klik untuk buka)"):
+            st.info("Ubah data halaman ini langsung di tabel bawah, lalu klik 'Simpan Perubahan'")
+            # Kunci ikut isi halaman supaya editan tidak terbawa ke halaman/saringan lain
+            kunci_editor = f"edit_jurnal_{jurnal.versi}_{hash(tuple(df_halaman.index))}"
+            df_edit = st.data_editor(df_halaman.astype({"Akun": str, "Ref": str}), num_rows="dynamic",
+                                     use_container_width=True, key=kunci_editor)
+
+            if st.button("💾 Simpan Perubahan Pesanan", use_container_width=True):
+                if catat_perubahan_jurnal(*perubahan_editor(kunci_editor, df_halaman, df_edit)):
+                    st.success("✅ Perubahan berhasil disimpan!")
+                    time.sleep(1)
+                    st.rerun()
+
+        # Summary
+        total_debit, total_kredit = jurnal.total_mutasi()
+
+        col1, col2 = st.columns(2)
+        col1.metric("📊 Total Debit", f"Rp {ke_rupiah(total_debit):,.0f}")
+        col2.metric("📈 Total Kredit", f"Rp {ke_rupiah(total_kredit):,.0f}")
+
+        if total_debit == total_kredit:
+            st.success("✅ **Buku Pesanan SEIMBANG!** Mantap! 🎉")
+        else:
+            st.error(f"❌ **Buku Pesanan TIDAK SEIMBANG!** Selisih: Rp {ke_rupiah(abs(total_debit - total_kredit)):,.0f}")
+
+    # Reset button
+    if st.session_state.jurnal:
+        st.markdown("---")
+        if st.button("🗑️ Reset Semua Buku Pesanan", type="secondary", use_container_width=True,
+                    help="HATI-HATI! Ini akan menghapus SEMUA catatan dan memulai dari awal!"):
+            with ubah_data_warung():
+                st.session_state.jurnal = st.session_state.warung.jurnal_baru()
+                # Backend SQLite: database warung ikut dikosongkan
+                st.session_state.jurnal.kosongkan()
+                st.session_state.periode = DaftarPeriode()
+                # Snapshot kosong (bukan hapus file) supaya kasir lain ikut memuat ulang
+                simpan_session_state()
+
+            st.success("♻️ Semua catatan pesanan telah direset.")
+            time.sleep(1)
+            st.rerun()
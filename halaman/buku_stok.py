@@ -0,0 +1,62 @@
+"""Halaman Buku Stok (Buku Besar)."""
+import streamlit as st
+
+from bagan_akun import SALDO_NORMAL_DEBIT
+from profil import ukur
+from sesi import pilih_rentang_tanggal
+from uang import frame_rupiah, ke_rupiah
+
+
+def tampilkan():
+    st.header("📚 Buku Stok (Buku Besar)")
+
+    if "jurnal" not in st.session_state or not st.session_state.jurnal:
+        st.info("📭 Buku Pesanan masih kosong. Silakan isi dulu di menu 'Buku Pesanan'.")
+    else:
+        akun_unik = st.session_state.jurnal.daftar_akun()
+
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            akun_dipilih = st.selectbox("🔍 Pilih Akun untuk Dilihat:", akun_unik)
+        with col2:
+            st.metric("Jumlah Akun", len(akun_unik))
+
+        mulai, akhir = pilih_rentang_tanggal("rentang_buku_stok", ikut_periode=False)
+        with ukur("susun_dataframe"):
+            df_akun = st.session_state.jurnal.mutasi_akun(akun_dipilih, mulai, akhir).copy()
+
+        df_akun["Mutasi Debit"] = df_akun["Debit"]
+        df_akun["Mutasi Kredit"] = df_akun["Kredit"]
+
+        # Logika Saldo Normal (dari bagan akun)
+        saldo_normal_debit = st.session_state.jurnal.info_akun(akun_dipilih)["saldo_normal"] == SALDO_NORMAL_DEBIT
+
+        # Saldo sebelum rentang dibaca dari indeks, bukan dijumlah ulang dari awal
+        saldo_awal = st.session_state.jurnal.saldo_akun_sebelum(akun_dipilih, mulai) if mulai is not None else 0
+        if not saldo_normal_debit:
+            saldo_awal = -saldo_awal
+
+        if saldo_normal_debit:
+            df_akun["Saldo"] = saldo_awal + (df_akun["Mutasi Debit"] - df_akun["Mutasi Kredit"]).cumsum()
+        else:
+            df_akun["Saldo"] = saldo_awal + (df_akun["Mutasi Kredit"] - df_akun["Mutasi Debit"]).cumsum()
+
+        # Saldo berjalan dihitung dalam sen; rupiah hanya untuk tampilan
+        df_tampil = frame_rupiah(df_akun, ("Mutasi Debit", "Mutasi Kredit", "Saldo"))
+
+        st.subheader(f"📊 Rincian Stok: **{akun_dipilih}**")
+        if mulai is not None:
+            st.caption(f"Saldo awal per {mulai:%d %b %Y}: Rp {ke_rupiah(saldo_awal):,.0f}")
+        st.dataframe(df_tampil[["Tanggal", "Keterangan", "Ref", "Mutasi Debit", "Mutasi Kredit", "Saldo"]], 
+                    use_container_width=True)
+
+        # Summary metrics
+        total_debit_bb = ke_rupiah(df_akun["Mutasi Debit"].sum())
+        total_kredit_bb = ke_rupiah(df_akun["Mutasi Kredit"].sum())
+        saldo_akhir = ke_rupiah(df_akun['Saldo'].iloc[-1] if not df_akun.empty else saldo_awal)
+
+        col1, col2, col3 = st.columns(3)
+        col1.metric("💵 Total Mutasi Debit", f"Rp {total_debit_bb:,.0f}")
+        col2.metric("💸 Total Mutasi Kredit", f"Rp {total_kredit_bb:,.0f}")
+        col3.metric("🏦 Saldo Akhir", f"Rp {saldo_akhir:,.0f}",
+                   delta="Debit" if saldo_akhir > 0 else "Kredit" if saldo_akhir < 0 else "Nol")
@@ -0,0 +1,79 @@
+"""Halaman Bungkus Bawa Pulang (unduh laporan Excel)."""
+import streamlit as st
+
+from ekspor_excel import ambil_pekerjaan, mulai_ekspor
+from sesi import nama_file_excel
+
+
+# Fungsi menampilkan kemajuan / hasil ekspor Excel di latar belakang
+def tampilkan_bungkusan(id_pekerjaan, pantau):
+    pekerjaan = ambil_pekerjaan(id_pekerjaan)
+    if pekerjaan is None:
+        return
+
+    if not pekerjaan.selesai:
+        st.progress(pekerjaan.persen, text=f"🔄 Lagi dibungkus, Mas/Mba... {pekerjaan.sheet_sekarang} "
+                                           f"({pekerjaan.sheet_ke + 1}/{pekerjaan.total_sheet})")
+        st.caption("Sambil menunggu, pesanan baru tetap bisa dicatat di Buku Pesanan.")
+        return
+
+    # Baru selesai: jalankan ulang seluruh halaman supaya pemantauan berhenti
+    if pantau:
+        st.rerun()
+
+    if pekerjaan.galat:
+        st.error(f"❌ Gagal membungkus: {pekerjaan.galat}")
+        return
+
+    filename = st.session_state.get("ekspor_nama_file", "laporan_keuangan.xlsx")
+    st.success(f"""✅ **BUNGKUSAN SIAP!**
+    \nFile '{filename}' berhasil dibuat dan siap diambil!""")
+
+    st.download_button(
+        label="📥 Klik di Sini untuk Ambil File Excel",
+        data=pekerjaan.data,
+        file_name=filename,
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        use_container_width=True
+    )
+
+    st.info("""
+    **📋 Yang termasuk dalam bungkusan:**
+    - 📝 Jurnal Umum (Buku Pesanan)
+    - 📚 Buku Besar (Buku Stok)  
+    - 🧮 Neraca Saldo (Hitung Setoran)
+    - 💰 Laporan Laba Rugi (Untung Rugi)
+    - 📈 Laporan Perubahan Modal
+    - 🏦 Laporan Posisi Keuangan (Harta Karun)
+    - 🌙 Jurnal Penutup
+    - ☀️ NSSP (Hitungan Besok Pagi)
+    """)
+
+
+def tampilkan():
+    st.title("📦 Bungkus Bawa Pulang (Unduh Data)")
+
+    st.info("""💾 Klik tombol di bawah untuk 'membungkus' semua laporan 
+        (dari Buku Pesanan sampai Hitungan Besok Pagi) dalam satu file Excel yang rapi.""")
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        if st.button("🎁 Siapkan Bungkusan Excel Lengkap", use_container_width=True):
+            if st.session_state.get("jurnal"):
+                # Dibungkus di thread pekerja: halaman lain tetap bisa dipakai
+                pekerjaan = mulai_ekspor(st.session_state.jurnal, periode=st.session_state.get("periode"))
+                st.session_state.ekspor_id = pekerjaan.id
+                st.session_state.ekspor_nama_file = nama_file_excel(st.session_state.jurnal.frame())
+            else:
+                st.warning("❌ Tidak ada pesanan di 'Buku Pesanan'. Belum ada yang bisa dibungkus.")
+
+        pekerjaan = ambil_pekerjaan(st.session_state.get("ekspor_id"))
+        if pekerjaan is not None:
+            # Selama masih dibungkus, hanya bagian ini yang diperbarui tiap detik
+            pantau = not pekerjaan.selesai
+            st.fragment(tampilkan_bungkusan, run_every=1 if pantau else None)(pekerjaan.id, pantau)
+
+    with col2:
+        st.metric("Status Data", 
+                 "Siap" if "jurnal" in st.session_state and st.session_state.jurnal else "Kosong",
+                 delta="Data tersedia" if "jurnal" in st.session_state and st.session_state.jurnal else "Tidak ada data")
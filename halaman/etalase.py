@@ -0,0 +1,107 @@
+"""Halaman Etalase Utama (beranda)."""
+import streamlit as st
+
+from sesi import laporan_berjalan, nilai_berjalan
+from uang import ke_rupiah
+
+
+def tampilkan():
+    st.title("🍛 Selamat Datang di Warteg Joma!")
+
+    # Header dengan animasi
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown("""
+            <div style='text-align: center; padding: 20px; background: linear-gradient(135deg, rgba(255,255,255,0.9), rgba(255,250,205,0.8)); 
+                     border-radius: 20px; border: 3px solid #FFA500; margin: 20px 0;'>
+                <h1 style='color: #006400; margin-bottom: 10px;'>WARTEG JOMA</h1>
+                <p style='color: #8B4513; font-size: 1.2em;'>Laporan Keuangan Digital yang Gampang & Cepat</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        st.subheader("📌 Tentang Warteg Joma")
+        st.markdown("""
+            <div style='background: rgba(255,255,255,0.8); padding: 20px; border-radius: 15px; border-left: 5px solid #FFA500;'>
+            Aplikasi ini ibarat **kasir pintar** untuk usaha warteg Anda. 
+            Dibuat agar UMKM bisa mencatat keuangan dengan **gampang, cepat, dan gak bikin pusing**.
+
+            **Fitur Unggulan:**
+            🧾 **Buku Pesanan** - Catat semua transaksi
+            💰 **Untung Rugi** - Lihat hasil jualan hari ini  
+            📦 **Bungkus** - Ambil laporan dalam Excel
+            🏦 **Harta Karun** - Cek kekayaan usaha
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col2:
+        st.subheader("🛠️ Panduan Masak Laporan")
+        with st.expander("📖 Buka Buku Resep (Petunjuk Lengkap)", expanded=True):
+            st.markdown("""
+                **1. 🧾 BUKU PESANAN (Jurnal Umum)**
+                - Catat semua transaksi: jual telur, beli pakan, bayar listrik
+                - **WAJIB:** Debit harus sama dengan Kredit!
+
+                **2. 📚 BUKU STOK (Buku Besar)**  
+                - Rincian uang keluar-masuk per akun
+                - Pantau pergerakan Kas, Utang, dll
+
+                **3. 🧮 HITUNG SETORAN (Neraca Saldo)**
+                - Daftar saldo akhir semua akun
+                - Harus SEIMBANG (balance)
+
+                **4. 💰 UNTUNG RUGI (Laba Rugi)**
+                - Pendapatan - Biaya = Untung/Rugi
+                - Tau langsung untung atau buntung
+
+                **5. 📈 MODAL MAJU MUNDUR**
+                - Modal awal + Untung - Prive = Modal akhir
+                - Lihat perkembangan modal usaha
+
+                **6. 🏦 HARTA KARUN (Posisi Keuangan)**
+                - Melihat semua aset (harta) dan kewajiban (utang + modal) perusahaan.
+
+                **7. 🌙 TUTUP WARUNG (Jurnal Penutup)** 
+                - Proses akhir bulan untuk 'mengnolkan' akun pendapatan/beban dan memindahkannya ke modal.
+
+                **8. ☀️ HITUNG BESOK PAGI (NSSP)** 
+                - Saldo akhir setelah 'Tutup Warung', siap untuk jualan besok (periode baru).
+
+                **9. 📦 BUNGKUS BAWA PULANG (Unduh Data)** 
+                - Ambil semua catatan tadi dalam 1 file Excel.
+                """)
+
+    # Metrics dashboard
+    st.markdown("---")
+    st.subheader("📊 Dashboard Cepat")
+
+    if "jurnal" in st.session_state and st.session_state.jurnal:
+        laporan = laporan_berjalan()
+        total_debit = ke_rupiah(laporan.total_debit)
+        total_kredit = ke_rupiah(laporan.total_kredit)
+        seimbang = laporan.total_debit == laporan.total_kredit
+        total_transaksi = len(st.session_state.jurnal)
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Total Transaksi", f"{total_transaksi}",
+                     help="Jumlah total transaksi yang tercatat")
+        with col2:
+            st.metric("Total Debit", f"Rp {total_debit:,.0f}",
+                     delta="Seimbang" if seimbang else "Tidak Seimbang")
+        with col3:
+            st.metric("Total Kredit", f"Rp {total_kredit:,.0f}",
+                     delta="Seimbang" if seimbang else "Tidak Seimbang")
+
+        # Dari graf nilai turunan: selalu sesuai jurnal terkini tanpa membuka halaman laporannya dulu
+        col4, col5 = st.columns(2)
+        with col4:
+            st.metric("🎯 Laba Bersih Periode Berjalan", f"Rp {ke_rupiah(nilai_berjalan('laba_bersih')):,.0f}")
+        with col5:
+            st.metric("🏦 Modal Akhir", f"Rp {ke_rupiah(nilai_berjalan('modal_akhir')):,.0f}")
+    else:
+        st.info("🔍 Mulai dengan mencatat transaksi pertama di menu 'Buku Pesanan'")
+
+    st.markdown("---")
+    st.success("✅ **SELAMAT DATANG!** Silakan pilih menu di sebelah kiri untuk mulai memasak laporan keuangan Anda!")
@@ -0,0 +1,114 @@
+"""Halaman Gabungan Cabang (laporan konsolidasi semua outlet)."""
+import os
+
+import pandas as pd
+import streamlit as st
+
+from konsolidasi import KOLOM_GABUNGAN, konsolidasikan, nama_outlet, perbandingan, perbandingan_akun
+from halaman import SEMUA_OUTLET
+from penyimpanan import daftar_buku, nama_folder_warung
+from uang import frame_rupiah, ke_rupiah
+
+
+def tabel_rupiah(df, kolom_nama):
+    # Semua kolom selain kolom nama adalah nominal sen per outlet
+    return frame_rupiah(df, [k for k in df.columns if k not in kolom_nama])
+
+
+def tampilkan():
+    st.header("🏪 Gabungan Cabang (Konsolidasi Outlet)")
+
+    # Hanya outlet yang boleh dilihat login ini (lihat DAFTAR_PENGGUNA di mesi.py)
+    izin = st.session_state.get("outlet_gabungan") or ()
+    if not izin:
+        st.error("🔒 Login ini tidak punya izin melihat gabungan outlet.")
+        return
+
+    # Setiap outlet adalah satu folder data warung di folder induk yang sama
+    folder_induk = os.path.dirname(st.session_state.warung.folder)
+    sumber = {nama_outlet(path): path for path in daftar_buku([folder_induk]) if os.path.isdir(path)}
+    if izin != SEMUA_OUTLET:
+        boleh = {nama_folder_warung(kode) for kode in ((izin,) if isinstance(izin, str) else izin)}
+        sumber = {nama: path for nama, path in sumber.items() if nama in boleh}
+    if not sumber:
+        st.info("📭 Belum ada data outlet yang bisa digabung.")
+        return
+
+    pilihan = st.multiselect("🏪 Outlet yang digabung:", list(sumber), default=list(sumber), key="gabungan_outlet")
+    samakan = st.checkbox("📅 Samakan rentang tanggal semua outlet", key="gabungan_samakan",
+                          help="Tanpa ini, setiap outlet memakai periode berjalannya sendiri.")
+    mulai = akhir = None
+    if samakan:
+        hari_ini = pd.Timestamp.today().normalize()
+        rentang = st.date_input("Rentang Tanggal:", value=(hari_ini.replace(day=1).date(), hari_ini.date()),
+                                key="gabungan_rentang")
+        if not isinstance(rentang, (tuple, list)):
+            rentang = (rentang,)
+        mulai = pd.Timestamp(rentang[0]) if len(rentang) > 0 else None
+        akhir = pd.Timestamp(rentang[1]) if len(rentang) > 1 else None
+
+    if st.button("🔄 Hitung Gabungan", disabled=not pilihan, use_container_width=True):
+        with st.spinner("🔄 Menghitung semua outlet..."):
+            st.session_state.gabungan_hasil = konsolidasikan([sumber[nama] for nama in pilihan], mulai=mulai, akhir=akhir)
+
+    hasil = st.session_state.get("gabungan_hasil")
+    if hasil is None:
+        st.caption("Pilih outlet lalu tekan **Hitung Gabungan**. Setiap outlet dihitung paralel di proses terpisah.")
+        return
+
+    for outlet in hasil.gagal:
+        st.warning(f"⚠️ Outlet **{outlet.nama}** tidak bisa dibaca: {outlet.galat}")
+    if hasil.gabungan is None:
+        return
+    laporan = hasil.gabungan
+
+    # Ringkasan gabungan
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("🏪 Outlet", len(hasil.outlet))
+    with col2:
+        st.metric("🎯 Laba Bersih Gabungan", f"Rp {ke_rupiah(laporan.laba_bersih):,.0f}")
+    with col3:
+        st.metric("📊 Total Harta Gabungan", f"Rp {ke_rupiah(laporan.total_aktiva):,.0f}")
+
+    mulai_outlet = {o.nama: o.mulai for o in hasil.outlet}
+    if len(set(mulai_outlet.values())) > 1:
+        st.caption("ℹ️ Laba rugi tiap outlet dihitung sejak awal periode berjalannya masing-masing: "
+                   + ", ".join(f"{nama} ({m:%d-%m-%Y})" if m is not None else f"{nama} (awal jurnal)"
+                               for nama, m in mulai_outlet.items()))
+
+    tab_banding, tab_laba, tab_posisi, tab_akun = st.tabs(
+        ["📊 Perbandingan Outlet", "💰 Laba Rugi Gabungan", "🏦 Posisi Keuangan Gabungan", "📋 Per Akun"]
+    )
+
+    with tab_banding:
+        st.dataframe(tabel_rupiah(perbandingan(hasil), ["Pos"]), use_container_width=True, hide_index=True)
+
+    with tab_laba:
+        st.markdown("#### 📈 Pendapatan")
+        st.dataframe(frame_rupiah(laporan.pendapatan_per_akun, ("Jumlah",)), use_container_width=True, hide_index=True)
+        st.markdown("#### 📉 Beban")
+        st.dataframe(frame_rupiah(laporan.beban_per_akun, ("Jumlah",)), use_container_width=True, hide_index=True)
+        st.metric("🎯 Laba/Rugi Bersih Gabungan", f"Rp {ke_rupiah(laporan.laba_bersih):,.0f}")
+
+    with tab_posisi:
+        def tabel_posisi(daftar, kolom_jenis):
+            return pd.DataFrame([(akun, ke_rupiah(nilai)) for akun, nilai in daftar], columns=[kolom_jenis, "Nilai (Rp)"])
+
+        st.markdown("#### 💰 Harta (Aktiva)")
+        st.dataframe(tabel_posisi(laporan.aktiva_lancar + laporan.aktiva_tetap, "Jenis Harta"),
+                     use_container_width=True, hide_index=True)
+        st.markdown("#### 💳 Utang & Modal (Pasiva)")
+        st.dataframe(tabel_posisi(laporan.kewajiban + [("Modal Akhir", laporan.modal_akhir)], "Jenis"),
+                     use_container_width=True, hide_index=True)
+        if laporan.total_aktiva == laporan.total_pasiva:
+            st.success(f"✅ **Gabungan seimbang!** Total Harta = Total Utang + Modal = "
+                       f"Rp {ke_rupiah(laporan.total_aktiva):,.0f}")
+        else:
+            st.error(f"❌ **Gabungan tidak seimbang!** Selisih: "
+                     f"Rp {abs(ke_rupiah(laporan.total_aktiva - laporan.total_pasiva)):,.0f}")
+
+    with tab_akun:
+        df_akun = perbandingan_akun(hasil)
+        st.dataframe(tabel_rupiah(df_akun, ["Kelompok", "Akun"]), use_container_width=True, hide_index=True)
+        st.caption(f"Kolom **{KOLOM_GABUNGAN}** adalah jumlah semua outlet yang dipilih.")
@@ -0,0 +1,66 @@
+"""Halaman Harta Karun (Laporan Posisi Keuangan)."""
+import pandas as pd
+import streamlit as st
+
+from sesi import laporan_berjalan, pilih_rentang_tanggal
+from uang import ke_rupiah
+
+
+def tampilkan():
+    st.header("🏦 Laporan Harta Karun (Posisi Keuangan/Neraca)")
+
+    if "jurnal" not in st.session_state or not st.session_state.jurnal:
+        st.info("📭 Buku Pesanan masih kosong. Harta karun belum bisa dilacak.")
+    else:
+        laporan = laporan_berjalan(*pilih_rentang_tanggal("rentang_neraca"))
+        modal_akhir_rp = ke_rupiah(laporan.modal_akhir)
+        total_aktiva = ke_rupiah(laporan.total_aktiva)
+        total_pasiva = ke_rupiah(laporan.total_pasiva)
+
+        def tabel_posisi(daftar, kolom_jenis):
+            return pd.DataFrame([(akun, ke_rupiah(nilai)) for akun, nilai in daftar], columns=[kolom_jenis, "Nilai (Rp)"])
+
+        # SISI AKTIVA
+        st.subheader("📦 SISI KIRI: HARTA (AKTIVA)")
+
+        st.markdown("#### 💰 Harta Lancar (Cepat Jadi Uang)")
+        if laporan.aktiva_lancar:
+            st.dataframe(tabel_posisi(laporan.aktiva_lancar, "Jenis Harta"), use_container_width=True)
+        else:
+            st.info("ℹ️ Tidak ada data Harta Lancar")
+
+        st.markdown("#### 🏠 Harta Tetap (Aset Jangka Panjang)")
+        if laporan.aktiva_tetap:
+            st.dataframe(tabel_posisi(laporan.aktiva_tetap, "Jenis Harta"), use_container_width=True)
+        else:
+            st.info("ℹ️ Tidak ada data Harta Tetap")
+
+        st.metric("📊 Total Harta (Aktiva)", f"Rp {total_aktiva:,.0f}")
+
+        st.markdown("---")
+
+        # SISI PASIVA
+        st.subheader("📋 SISI KANAN: UTANG & MODAL (PASIVA)")
+
+        st.markdown("#### 💳 Utang (Kewajiban)")
+        if laporan.kewajiban:
+            st.dataframe(tabel_posisi(laporan.kewajiban, "Jenis Utang"), use_container_width=True)
+        else:
+            st.info("ℹ️ Tidak ada data Utang")
+
+        st.markdown("#### 💼 Modal (Ekuitas)")
+        modal_data = [{"Jenis Modal": "Modal Akhir", "Nilai (Rp)": modal_akhir_rp}]
+        st.dataframe(pd.DataFrame(modal_data), use_container_width=True)
+
+        st.metric("📈 Total Utang + Modal (Pasiva)", f"Rp {total_pasiva:,.0f}")
+
+        # Balance check
+        st.markdown("---")
+        if laporan.total_aktiva == laporan.total_pasiva:
+            st.success(f"""✅ **HARTA KARUN SEIMBANG!** 
+                \nTotal Kekayaan: Rp {total_aktiva:,.0f}
+                \nSemua tercatat dengan benar! 🎉""")
+        else:
+            st.error(f"""❌ **HARTA KARUN TIDAK SEIMBANG!**
+                \n**Selisih:** Rp {abs(total_aktiva - total_pasiva):,.0f}
+                \nPeriksa kembali pencatatan transaksi! 🔍""")
@@ -0,0 +1,50 @@
+"""Halaman Hitung Setoran (Neraca Saldo)."""
+import pandas as pd
+import streamlit as st
+
+from sesi import laporan_berjalan, pilih_rentang_tanggal
+from uang import frame_rupiah, ke_rupiah
+
+
+def tampilkan():
+    st.header("🧮 Hitung Setoran (Neraca Saldo)")
+
+    if "jurnal" in st.session_state and st.session_state.jurnal:
+        laporan = laporan_berjalan(*pilih_rentang_tanggal("rentang_neraca_saldo"))
+        cols_neraca_saldo = ["Ref", "Akun", "Saldo Debit", "Saldo Kredit"]
+        df_saldo = laporan.neraca_saldo[cols_neraca_saldo]
+        seimbang = df_saldo["Saldo Debit"].sum() == df_saldo["Saldo Kredit"].sum()
+        df_saldo_tampil = frame_rupiah(df_saldo, ("Saldo Debit", "Saldo Kredit"))
+
+        total_debit_ns = ke_rupiah(df_saldo["Saldo Debit"].sum())
+        total_kredit_ns = ke_rupiah(df_saldo["Saldo Kredit"].sum())
+
+        total_row_ns = pd.DataFrame({
+            "Ref": ["**TOTAL SETORAN**"],
+            "Akun": [""],
+            "Saldo Debit": [total_debit_ns],
+            "Saldo Kredit": [total_kredit_ns]
+        })
+
+        df_saldo_tampil_final = pd.concat([df_saldo_tampil, total_row_ns], ignore_index=True)
+
+        st.subheader("📋 Daftar Saldo Akhir Semua Akun")
+        st.dataframe(df_saldo_tampil_final, use_container_width=True)
+
+        # Balance check dengan visual
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("💰 Total Debit", f"Rp {total_debit_ns:,.0f}")
+        with col2:
+            st.metric("💸 Total Kredit", f"Rp {total_kredit_ns:,.0f}")
+
+        if seimbang:
+            st.success("""🎉 **HITUNGAN SETORAN SEIMBANG!** 
+                \nSemua transaksi tercatat dengan benar. Lanjutkan! ✅""")
+        else:
+            st.error(f"""❌ **HITUNGAN SETORAN TIDAK SEIMBANG!**
+                \n**Selisih:** Rp {abs(total_debit_ns - total_kredit_ns):,.0f}
+                \nPeriksa kembali transaksi di Buku Pesanan!""")
+
+    else:
+        st.info("📭 Buku Pesanan masih kosong. Isi dulu transaksi di menu 'Buku Pesanan'.")
@@ -0,0 +1,53 @@
+"""Halaman Modal Maju Mundur (Laporan Perubahan Modal)."""
+import pandas as pd
+import streamlit as st
+
+from sesi import laporan_berjalan, pilih_rentang_tanggal
+from uang import ke_rupiah
+
+
+def tampilkan():
+    st.header("📈 Modal Maju Mundur (Perubahan Modal)")
+
+    if "jurnal" not in st.session_state or not st.session_state.jurnal:
+        st.info("📭 Buku Pesanan masih kosong. Modal belum bisa dihitung.")
+    else:
+        laporan = laporan_berjalan(*pilih_rentang_tanggal("rentang_perubahan_modal"))
+        laba_bersih = ke_rupiah(laporan.laba_bersih)
+        modal_awal = ke_rupiah(laporan.modal_awal)
+        total_prive = ke_rupiah(laporan.prive)
+        modal_akhir = ke_rupiah(laporan.modal_akhir)
+
+        # Tampilan dalam bentuk metrics
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.metric("💰 Modal Awal", f"Rp {modal_awal:,.0f}")
+        with col2:
+            st.metric("📊 Untung/Rugi", f"Rp {laba_bersih:,.0f}", 
+                     delta="Untung" if laba_bersih > 0 else "Rugi")
+        with col3:
+            st.metric("💸 Tarikan Prive", f"Rp {total_prive:,.0f}")
+        with col4:
+            st.metric("🏦 Modal Akhir", f"Rp {modal_akhir:,.0f}",
+                     delta=f"{((modal_akhir-modal_awal)/modal_awal*100 if modal_awal !=0 else 0):+.1f}%" if modal_awal != 0 else "Baru")
+
+        # Tabel rincian
+        st.subheader("📋 Rincian Perubahan Modal")
+        data_perubahan_modal = [
+            {"Keterangan": "Modal Awal (Setoran Awal)", "Jumlah (Rp)": modal_awal, "Tipe": "Awal"},
+            {"Keterangan": "Untung/Rugi Bersih", "Jumlah (Rp)": laba_bersih, "Tipe": "Penyesuaian"},
+            {"Keterangan": "Tarikan Pribadi (Prive)", "Jumlah (Rp)": total_prive * -1, "Tipe": "Pengurang"},
+            {"Keterangan": "Modal Akhir (Sekarang)", "Jumlah (Rp)": modal_akhir, "Tipe": "Akhir"}
+        ]
+        df_perubahan_modal = pd.DataFrame(data_perubahan_modal)
+        st.dataframe(df_perubahan_modal, use_container_width=True)
+
+        # Visualisasi progress
+        st.markdown("---")
+        st.subheader("📊 Progress Modal")
+
+        if modal_awal > 0:
+            progress = min((modal_akhir / (modal_awal * 2)) * 100, 100) if modal_awal > 0 else 0
+            st.progress(int(progress))
+            st.caption(f"Progress: {progress:.1f}% dari target 2x modal awal")
@@ -0,0 +1,84 @@
+"""Halaman Tutup Warung (Jurnal Penutup dan penutupan periode)."""
+import time
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from sesi import laporan_berjalan, simpan_session_state, ubah_data_warung
+from uang import frame_rupiah, ke_rupiah
+
+
+def tampilkan():
+    st.header("🌙 Proses Tutup Warung (Jurnal Penutup)")
+    st.info("""📋 Ini adalah jurnal otomatis untuk menutup akun pendapatan, beban, dan prive ke modal 
+        pada akhir periode akuntansi.""")
+
+    if "jurnal" not in st.session_state or not st.session_state.jurnal:
+        st.info("📭 Buku Pesanan masih kosong. Belum ada yang bisa ditutup.")
+    else:
+        laporan = laporan_berjalan()
+
+        if not laporan.jurnal_penutup.empty:
+            df_jp = laporan.jurnal_penutup
+            st.subheader("📋 Jurnal Penutup yang Dihasilkan")
+            st.dataframe(frame_rupiah(df_jp), use_container_width=True)
+
+            seimbang = df_jp["Debit"].sum() == df_jp["Kredit"].sum()
+            total_debit_jp = ke_rupiah(df_jp["Debit"].sum())
+            total_kredit_jp = ke_rupiah(df_jp["Kredit"].sum())
+
+            col1, col2 = st.columns(2)
+            col1.metric("💰 Total Debit Penutup", f"Rp {total_debit_jp:,.0f}")
+            col2.metric("💸 Total Kredit Penutup", f"Rp {total_kredit_jp:,.0f}")
+
+            if seimbang:
+                st.success("""✅ **JURNAL PENUTUP SEIMBANG**
+                    \nProses tutup warung berhasil dilakukan! 🎉""")
+            else:
+                st.error(f"""❌ **JURNAL PENUTUP TIDAK SEIMBANG**
+                    \n**Selisih:** Rp {abs(total_debit_jp - total_kredit_jp):,.2f}
+                    \nPeriksa kembali perhitungan! 🔍""")
+        else:
+            st.info("ℹ️ Tidak ada data pendapatan, beban, atau prive yang perlu ditutup.")
+
+        # --- Tutup periode: bekukan saldo NSSP sebagai saldo awal periode berikutnya ---
+        st.markdown("---")
+        st.subheader("🔒 Tutup Buku Periode")
+        periode = st.session_state.periode
+        mulai_periode = periode.mulai_berjalan
+        st.caption(f"Periode berjalan mulai: **{mulai_periode:%d-%m-%Y}**" if mulai_periode is not None
+                   else "Periode berjalan mulai: **awal Buku Pesanan**")
+
+        akhir_default = st.session_state.jurnal.batas_tanggal()[1]
+        if pd.isna(akhir_default) or (mulai_periode is not None and akhir_default < mulai_periode):
+            akhir_default = datetime.today()
+        akhir_periode = st.date_input("📅 Tutup sampai tanggal", value=akhir_default, key="akhir_periode")
+
+        if st.button("🔒 Tutup Periode Ini", use_container_width=True):
+            try:
+                with ubah_data_warung():
+                    tertutup = st.session_state.periode.tutup(st.session_state.jurnal, akhir_periode)
+                    simpan_session_state()
+            except ValueError as e:
+                st.error(f"❌ {e}")
+            else:
+                st.success(f"""✅ Periode sampai {tertutup.akhir:%d-%m-%Y} ditutup. 
+                    \nLaba bersih Rp {ke_rupiah(tertutup.laba_bersih):,.0f}, modal akhir Rp {ke_rupiah(tertutup.modal_akhir):,.0f} jadi saldo awal periode berikutnya.""")
+                time.sleep(1)
+                st.rerun()
+
+        if len(periode):
+            st.dataframe(pd.DataFrame([{
+                "Mulai": p.mulai.strftime("%d-%m-%Y") if p.mulai is not None else "Awal",
+                "Akhir": p.akhir.strftime("%d-%m-%Y"),
+                "Laba Bersih": ke_rupiah(p.laba_bersih),
+                "Modal Akhir": ke_rupiah(p.modal_akhir),
+                "Ditutup Pada": p.ditutup_pada.strftime("%d-%m-%Y %H:%M"),
+            } for p in periode.tertutup]), use_container_width=True)
+
+            if st.button("↩️ Buka Kembali Periode Terakhir", use_container_width=True):
+                with ubah_data_warung():
+                    st.session_state.periode.buka_kembali()
+                    simpan_session_state()
+                st.rerun()
@@ -0,0 +1,77 @@
+"""Halaman Untung Rugi (Laporan Laba Rugi)."""
+import streamlit as st
+
+from sesi import laporan_berjalan, pilih_rentang_tanggal
+from uang import frame_rupiah, ke_rupiah
+
+
+def tampilkan():
+    st.header("💰 Laporan Untung Rugi (Laba Rugi)")
+
+    if "jurnal" not in st.session_state or not st.session_state.jurnal:
+        st.info("📭 Buku Pesanan masih kosong. Belum bisa hitung untung rugi.")
+    else:
+        mulai, akhir = pilih_rentang_tanggal("rentang_laba_rugi")
+        laporan = laporan_berjalan(mulai, akhir)
+        if mulai is None and st.session_state.get("periode") is not None:
+            mulai = st.session_state.periode.mulai_berjalan
+
+        # Ambil semua pendapatan
+        total_pendapatan = ke_rupiah(laporan.total_pendapatan)
+        pendapatan_df = frame_rupiah(st.session_state.jurnal.baris_akun(laporan.akun_pendapatan, mulai, akhir))
+
+        # Ambil semua beban
+        total_beban = ke_rupiah(laporan.total_beban)
+        beban_df = frame_rupiah(st.session_state.jurnal.baris_akun(laporan.akun_beban, mulai, akhir))
+
+        laba_rugi_bersih = ke_rupiah(laporan.laba_bersih)
+
+        # Tampilan visual dengan columns
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric("📈 Total Pemasukan", f"Rp {total_pendapatan:,.0f}", 
+                     delta="Pendapatan" if total_pendapatan > 0 else None)
+
+        with col2:
+            st.metric("📉 Total Pengeluaran", f"Rp {total_beban:,.0f}",
+                     delta="Beban" if total_beban > 0 else None, delta_color="inverse")
+
+        with col3:
+            if laba_rugi_bersih >= 0:
+                st.metric("🎯 Hasil Akhir", f"Rp {laba_rugi_bersih:,.0f}", 
+                         delta="UNTUNG", delta_color="normal")
+            else:
+                st.metric("🎯 Hasil Akhir", f"Rp {laba_rugi_bersih:,.0f}", 
+                         delta="RUGI", delta_color="off")
+
+        # Detail pendapatan
+        with st.expander("📊 Detail Pemasukan", expanded=True):
+            if not pendapatan_df.empty:
+                st.dataframe(pendapatan_df[["Tanggal", "Akun", "Keterangan", "Kredit", "Debit"]], 
+                            use_container_width=True)
+            else:
+                st.info("ℹ️ Belum ada data pendapatan")
+
+        # Detail beban
+        with st.expander("📋 Detail Pengeluaran", expanded=True):
+            if not beban_df.empty:
+                st.dataframe(beban_df[["Tanggal", "Akun", "Keterangan", "Debit", "Kredit"]], 
+                            use_container_width=True)
+            else:
+                st.info("ℹ️ Belum ada data beban")
+
+        # Kesimpulan
+        st.markdown("---")
+        if laba_rugi_bersih > 0:
+            st.success(f"""🎉 **SELAMAT! USAHA UNTUNG**
+                \n**Keuntungan Bersih:** Rp {laba_rugi_bersih:,.0f}
+                \nLanjutkan strategi yang sudah berjalan! ✅""")
+        elif laba_rugi_bersih < 0:
+            st.error(f"""⚠️ **PERHATIAN! USAHA RUGI**
+                \n**Kerugian Bersih:** Rp {abs(laba_rugi_bersih):,.0f}
+                \nPeriksa pengeluaran dan tingkatkan penjualan! 🔍""")
+        else:
+            st.warning("""⚖️ **BREAK EVEN**
+                \nPendapatan sama dengan pengeluaran.
+                \nButuh peningkatan penjualan untuk mendapat untung! 📈""")
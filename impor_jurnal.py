@@ -0,0 +1,221 @@
+"""Impor banyak transaksi sekaligus dari file CSV atau Excel (.xlsx).
+
+File dibaca per potongan (``UKURAN_POTONGAN`` baris) dan setiap potongan
+diperiksa secara vektor: nama kolom, tanggal, akun, ref, dan nominal. Baris
+yang lolos dikumpulkan menjadi satu DataFrame sehingga seluruh batch bisa
+dicatat ke jurnal dengan satu kali ``extend`` dan satu kali penyimpanan.
+Nominal di file ditulis dalam rupiah dan langsung diubah ke sen (int64).
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from buku_jurnal import KOLOM_JURNAL
+from uang import ke_sen_array
+
+UKURAN_POTONGAN = 50000
+
+# Jumlah baris ditolak yang dirinci di hasil impor (sisanya hanya dihitung)
+BATAS_RINCIAN_DITOLAK = 200
+
+# Nama kolom yang dikenali (huruf kecil) -> kolom jurnal
+_ALIAS_KOLOM = {
+    "tanggal": "Tanggal", "tgl": "Tanggal", "date": "Tanggal",
+    "keterangan": "Keterangan", "deskripsi": "Keterangan", "uraian": "Keterangan", "description": "Keterangan",
+    "akun": "Akun", "nama akun": "Akun", "account": "Akun",
+    "ref": "Ref", "no ref": "Ref", "nomor ref": "Ref", "kode akun": "Ref", "kode": "Ref",
+    "debit": "Debit",
+    "kredit": "Kredit", "credit": "Kredit",
+}
+
+KOLOM_WAJIB = ["Tanggal", "Akun", "Ref"]
+
+
+@dataclass
+class HasilImpor:
+    """Baris valid siap dicatat beserta ringkasan pemeriksaannya."""
+
+    data: pd.DataFrame = None
+    jumlah_baris: int = 0
+    jumlah_ditolak: int = 0
+    ditolak: pd.DataFrame = None      # Baris (nomor di file), Alasan
+    total_debit: int = 0              # sen
+    total_kredit: int = 0
+    galat: str = ""                   # Kesalahan yang membatalkan seluruh impor
+    peringatan: list = field(default_factory=list)
+
+    @property
+    def seimbang(self):
+        return self.total_debit == self.total_kredit
+
+
+# --- Pembacaan per potongan ---
+def _potongan_csv(berkas):
+    # Ekspor kasir berlocale Indonesia sering memakai titik koma sebagai pemisah
+    baris_pertama = berkas.readline()
+    berkas.seek(0)
+    if isinstance(baris_pertama, bytes):
+        baris_pertama = baris_pertama.decode("utf-8", errors="ignore")
+    pemisah = ";" if baris_pertama.count(";") > baris_pertama.count(",") else ","
+    return pd.read_csv(berkas, dtype=str, keep_default_na=False, chunksize=UKURAN_POTONGAN, sep=pemisah)
+
+
+def _potongan_xlsx(berkas):
+    """Membaca sheet pertama secara read-only, UKURAN_POTONGAN baris sekali jalan."""
+    # openpyxl hanya diimpor jika memang ada file Excel yang dibaca
+    from openpyxl import load_workbook
+
+    wb = load_workbook(berkas, read_only=True, data_only=True)
+    try:
+        baris = wb.worksheets[0].iter_rows(values_only=True)
+        header = next(baris, None)
+        if header is None:
+            return
+        header = [str(h) if h is not None else "" for h in header]
+        potongan = []
+        for b in baris:
+            potongan.append(b)
+            if len(potongan) == UKURAN_POTONGAN:
+                yield pd.DataFrame(potongan, columns=header, dtype=object)
+                potongan = []
+        if potongan:
+            yield pd.DataFrame(potongan, columns=header, dtype=object)
+    finally:
+        wb.close()
+
+
+def baca_potongan(berkas, nama_berkas):
+    """Generator DataFrame mentah per potongan; jenis file dari ekstensi nama_berkas."""
+    if nama_berkas.lower().endswith(".xlsx"):
+        return _potongan_xlsx(berkas)
+    return _potongan_csv(berkas)
+
+
+# --- Pemeriksaan ---
+def _samakan_kolom(df):
+    df = df.rename(columns=lambda k: _ALIAS_KOLOM.get(str(k).strip().lower(), k))
+    return df.loc[:, ~df.columns.duplicated()]
+
+
+def _cek_kolom(df):
+    kurang = [k for k in KOLOM_WAJIB if k not in df]
+    if "Debit" not in df and "Kredit" not in df:
+        kurang.append("Debit/Kredit")
+    if kurang:
+        return f"Kolom wajib tidak ditemukan: {', '.join(kurang)}. Kolom di file: {', '.join(map(str, df.columns))}"
+    return ""
+
+
+def _teks(kolom):
+    """Teks rapi; sel angka bulat dari Excel (101.0) ditulis tanpa desimal."""
+    hasil = kolom.astype(object).where(kolom.notna(), "").astype(str).str.strip()
+    sel_angka = kolom.map(type).isin([int, float])
+    if sel_angka.any():
+        angka = pd.to_numeric(kolom[sel_angka], errors="coerce")
+        bulat = angka[angka.notna() & (angka == np.floor(angka))]
+        hasil[bulat.index] = bulat.astype("int64").astype(str)
+    return hasil
+
+
+def _tanggal(kolom):
+    """ISO (2024-01-31) lebih dulu, sisanya dibaca dengan hari di depan (31/01/2024)."""
+    tanggal = pd.to_datetime(kolom, errors="coerce", format="ISO8601")
+    sisa = tanggal.isna() & kolom.notna()
+    if sisa.any():
+        tanggal[sisa] = pd.to_datetime(kolom[sisa], errors="coerce", format="mixed", dayfirst=True)
+    return tanggal.dt.normalize()
+
+
+def _nominal(df, nama):
+    """Nominal rupiah di file sebagai sen (int64), beserta penanda sel yang bukan angka."""
+    if nama not in df:
+        return pd.Series(0, index=df.index, dtype=np.int64), pd.Series(False, index=df.index)
+    teks = df[nama].astype(object).where(df[nama].notna(), "").astype(str)
+    teks = teks.str.replace(r"^\s*Rp\.?\s*", "", regex=True).str.strip()
+    kosong = teks == ""
+    angka = pd.to_numeric(teks.where(~kosong, "0"), errors="coerce")
+    return pd.Series(ke_sen_array(angka), index=df.index), angka.isna()
+
+
+def periksa_potongan(df, baris_awal, mulai=None):
+    """Memeriksa satu potongan; mengembalikan (baris valid, baris ditolak beserta alasannya).
+
+    Baris bertanggal sebelum ``mulai`` (periode yang sudah ditutup) ikut ditolak.
+    """
+    tanggal = _tanggal(df["Tanggal"])
+    akun = _teks(df["Akun"])
+    ref = _teks(df["Ref"])
+    debit, debit_salah = _nominal(df, "Debit")
+    kredit, kredit_salah = _nominal(df, "Kredit")
+
+    sudah_ditutup = tanggal < mulai if mulai is not None else pd.Series(False, index=df.index)
+
+    # Urutan menentukan alasan yang dilaporkan jika satu baris punya beberapa masalah
+    masalah = [
+        (tanggal.isna(), "Tanggal tidak terbaca"),
+        (sudah_ditutup, "Tanggal masuk periode yang sudah ditutup"),
+        (akun == "", "Nama Akun kosong"),
+        (ref == "", "Nomor Ref kosong"),
+        (debit_salah | kredit_salah, "Debit/Kredit bukan angka"),
+        ((debit < 0) | (kredit < 0), "Debit/Kredit negatif"),
+        ((debit == 0) & (kredit == 0), "Debit dan Kredit sama-sama nol"),
+    ]
+    ditolak = np.logical_or.reduce([m.to_numpy() for m, _ in masalah])
+    alasan = np.select([m.to_numpy() for m, _ in masalah], [a for _, a in masalah], default="")
+
+    valid = ~ditolak
+    data = pd.DataFrame({
+        "Tanggal": tanggal[valid],
+        "Keterangan": _teks(df["Keterangan"])[valid] if "Keterangan" in df else "",
+        "Akun": akun[valid],
+        "Ref": ref[valid],
+        "Debit": debit[valid],
+        "Kredit": kredit[valid],
+    }, columns=KOLOM_JURNAL)
+
+    # Nomor baris seperti di file: baris 1 adalah header
+    nomor = np.arange(baris_awal, baris_awal + len(df)) + 2
+    tolak = pd.DataFrame({"Baris": nomor[ditolak], "Alasan": alasan[ditolak]})
+    return data, tolak
+
+
+def impor_berkas(berkas, nama_berkas, mulai=None):
+    """Membaca dan memeriksa seluruh file; hasilnya belum dicatat ke jurnal."""
+    hasil = HasilImpor()
+    bagian_valid, bagian_ditolak = [], []
+    try:
+        for df in baca_potongan(berkas, nama_berkas):
+            df = _samakan_kolom(df)
+            if hasil.jumlah_baris == 0:
+                hasil.galat = _cek_kolom(df)
+                if hasil.galat:
+                    return hasil
+
+            data, tolak = periksa_potongan(df.reset_index(drop=True), hasil.jumlah_baris, mulai)
+            hasil.jumlah_baris += len(df)
+            hasil.jumlah_ditolak += len(tolak)
+            bagian_valid.append(data)
+            if sum(map(len, bagian_ditolak)) < BATAS_RINCIAN_DITOLAK:
+                bagian_ditolak.append(tolak)
+    except (ValueError, KeyError, OSError) as e:
+        hasil.galat = f"File tidak bisa dibaca: {e}"
+        return hasil
+
+    if hasil.jumlah_baris == 0:
+        hasil.galat = "File tidak berisi baris transaksi."
+        return hasil
+
+    hasil.data = pd.concat(bagian_valid, ignore_index=True)
+    hasil.ditolak = pd.concat(bagian_ditolak, ignore_index=True).head(BATAS_RINCIAN_DITOLAK)
+    hasil.total_debit = int(hasil.data["Debit"].sum())
+    hasil.total_kredit = int(hasil.data["Kredit"].sum())
+
+    # Tanggal yang debit dan kreditnya tidak sama (biasanya transaksi terpotong)
+    per_tanggal = hasil.data.groupby("Tanggal")[["Debit", "Kredit"]].sum()
+    timpang = per_tanggal[per_tanggal["Debit"] != per_tanggal["Kredit"]]
+    if len(timpang):
+        daftar = ", ".join(t.strftime("%Y-%m-%d") for t in timpang.index[:10])
+        lebih = f" (+{len(timpang) - 10} lainnya)" if len(timpang) > 10 else ""
+        hasil.peringatan.append(f"Debit dan Kredit tidak seimbang pada tanggal: {daftar}{lebih}")
+    return hasil
@@ -0,0 +1,100 @@
+"""Jurnal warteg sintetis untuk benchmark dan uji beban.
+
+Setiap transaksi dicatat berpasangan (satu baris debit, satu baris kredit),
+jadi jurnal selalu seimbang. Isinya meniru pembukuan warteg: setoran modal,
+penjualan harian, belanja bahan (tunai dan utang), beban operasional,
+pelunasan utang, prive, pembelian peralatan, dan penyusutan setiap akhir bulan.
+Debit/Kredit dalam sen (int64), sama seperti isi ``BukuJurnal``.
+"""
+import numpy as np
+import pandas as pd
+
+from buku_jurnal import KOLOM_JURNAL
+from uang import SEN_PER_RUPIAH
+
+# Rata-rata transaksi per hari: jurnal besar menjadi riwayat bertahun-tahun, bukan satu hari yang padat.
+# Rentang tanggal minimal satu bulan supaya selalu ada penyusutan akhir bulan.
+TRANSAKSI_PER_HARI = 150
+
+MODAL_AWAL = 50_000_000
+PENYUSUTAN_BULANAN = 250_000
+
+# Jenis transaksi acak: (keterangan, (akun debit, ref), (akun kredit, ref), bobot, nominal min, nominal max)
+# Nominal dalam rupiah, dibulatkan ke kelipatan Rp500.
+_JENIS_TRANSAKSI = [
+    ("Penjualan nasi rames", ("Kas", "101"), ("Pendapatan Usaha", "401"), 80, 10_000, 60_000),
+    ("Belanja bahan di pasar", ("Beban Bahan Baku", "501"), ("Kas", "101"), 4, 100_000, 400_000),
+    ("Ambil bahan dari agen (utang)", ("Beban Bahan Baku", "501"), ("Utang Usaha", "201"), 1, 200_000, 800_000),
+    ("Bayar gaji pelayan", ("Beban Gaji", "502"), ("Kas", "101"), 0.5, 100_000, 300_000),
+    ("Bayar sewa tempat", ("Beban Sewa", "503"), ("Kas", "101"), 0.1, 1_000_000, 2_000_000),
+    ("Bayar listrik", ("Beban Listrik", "504"), ("Kas", "101"), 0.5, 50_000, 200_000),
+    ("Beli gas elpiji", ("Beban Gas", "505"), ("Kas", "101"), 2, 20_000, 100_000),
+    ("Bayar air", ("Beban Air", "506"), ("Kas", "101"), 0.5, 20_000, 100_000),
+    ("Cicil utang agen", ("Utang Usaha", "201"), ("Kas", "101"), 0.8, 200_000, 800_000),
+    ("Ambil uang pribadi", ("Prive", "310"), ("Kas", "101"), 0.5, 50_000, 500_000),
+    ("Beli peralatan dapur", ("Peralatan", "121"), ("Kas", "101"), 0.1, 100_000, 3_000_000),
+    ("Tambahan modal", ("Kas", "101"), ("Modal", "300"), 0.05, 1_000_000, 5_000_000),
+]
+
+_SETORAN_MODAL = ("Setoran modal awal", ("Kas", "101"), ("Modal", "300"))
+_PENYUSUTAN = ("Penyusutan peralatan", ("Beban Penyusutan Peralatan", "507"),
+               ("Akumulasi Penyusutan Peralatan", "122"))
+
+
+def buat_jurnal_sintetis(jumlah_baris, seed=0, mulai="2024-01-01"):
+    """DataFrame jurnal (KOLOM_JURNAL) sebanyak ``jumlah_baris`` (dibulatkan ke bawah ke bilangan genap).
+
+    ``seed`` yang sama selalu menghasilkan jurnal yang sama.
+    """
+    rng = np.random.default_rng(seed)
+    mulai = pd.Timestamp(mulai).normalize()
+    jumlah_transaksi = max(int(jumlah_baris) // 2, 1)
+    jumlah_hari = max(31, -(-jumlah_transaksi // TRANSAKSI_PER_HARI))
+
+    # Transaksi tetap: setoran modal di hari pertama, penyusutan di setiap akhir bulan
+    akhir_bulan = pd.date_range(mulai, mulai + pd.Timedelta(days=jumlah_hari - 1), freq="ME")
+    akhir_bulan = akhir_bulan[:max(jumlah_transaksi - 1, 0)]
+    jumlah_acak = jumlah_transaksi - 1 - len(akhir_bulan)
+
+    bobot = np.array([j[3] for j in _JENIS_TRANSAKSI], dtype=np.float64)
+    jenis = rng.choice(len(_JENIS_TRANSAKSI), size=jumlah_acak, p=bobot / bobot.sum())
+    nominal_min = np.array([j[4] for j in _JENIS_TRANSAKSI])[jenis] // 500
+    nominal_max = np.array([j[5] for j in _JENIS_TRANSAKSI])[jenis] // 500
+    nominal = rng.integers(nominal_min, nominal_max + 1) * 500
+    hari = rng.integers(0, jumlah_hari, size=jumlah_acak)
+
+    daftar = _JENIS_TRANSAKSI + [_SETORAN_MODAL + (0, 0, 0), _PENYUSUTAN + (0, 0, 0)]
+    jenis = np.concatenate([[len(daftar) - 2], np.full(len(akhir_bulan), len(daftar) - 1), jenis])
+    nominal = np.concatenate([[MODAL_AWAL], np.full(len(akhir_bulan), PENYUSUTAN_BULANAN), nominal])
+    nominal = nominal.astype(np.int64) * SEN_PER_RUPIAH
+    tanggal = np.concatenate([
+        [mulai.to_datetime64()],
+        akhir_bulan.to_numpy(),
+        (mulai + pd.to_timedelta(hari, unit="D")).to_numpy(),
+    ]).astype("datetime64[s]")
+
+    # Urut tanggal; setoran modal tetap transaksi pertama
+    urutan = np.argsort(tanggal, kind="stable")
+    jenis, nominal, tanggal = jenis[urutan], nominal[urutan], tanggal[urutan]
+
+    keterangan = np.array([j[0] for j in daftar], dtype=object)[jenis]
+    akun_debit = np.array([j[1][0] for j in daftar], dtype=object)[jenis]
+    ref_debit = np.array([j[1][1] for j in daftar], dtype=object)[jenis]
+    akun_kredit = np.array([j[2][0] for j in daftar], dtype=object)[jenis]
+    ref_kredit = np.array([j[2][1] for j in daftar], dtype=object)[jenis]
+
+    def selang(debit, kredit):
+        # Baris debit di posisi genap, pasangan kreditnya tepat di bawahnya
+        hasil = np.empty(len(jenis) * 2, dtype=np.asarray(debit).dtype)
+        hasil[0::2], hasil[1::2] = debit, kredit
+        return hasil
+
+    nol = np.zeros(len(jenis), dtype=np.int64)
+    return pd.DataFrame({
+        "Tanggal": selang(tanggal, tanggal),
+        "Keterangan": selang(keterangan, keterangan),
+        "Akun": selang(akun_debit, akun_kredit),
+        "Ref": selang(ref_debit, ref_kredit),
+        "Debit": selang(nominal, nol),
+        "Kredit": selang(nol, nominal),
+    }, columns=KOLOM_JURNAL)
@@ -0,0 +1,419 @@
+"""Backend jurnal di file SQLite lokal (opsional).
+
+``JurnalSQLite`` punya antarmuka yang sama dengan ``BukuJurnal`` tetapi
+datanya tinggal di disk, bukan di ``st.session_state``. Laporan memakai
+query agregat yang dibantu indeks pada akun, tanggal, dan ref, sehingga
+jurnal bisa lebih besar dari RAM dan tetap ada setelah aplikasi restart.
+Debit/Kredit disimpan sebagai INTEGER dalam sen, sama seperti ``BukuJurnal``.
+Total per (akun, ref) dipelihara trigger di tabel ``saldo_akun``, jadi neraca
+saldo seluruh jurnal cukup membaca satu baris per akun.
+"""
+import json
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+from bagan_akun import klasifikasi
+from buku_jurnal import KOLOM_JURNAL, sidik_frame
+
+_SKEMA = """
+CREATE TABLE IF NOT EXISTS jurnal (
+    id INTEGER PRIMARY KEY,
+    tanggal TEXT NOT NULL,
+    keterangan TEXT NOT NULL DEFAULT '',
+    akun TEXT NOT NULL,
+    ref TEXT NOT NULL,
+    debit INTEGER NOT NULL DEFAULT 0,
+    kredit INTEGER NOT NULL DEFAULT 0
+);
+-- Buku besar: baris satu akun urut tanggal; debit/kredit ikut di indeks supaya
+-- saldo akun sebelum suatu tanggal cukup membaca indeks (covering)
+DROP INDEX IF EXISTS idx_jurnal_akun_tanggal;
+CREATE INDEX IF NOT EXISTS idx_jurnal_akun_tanggal_nilai ON jurnal (akun, tanggal, debit, kredit);
+-- Neraca saldo: GROUP BY akun, ref cukup membaca indeks (covering)
+CREATE INDEX IF NOT EXISTS idx_jurnal_akun_ref ON jurnal (akun, ref, debit, kredit);
+CREATE INDEX IF NOT EXISTS idx_jurnal_tanggal ON jurnal (tanggal);
+CREATE INDEX IF NOT EXISTS idx_jurnal_ref ON jurnal (ref);
+-- Bagan akun: tipe dan saldo normal ditentukan sekali saat akun pertama dicatat
+CREATE TABLE IF NOT EXISTS akun (
+    id INTEGER PRIMARY KEY,
+    nama TEXT NOT NULL UNIQUE,
+    tipe TEXT NOT NULL,
+    saldo_normal TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (kunci TEXT PRIMARY KEY, nilai INTEGER NOT NULL);
+-- Neraca saldo berjalan: jumlah baris dan total per (akun, ref), diperbarui trigger
+-- pada setiap INSERT/UPDATE/DELETE jurnal dalam transaksi yang sama
+CREATE TABLE IF NOT EXISTS saldo_akun (
+    akun TEXT NOT NULL,
+    ref TEXT NOT NULL,
+    banyak INTEGER NOT NULL DEFAULT 0,
+    debit INTEGER NOT NULL DEFAULT 0,
+    kredit INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (akun, ref)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS saldo_akun_tambah AFTER INSERT ON jurnal BEGIN
+    INSERT OR IGNORE INTO saldo_akun (akun, ref) VALUES (NEW.akun, NEW.ref);
+    UPDATE saldo_akun SET banyak = banyak + 1, debit = debit + NEW.debit, kredit = kredit + NEW.kredit
+        WHERE akun = NEW.akun AND ref = NEW.ref;
+END;
+CREATE TRIGGER IF NOT EXISTS saldo_akun_hapus AFTER DELETE ON jurnal BEGIN
+    UPDATE saldo_akun SET banyak = banyak - 1, debit = debit - OLD.debit, kredit = kredit - OLD.kredit
+        WHERE akun = OLD.akun AND ref = OLD.ref;
+    DELETE FROM saldo_akun WHERE akun = OLD.akun AND ref = OLD.ref AND banyak = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS saldo_akun_ubah AFTER UPDATE OF akun, ref, debit, kredit ON jurnal BEGIN
+    UPDATE saldo_akun SET banyak = banyak - 1, debit = debit - OLD.debit, kredit = kredit - OLD.kredit
+        WHERE akun = OLD.akun AND ref = OLD.ref;
+    DELETE FROM saldo_akun WHERE akun = OLD.akun AND ref = OLD.ref AND banyak = 0;
+    INSERT OR IGNORE INTO saldo_akun (akun, ref) VALUES (NEW.akun, NEW.ref);
+    UPDATE saldo_akun SET banyak = banyak + 1, debit = debit + NEW.debit, kredit = kredit + NEW.kredit
+        WHERE akun = NEW.akun AND ref = NEW.ref;
+END;
+INSERT OR IGNORE INTO meta (kunci, nilai) VALUES ('versi', 0);
+"""
+
+_TAMBAH_BARIS = "INSERT INTO jurnal (tanggal, keterangan, akun, ref, debit, kredit) VALUES (?, ?, ?, ?, ?, ?)"
+
+# Kolom jurnal -> kolom tabel untuk ORDER BY/UPDATE (hanya nama dari daftar ini yang masuk ke SQL)
+_KOLOM_DB = {
+    "Tanggal": "tanggal", "Keterangan": "keterangan", "Akun": "akun",
+    "Ref": "ref", "Debit": "debit", "Kredit": "kredit",
+}
+
+_PILIH_KOLOM = (
+    "SELECT tanggal AS Tanggal, keterangan AS Keterangan, akun AS Akun, "
+    "ref AS Ref, debit AS Debit, kredit AS Kredit FROM jurnal"
+)
+
+
+def _ke_sen(nilai):
+    angka = pd.to_numeric(nilai, errors="coerce")
+    return 0 if pd.isna(angka) else int(round(angka))
+
+
+def _ke_baris_db(baris):
+    tanggal = pd.Timestamp(baris.get("Tanggal"))
+    return (
+        "" if pd.isna(tanggal) else tanggal.strftime("%Y-%m-%d"),
+        str(baris.get("Keterangan") or ""),
+        str(baris.get("Akun") or ""),
+        str(baris.get("Ref") or ""),
+        _ke_sen(baris.get("Debit")),
+        _ke_sen(baris.get("Kredit")),
+    )
+
+
+def _frame_ke_baris_db(df):
+    """Versi vektor dari _ke_baris_db untuk satu DataFrame sekaligus."""
+    def teks(nama):
+        if nama not in df:
+            return [""] * len(df)
+        return df[nama].astype(object).where(df[nama].notna(), "").astype(str).tolist()
+
+    def sen(nama):
+        if nama not in df:
+            return [0] * len(df)
+        angka = pd.to_numeric(df[nama], errors="coerce").fillna(0)
+        return angka.round().astype(np.int64).tolist()
+
+    tanggal = pd.to_datetime(df["Tanggal"], errors="coerce").dt.strftime("%Y-%m-%d").fillna("").tolist()
+    return list(zip(tanggal, teks("Keterangan"), teks("Akun"), teks("Ref"), sen("Debit"), sen("Kredit")))
+
+
+def _ke_nilai_db(kolom, nilai):
+    """Nilai satu sel hasil edit dalam bentuk kolom tabel."""
+    if kolom == "Tanggal":
+        tanggal = pd.Timestamp(nilai)
+        return "" if pd.isna(tanggal) else tanggal.strftime("%Y-%m-%d")
+    if kolom in ("Debit", "Kredit"):
+        return _ke_sen(nilai)
+    return "" if nilai is None or (isinstance(nilai, float) and pd.isna(nilai)) else str(nilai)
+
+
+def _syarat_tanggal(mulai, akhir):
+    """Klausa 'tanggal' untuk rentang inklusif beserta parameternya."""
+    syarat, params = [], []
+    if mulai is not None:
+        syarat.append("tanggal >= ?")
+        params.append(pd.Timestamp(mulai).strftime("%Y-%m-%d"))
+    if akhir is not None:
+        syarat.append("tanggal <= ?")
+        params.append(pd.Timestamp(akhir).strftime("%Y-%m-%d"))
+    return syarat, params
+
+
+def _rapikan(df):
+    """Menyamakan tipe kolom hasil query dengan BukuJurnal.frame()."""
+    df["Tanggal"] = pd.to_datetime(df["Tanggal"], errors="coerce")
+    for kolom in ("Akun", "Ref"):
+        df[kolom] = df[kolom].astype("category")
+    for kolom in ("Debit", "Kredit"):
+        df[kolom] = df[kolom].astype(np.int64)
+    return df
+
+
+class JurnalSQLite:
+    """Jurnal umum yang disimpan di SQLite dengan indeks akun, tanggal, dan ref."""
+
+    # Data sudah tahan restart; tidak perlu log jurnal / snapshot pickle
+    persisten = True
+
+    def __init__(self, path):
+        self.path = path
+        self._buka()
+
+    def _buka(self):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SKEMA)
+        self._migrasi()
+        self._cache_frame = (None, None)
+        self._cache_sidik = (None, None)
+        with self._conn:
+            self._akun_dikenal = {r[0] for r in self._conn.execute("SELECT nama FROM akun")}
+            # Database lama (sebelum ada tabel akun): daftarkan akun yang sudah dipakai
+            self._daftarkan_akun(r[0] for r in self._conn.execute("SELECT DISTINCT akun FROM jurnal"))
+
+    def _migrasi(self):
+        """Menyesuaikan database lama sekali saja (ditandai di tabel meta).
+
+        ``nominal_sen``: nominal rupiah REAL diubah ke sen. ``saldo_akun``: tabel
+        saldo berjalan diisi dari seluruh jurnal (trigger hanya mencatat perubahan
+        sesudah tabel itu ada).
+        """
+        with self._conn:
+            # BEGIN IMMEDIATE: proses lain yang membuka file yang sama menunggu, jadi tidak ada yang mengubah dua kali
+            self._conn.execute("BEGIN IMMEDIATE")
+            sudah = {r[0] for r in self._conn.execute("SELECT kunci FROM meta")}
+            if "nominal_sen" not in sudah:
+                self._conn.execute(
+                    "UPDATE jurnal SET debit = CAST(ROUND(debit * 100) AS INTEGER), "
+                    "kredit = CAST(ROUND(kredit * 100) AS INTEGER)"
+                )
+                self._conn.execute("INSERT INTO meta (kunci, nilai) VALUES ('nominal_sen', 1)")
+                self._conn.execute("UPDATE meta SET nilai = nilai + 1 WHERE kunci = 'versi'")
+            if "saldo_akun" not in sudah:
+                self._conn.execute("DELETE FROM saldo_akun")
+                self._conn.execute(
+                    "INSERT INTO saldo_akun (akun, ref, banyak, debit, kredit) "
+                    "SELECT akun, ref, COUNT(*), SUM(debit), SUM(kredit) FROM jurnal GROUP BY akun, ref"
+                )
+                self._conn.execute("INSERT INTO meta (kunci, nilai) VALUES ('saldo_akun', 1)")
+
+    def _daftarkan_akun(self, nama_akun):
+        """Mendaftarkan akun baru ke tabel akun; dipanggil di dalam transaksi tulis."""
+        baru = set(nama_akun) - self._akun_dikenal
+        if baru:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO akun (nama, tipe, saldo_normal) VALUES (?, ?, ?)",
+                ((nama, *klasifikasi(nama)) for nama in sorted(baru)),
+            )
+            self._akun_dikenal |= baru
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    def _tulis(self, baris_db, hapus_dulu=False):
+        with self._lock, self._conn:
+            if hapus_dulu:
+                self._conn.execute("DELETE FROM jurnal")
+            self._daftarkan_akun(b[2] for b in baris_db)
+            self._conn.executemany(_TAMBAH_BARIS, baris_db)
+            self._conn.execute("UPDATE meta SET nilai = nilai + 1 WHERE kunci = 'versi'")
+
+    # --- Penambahan / penggantian data ---
+    def append(self, baris):
+        self.extend([baris])
+
+    def extend(self, daftar_baris):
+        if isinstance(daftar_baris, pd.DataFrame):
+            self._tulis(_frame_ke_baris_db(daftar_baris))
+        else:
+            self._tulis([_ke_baris_db(b) for b in daftar_baris])
+
+    def kosongkan(self):
+        self._tulis([], hapus_dulu=True)
+
+    def terapkan_perubahan(self, ubah=None, tambah=None, hapus=None):
+        """Menerapkan hasil edit per baris dalam satu transaksi; mengembalikan id baris baru.
+
+        ``ubah`` adalah {id: {kolom: nilai baru}}, ``tambah`` daftar baris (dict)
+        baru, ``hapus`` daftar id. Hanya kolom yang berubah yang di-UPDATE.
+        """
+        id_baru = []
+        with self._lock, self._conn:
+            for id_baris, perubahan in (ubah or {}).items():
+                perubahan = {k: _ke_nilai_db(k, v) for k, v in perubahan.items() if k in _KOLOM_DB}
+                if not perubahan:
+                    continue
+                if "Akun" in perubahan:
+                    self._daftarkan_akun([perubahan["Akun"]])
+                kolom = ", ".join(f"{_KOLOM_DB[k]} = ?" for k in perubahan)
+                self._conn.execute(f"UPDATE jurnal SET {kolom} WHERE id = ?", [*perubahan.values(), int(id_baris)])
+            self._conn.executemany("DELETE FROM jurnal WHERE id = ?", [(int(i),) for i in hapus or []])
+            baris_db = [_ke_baris_db(b) for b in tambah or []]
+            self._daftarkan_akun(b[2] for b in baris_db)
+            for b in baris_db:
+                id_baru.append(self._conn.execute(_TAMBAH_BARIS, b).lastrowid)
+            self._conn.execute("UPDATE meta SET nilai = nilai + 1 WHERE kunci = 'versi'")
+        return id_baru
+
+    def ada_baris_sebelum(self, id_baris, tanggal):
+        """True jika ada baris dengan id di ``id_baris`` yang bertanggal sebelum ``tanggal``."""
+        id_baris = [int(i) for i in id_baris]
+        if not id_baris:
+            return False
+        with self._lock:
+            return bool(self._conn.execute(
+                "SELECT EXISTS (SELECT 1 FROM jurnal WHERE tanggal < ? AND tanggal <> '' "
+                "AND id IN (SELECT value FROM json_each(?)))",
+                (pd.Timestamp(tanggal).strftime("%Y-%m-%d"), json.dumps(id_baris)),
+            ).fetchone()[0])
+
+    # --- Pembacaan ---
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jurnal").fetchone()[0]
+
+    @property
+    def versi(self):
+        with self._lock:
+            return self._conn.execute("SELECT nilai FROM meta WHERE kunci = 'versi'").fetchone()[0]
+
+    def frame(self):
+        """Seluruh jurnal sebagai DataFrame (di-cache per versi)."""
+        versi = self.versi
+        if self._cache_frame[0] != versi:
+            df = _rapikan(self._query(_PILIH_KOLOM + " ORDER BY id"))
+            self._cache_frame = (versi, df[KOLOM_JURNAL])
+        return self._cache_frame[1]
+
+    def sidik(self):
+        """Sidik isi jurnal untuk kunci cache lintas sesi (dihitung ulang hanya jika versi berubah)."""
+        versi = self.versi
+        if self._cache_sidik[0] != versi:
+            self._cache_sidik = (versi, sidik_frame(self.frame()))
+        return self._cache_sidik[1]
+
+    def total_mutasi(self):
+        """(total Debit, total Kredit) seluruh jurnal, dalam sen (dari tabel saldo_akun)."""
+        with self._lock:
+            debit, kredit = self._conn.execute("SELECT SUM(debit), SUM(kredit) FROM saldo_akun").fetchone()
+        return int(debit or 0), int(kredit or 0)
+
+    def halaman(self, awal, ukuran, cari="", akun=None, mulai=None, akhir=None, urut=None, menurun=False):
+        """Satu halaman jurnal dengan WHERE/ORDER BY/LIMIT di SQLite: (DataFrame, jumlah baris cocok).
+
+        Indeks DataFrame adalah id baris (dipakai lagi oleh ``terapkan_perubahan``).
+        """
+        syarat, params = _syarat_tanggal(mulai, akhir)
+        if akun:
+            syarat.append(f"akun IN ({', '.join('?' * len(akun))})")
+            params += list(akun)
+        if cari:
+            pola = "%" + cari.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            syarat.append("(" + " OR ".join(f"{k} LIKE ? ESCAPE '\\'" for k in ("keterangan", "akun", "ref")) + ")")
+            params += [pola] * 3
+        where = ("WHERE " + " AND ".join(syarat)) if syarat else ""
+
+        arah = "DESC" if menurun else "ASC"
+        if urut is None:
+            order = f"id {arah}"
+        else:
+            # Tanggal kosong ('') tetap di akhir seperti NaT di BukuJurnal
+            kolom = _KOLOM_DB[urut]
+            kosong = "tanggal = '', " if urut == "Tanggal" else ""
+            order = f"{kosong}{kolom} {arah}, id"
+
+        with self._lock:
+            jumlah = self._conn.execute(f"SELECT COUNT(*) FROM jurnal {where}", params).fetchone()[0]
+        df = self._query(
+            f"SELECT id, {_PILIH_KOLOM[len('SELECT '):]} {where} ORDER BY {order} LIMIT ? OFFSET ?",
+            params + [ukuran, awal],
+        )
+        return _rapikan(df.set_index("id").rename_axis("ID"))[KOLOM_JURNAL], jumlah
+
+    def daftar_akun(self):
+        """Nama akun urut kemunculan pertama berdasarkan tanggal."""
+        with self._lock:
+            return [r[0] for r in self._conn.execute(
+                "SELECT akun FROM jurnal GROUP BY akun ORDER BY MIN(tanggal), MIN(id)"
+            )]
+
+    def info_akun(self, akun):
+        """ID, tipe, dan saldo normal akun dari tabel akun."""
+        with self._lock:
+            id_akun, nama, tipe, normal = self._conn.execute(
+                "SELECT id, nama, tipe, saldo_normal FROM akun WHERE nama = ?", (akun,)
+            ).fetchone()
+        return {"id": id_akun, "nama": nama, "tipe": tipe, "saldo_normal": normal}
+
+    def saldo_per_akun(self, mulai=None, akhir=None):
+        """Total Debit dan Kredit per (Akun, Ref) dari indeks, digabung dengan tipe akunnya.
+
+        ``mulai``/``akhir`` (inklusif) membatasi transaksi yang dijumlahkan. Tanpa
+        rentang, total dibaca langsung dari tabel saldo_akun.
+        """
+        syarat, params = _syarat_tanggal(mulai, akhir)
+        if syarat:
+            sumber = (
+                "SELECT akun AS Akun, ref AS Ref, SUM(debit) AS Debit, SUM(kredit) AS Kredit "
+                f"FROM jurnal WHERE {' AND '.join(syarat)} GROUP BY akun, ref"
+            )
+        else:
+            sumber = "SELECT akun AS Akun, ref AS Ref, debit AS Debit, kredit AS Kredit FROM saldo_akun"
+        df = self._query(
+            "SELECT a.id AS ID, s.Akun, s.Ref, s.Debit, s.Kredit, a.tipe AS Tipe, a.saldo_normal AS Normal "
+            f"FROM ({sumber}) AS s "
+            "JOIN akun AS a ON a.nama = s.Akun ORDER BY s.Akun, s.Ref",
+            params,
+        )
+        return df.astype({"Debit": np.int64, "Kredit": np.int64})
+
+    def mutasi_akun(self, akun, mulai=None, akhir=None):
+        """Baris jurnal satu akun dalam rentang tanggal, urut tanggal (untuk buku besar)."""
+        syarat, params = _syarat_tanggal(mulai, akhir)
+        where = " AND ".join(["akun = ?"] + syarat)
+        return _rapikan(self._query(_PILIH_KOLOM + f" WHERE {where} ORDER BY tanggal, id", [akun] + params))
+
+    def baris_akun(self, daftar_akun, mulai=None, akhir=None):
+        """Baris jurnal untuk beberapa akun sekaligus, urut sesuai pencatatan."""
+        daftar_akun = list(daftar_akun)
+        if not daftar_akun:
+            return _rapikan(self._query(_PILIH_KOLOM + " WHERE 0"))
+        syarat, params = _syarat_tanggal(mulai, akhir)
+        tanda = ", ".join("?" * len(daftar_akun))
+        where = " AND ".join([f"akun IN ({tanda})"] + syarat)
+        return _rapikan(self._query(_PILIH_KOLOM + f" WHERE {where} ORDER BY id", daftar_akun + params))
+
+    def saldo_akun_sebelum(self, akun, tanggal):
+        """Debit - Kredit akun dari semua baris bertanggal sebelum ``tanggal`` (dari indeks)."""
+        with self._lock:
+            return int(self._conn.execute(
+                "SELECT COALESCE(SUM(debit) - SUM(kredit), 0) FROM jurnal "
+                "WHERE akun = ? AND tanggal < ? AND tanggal <> ''",
+                (akun, pd.Timestamp(tanggal).strftime("%Y-%m-%d")),
+            ).fetchone()[0])
+
+    def batas_tanggal(self):
+        """(tanggal pertama, tanggal terakhir) yang terisi, atau (None, None)."""
+        with self._lock:
+            awal, akhir = self._conn.execute(
+                "SELECT MIN(tanggal), MAX(tanggal) FROM jurnal WHERE tanggal <> ''"
+            ).fetchone()
+        if awal is None:
+            return None, None
+        return pd.Timestamp(awal), pd.Timestamp(akhir)
+
+    # --- Pickle: cukup simpan lokasi file ---
+    def __getstate__(self):
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.path = state["path"]
+        self._buka()
@@ -0,0 +1,207 @@
+"""Laporan gabungan beberapa outlet warteg.
+
+Setiap outlet punya buku sendiri (folder data warung, database, atau file
+impor; lihat ``penyimpanan.muat_buku``). Buku tiap outlet dimuat dan
+diagregasi di proses pekerja terpisah, jadi outlet-outlet dihitung paralel
+dan jurnalnya tidak pernah masuk ke proses pemanggil: yang dikirim balik
+hanya tabel saldo per (Akun, Ref), satu baris per akun. Tabel-tabel itu
+dijumlahkan dengan ``jumlah_saldo`` lalu disusun dengan ``susun_laporan``
+yang sama seperti laporan satu outlet, jadi angka gabungan dan angka per
+outlet selalu dihitung dengan aturan yang sama.
+
+Transaksi antar-outlet (misalnya kiriman bahan dari dapur pusat) tidak
+dieliminasi; pendapatan dan beban seperti itu ikut terjumlah di laporan gabungan.
+"""
+import multiprocessing
+import os
+import sys
+import threading
+import types
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+
+from laporan import jumlah_saldo, saldo_laporan, susun_laporan
+from penyimpanan import muat_buku
+
+# Jumlah proses pekerja konsolidasi (bawaan: jumlah CPU), dipakai bersama semua sesi
+PEKERJA_KONSOLIDASI = int(os.environ.get("WARTEG_PEKERJA_KONSOLIDASI", "0")) or os.cpu_count() or 1
+
+KOLOM_GABUNGAN = "Gabungan"
+
+
+@dataclass
+class SaldoOutlet:
+    """Hasil agregasi satu outlet di proses pekerja."""
+
+    nama: str
+    sumber: str
+    saldo: pd.DataFrame = None     # Saldo per (Akun, Ref) seperti saldo_laporan, dalam sen
+    baris: int = 0                 # Baris jurnal yang dimuat (dari snapshot Parquet hanya yang dibutuhkan saldo)
+    mulai: pd.Timestamp = None     # Awal transaksi yang dijumlahkan (None: sejak awal jurnal)
+    galat: str = ""
+
+
+@dataclass
+class HasilKonsolidasi:
+    """Laporan per outlet dan laporan gabungannya."""
+
+    outlet: list = field(default_factory=list)    # SaldoOutlet yang berhasil, urut seperti sumbernya
+    laporan: dict = field(default_factory=dict)   # nama outlet -> HasilLaporan
+    gabungan: object = None                       # HasilLaporan gabungan; None jika tidak ada outlet yang berhasil
+    gagal: list = field(default_factory=list)     # SaldoOutlet yang gagal dimuat
+
+
+def nama_outlet(path):
+    return os.path.splitext(os.path.basename(os.path.normpath(path)))[0]
+
+
+def saldo_outlet(path, mulai=None, akhir=None):
+    """Saldo satu outlet (dijalankan di proses pekerja); kesalahan dicatat di hasil, bukan dilempar."""
+    hasil = SaldoOutlet(nama_outlet(path), path)
+    try:
+        jurnal, periode = muat_buku(path, hanya_saldo=True, mulai=mulai)
+        hasil.saldo = saldo_laporan(jurnal, periode, mulai, akhir)
+        hasil.baris = len(jurnal)
+        if mulai is not None:
+            hasil.mulai = pd.Timestamp(mulai).normalize()
+        elif periode is not None:
+            hasil.mulai = periode.mulai_berjalan
+    except Exception as e:
+        hasil.galat = f"{type(e).__name__}: {e}"
+    return hasil
+
+
+# --- Process pool ---
+_pelaksana = None
+_lock_pelaksana = threading.Lock()
+
+
+def _pool():
+    """Process pool bersama, dibuat saat pertama dipakai.
+
+    Memakai 'spawn' (bukan fork) supaya aman dibuat dari server Streamlit yang
+    menjalankan banyak thread; biaya start proses hanya dibayar sekali.
+    """
+    global _pelaksana
+    with _lock_pelaksana:
+        if _pelaksana is None:
+            _pelaksana = ProcessPoolExecutor(
+                max_workers=PEKERJA_KONSOLIDASI, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pelaksana
+
+
+@contextmanager
+def _tanpa_modul_utama():
+    # Pekerja 'spawn' menjalankan ulang modul __main__ saat start; di bawah Streamlit
+    # itu skrip aplikasi (mesi.py), jadi diganti modul kosong selama pekerja dibuat
+    utama = sys.modules.get("__main__")
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = utama
+
+
+def _saldo_paralel(daftar_sumber, mulai, akhir):
+    global _pelaksana
+    try:
+        # map mengirim semua tugas (dan membuat proses pekerja) sebelum kembali
+        with _tanpa_modul_utama():
+            hasil = _pool().map(saldo_outlet, daftar_sumber, repeat(mulai), repeat(akhir))
+        return list(hasil)
+    except BrokenProcessPool:
+        # Proses pekerja mati (misalnya kehabisan memori): pool dibuat ulang pada pemanggilan berikutnya
+        with _lock_pelaksana:
+            _pelaksana = None
+        raise
+
+
+# --- Konsolidasi ---
+def konsolidasikan(daftar_sumber, tanggal_tutup=None, mulai=None, akhir=None, paralel=True):
+    """Laporan setiap outlet di ``daftar_sumber`` beserta laporan gabungannya.
+
+    ``mulai``/``akhir`` berlaku untuk semua outlet seperti di ``hitung_laporan``;
+    tanpa rentang, setiap outlet memakai periode berjalannya sendiri.
+    """
+    if paralel and len(daftar_sumber) > 1:
+        daftar = _saldo_paralel(daftar_sumber, mulai, akhir)
+    else:
+        daftar = [saldo_outlet(path, mulai, akhir) for path in daftar_sumber]
+    return gabungkan(daftar, tanggal_tutup)
+
+
+def gabungkan(daftar_outlet, tanggal_tutup=None):
+    """HasilKonsolidasi dari SaldoOutlet yang sudah dihitung; outlet bergalat dicatat di ``gagal``."""
+    hasil = HasilKonsolidasi()
+    for outlet in daftar_outlet:
+        if outlet.galat:
+            hasil.gagal.append(outlet)
+            continue
+        # Dua sumber bisa bernama sama (misalnya toko.db dan folder toko)
+        nama, ke = outlet.nama, 1
+        while nama in hasil.laporan or nama == KOLOM_GABUNGAN:
+            ke += 1
+            nama = f"{outlet.nama} ({ke})"
+        outlet.nama = nama
+        hasil.outlet.append(outlet)
+        hasil.laporan[nama] = susun_laporan(outlet.saldo, tanggal_tutup)
+
+    if hasil.outlet:
+        hasil.gabungan = susun_laporan(jumlah_saldo([o.saldo for o in hasil.outlet]), tanggal_tutup)
+    return hasil
+
+
+# --- Perbandingan antar outlet ---
+def _ringkasan(laporan):
+    return {
+        "Total Pendapatan": laporan.total_pendapatan,
+        "Total Beban": laporan.total_beban,
+        "Laba Bersih": laporan.laba_bersih,
+        "Prive": laporan.prive,
+        "Modal Akhir": laporan.modal_akhir,
+        "Total Harta (Aktiva)": laporan.total_aktiva,
+        "Total Utang": sum(nilai for _, nilai in laporan.kewajiban),
+        "Total Utang + Modal (Pasiva)": laporan.total_pasiva,
+    }
+
+
+def _nilai_per_akun(laporan):
+    nilai = {}
+    for kelompok, df in (("Pendapatan", laporan.pendapatan_per_akun), ("Beban", laporan.beban_per_akun)):
+        for akun, jumlah in df[["Akun", "Jumlah"]].itertuples(index=False):
+            nilai[(kelompok, akun)] = int(jumlah)
+    for kelompok, daftar in (
+        ("Harta Lancar", laporan.aktiva_lancar), ("Harta Tetap", laporan.aktiva_tetap), ("Utang", laporan.kewajiban),
+    ):
+        for akun, jumlah in daftar:
+            nilai[(kelompok, akun)] = int(jumlah)
+    return nilai
+
+
+def _tabel(hasil, fungsi, nama_indeks):
+    """Kolom ``nama_indeks`` (dari kunci hasil ``fungsi``) lalu satu kolom per outlet dan Gabungan."""
+    kolom = {nama: fungsi(laporan) for nama, laporan in hasil.laporan.items()}
+    kolom[KOLOM_GABUNGAN] = fungsi(hasil.gabungan)
+    # Urutan baris mengikuti Gabungan (memuat semua akun), lalu akun yang hanya ada di outlet lain
+    urutan = list(dict.fromkeys(k for nilai in (kolom[KOLOM_GABUNGAN], *kolom.values()) for k in nilai))
+    df = pd.DataFrame(urutan, columns=nama_indeks)
+    for nama, nilai in kolom.items():
+        df[nama] = np.array([nilai.get(k, 0) for k in urutan], dtype=np.int64)
+    return df
+
+
+def perbandingan(hasil):
+    """Ringkasan Laba Rugi dan Posisi Keuangan berdampingan: satu kolom per outlet plus Gabungan (sen)."""
+    return _tabel(hasil, _ringkasan, ["Pos"])
+
+
+def perbandingan_akun(hasil):
+    """Nilai per akun (Pendapatan, Beban, Harta, Utang) berdampingan per outlet plus Gabungan (sen)."""
+    return _tabel(hasil, _nilai_per_akun, ["Kelompok", "Akun"])
@@ -0,0 +1,281 @@
+"""Mesin laporan keuangan warteg.
+
+Semua laporan (neraca saldo, laba rugi, perubahan modal, posisi keuangan,
+jurnal penutup, dan NSSP) dihitung dari SATU tabel saldo per (Akun, Ref)
+hasil ``jurnal.saldo_per_akun()``. Penggolongan akun memakai kolom Tipe dari
+bagan akun, jadi tidak ada pencocokan teks nama akun di sini. Halaman
+Streamlit dan ``simpan_semua_ke_excel`` sama-sama memakai ``hitung_laporan`` supaya
+angkanya selalu konsisten dan tidak ada halaman yang bergantung pada
+halaman lain sudah dibuka lebih dulu. Semua nominal dalam sen (int), sama
+seperti jurnal; pengubahan ke rupiah hanya dilakukan saat ditampilkan.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from bagan_akun import (
+    ASET_LANCAR,
+    ASET_TETAP,
+    BEBAN,
+    KEWAJIBAN,
+    MODAL,
+    PENDAPATAN,
+    PRIVE,
+    TIPE_NOMINAL,
+    klasifikasi,
+)
+
+AKUN_IKHTISAR = "Ikhtisar Laba Rugi"
+AKUN_MODAL = "Modal"
+REF_MODAL = "300"
+
+
+@dataclass
+class HasilLaporan:
+    """Semua laporan keuangan dari satu kali agregasi jurnal."""
+
+    neraca_saldo: pd.DataFrame      # Ref, Akun, Debit, Kredit, Saldo Debit, Saldo Kredit
+    total_debit: int
+    total_kredit: int
+
+    akun_pendapatan: list
+    akun_beban: list
+    pendapatan_per_akun: pd.DataFrame  # Akun, Jumlah
+    beban_per_akun: pd.DataFrame       # Akun, Jumlah
+    total_pendapatan: int
+    total_beban: int
+    laba_bersih: int
+
+    modal_awal: int
+    prive: int
+    modal_akhir: int
+
+    aktiva_lancar: list   # [(akun, nilai)]
+    aktiva_tetap: list
+    kewajiban: list
+    total_aktiva: int
+    total_pasiva: int
+
+    jurnal_penutup: pd.DataFrame    # Tanggal, Keterangan, Akun, Debit, Kredit
+    nssp: pd.DataFrame              # Ref, Akun, Debit, Kredit
+
+
+def _per_akun(saldo, arah):
+    """Saldo bersih per ID akun; arah=1 untuk Debit-Kredit, -1 untuk Kredit-Debit."""
+    hasil = saldo.groupby("ID", sort=False).agg(Akun=("Akun", "first"), Jumlah=("Saldo", "sum"))
+    hasil["Jumlah"] *= arah
+    return hasil.sort_values(by="Akun")[["Akun", "Jumlah"]].reset_index(drop=True)
+
+
+def _posisi(saldo, tipe, arah):
+    """Daftar (akun, nilai) untuk satu golongan posisi keuangan, urut Ref."""
+    df = saldo[saldo["Tipe"] == tipe]
+    df = df.groupby("ID", sort=False).agg(Akun=("Akun", "first"), Ref=("Ref", "first"), Saldo=("Saldo", "sum"))
+    df = df[df["Saldo"] != 0].sort_values(by=["Ref", "Akun"])
+    return [(akun, int(nilai) * arah) for akun, nilai in zip(df["Akun"], df["Saldo"])]
+
+
+def _lengkapi_tipe(saldo):
+    """Menambahkan kolom ID/Tipe jika tabel saldo tidak berasal dari bagan akun."""
+    if "Tipe" not in saldo:
+        saldo["Tipe"] = [klasifikasi(akun)[0] for akun in saldo["Akun"]]
+    if "ID" not in saldo:
+        saldo["ID"] = pd.factorize(saldo["Akun"])[0]
+    return saldo
+
+
+def _jurnal_penutup(pendapatan, beban, laba_bersih, prive, tanggal):
+    entri = []
+
+    def tambah(keterangan, akun_debit, akun_kredit, jumlah):
+        entri.append({"Tanggal": tanggal, "Keterangan": keterangan, "Akun": akun_debit, "Debit": jumlah, "Kredit": 0})
+        entri.append({"Tanggal": tanggal, "Keterangan": keterangan, "Akun": akun_kredit, "Debit": 0, "Kredit": jumlah})
+
+    # 1. Menutup Pendapatan
+    for akun, jumlah in pendapatan.itertuples(index=False):
+        if jumlah > 0:
+            tambah(f"Penutupan {akun}", akun, AKUN_IKHTISAR, jumlah)
+
+    # 2. Menutup Beban
+    for akun, jumlah in beban.itertuples(index=False):
+        if jumlah > 0:
+            tambah(f"Penutupan {akun}", AKUN_IKHTISAR, akun, jumlah)
+
+    # 3. Menutup Ikhtisar Laba Rugi ke Modal
+    if laba_bersih > 0:
+        tambah("Penutupan Laba Bersih", AKUN_IKHTISAR, AKUN_MODAL, laba_bersih)
+    elif laba_bersih < 0:
+        tambah("Penutupan Rugi Bersih", AKUN_MODAL, AKUN_IKHTISAR, abs(laba_bersih))
+
+    # 4. Menutup Prive
+    if prive > 0:
+        tambah("Penutupan Prive", AKUN_MODAL, "Prive", prive)
+
+    return pd.DataFrame(entri, columns=["Tanggal", "Keterangan", "Akun", "Debit", "Kredit"])
+
+
+def _nssp(saldo, permanen, modal, modal_akhir):
+    """Saldo akun permanen; semua akun modal digabung menjadi satu baris Modal Akhir."""
+    df = saldo[permanen & ~modal]
+    baris_modal = saldo[modal].head(1)
+    ref_modal, akun_modal = (
+        (baris_modal["Ref"].iloc[0], baris_modal["Akun"].iloc[0]) if len(baris_modal) else (REF_MODAL, AKUN_MODAL)
+    )
+
+    nssp = pd.DataFrame({
+        "Ref": df["Ref"].to_numpy(),
+        "Akun": df["Akun"].to_numpy(),
+        "Debit": np.where(df["Saldo"] >= 0, df["Saldo"], 0),
+        "Kredit": np.where(df["Saldo"] < 0, -df["Saldo"], 0),
+    })
+    if len(baris_modal) or modal_akhir != 0:
+        nssp.loc[len(nssp)] = [
+            ref_modal, akun_modal,
+            abs(modal_akhir) if modal_akhir < 0 else 0,
+            modal_akhir if modal_akhir >= 0 else 0,
+        ]
+    return nssp.sort_values(by="Ref").reset_index(drop=True)
+
+
+def susun_laporan(saldo_akun, tanggal_tutup=None):
+    """Menyusun HasilLaporan dari tabel saldo per (Akun, Ref) berkolom Debit dan Kredit.
+
+    Kolom ID dan Tipe dari bagan akun dipakai jika ada; jika tidak, akun
+    diklasifikasi sekali per baris tabel saldo (bukan per baris jurnal).
+    """
+    if tanggal_tutup is None:
+        tanggal_tutup = datetime.today().strftime("%Y-%m-%d")
+
+    saldo = _lengkapi_tipe(saldo_akun.reset_index(drop=True))
+    saldo["Saldo"] = saldo["Debit"] - saldo["Kredit"]
+    tipe = saldo["Tipe"]
+
+    # --- NERACA SALDO ---
+    neraca_saldo = saldo.assign(**{
+        "Saldo Debit": np.where(saldo["Saldo"] > 0, saldo["Saldo"], 0),
+        "Saldo Kredit": np.where(saldo["Saldo"] < 0, -saldo["Saldo"], 0),
+    }).sort_values(by="Ref")[["Ref", "Akun", "Debit", "Kredit", "Saldo Debit", "Saldo Kredit"]]
+
+    # --- LABA RUGI ---
+    pendapatan_per_akun = _per_akun(saldo[tipe == PENDAPATAN], -1)
+    beban_per_akun = _per_akun(saldo[tipe == BEBAN], 1)
+    total_pendapatan = int(pendapatan_per_akun["Jumlah"].sum())
+    total_beban = int(beban_per_akun["Jumlah"].sum())
+    laba_bersih = total_pendapatan - total_beban
+
+    # --- PERUBAHAN MODAL ---
+    modal = tipe == MODAL
+    modal_awal = -int(saldo.loc[modal, "Saldo"].sum())
+    prive = int(saldo.loc[tipe == PRIVE, "Saldo"].sum())
+    modal_akhir = modal_awal + laba_bersih - prive
+
+    # --- POSISI KEUANGAN ---
+    aktiva_lancar = _posisi(saldo, ASET_LANCAR, 1)
+    aktiva_tetap = _posisi(saldo, ASET_TETAP, 1)
+    kewajiban = _posisi(saldo, KEWAJIBAN, -1)
+    total_aktiva = sum(nilai for _, nilai in aktiva_lancar + aktiva_tetap)
+    total_pasiva = sum(nilai for _, nilai in kewajiban) + modal_akhir
+
+    # --- JURNAL PENUTUP & NSSP ---
+    jurnal_penutup = _jurnal_penutup(pendapatan_per_akun, beban_per_akun, laba_bersih, prive, tanggal_tutup)
+    nssp = _nssp(saldo, ~tipe.isin(TIPE_NOMINAL), modal, modal_akhir)
+
+    return HasilLaporan(
+        neraca_saldo=neraca_saldo,
+        total_debit=int(saldo["Debit"].sum()),
+        total_kredit=int(saldo["Kredit"].sum()),
+        akun_pendapatan=pendapatan_per_akun["Akun"].tolist(),
+        akun_beban=beban_per_akun["Akun"].tolist(),
+        pendapatan_per_akun=pendapatan_per_akun,
+        beban_per_akun=beban_per_akun,
+        total_pendapatan=total_pendapatan,
+        total_beban=total_beban,
+        laba_bersih=laba_bersih,
+        modal_awal=modal_awal,
+        prive=prive,
+        modal_akhir=modal_akhir,
+        aktiva_lancar=aktiva_lancar,
+        aktiva_tetap=aktiva_tetap,
+        kewajiban=kewajiban,
+        total_aktiva=total_aktiva,
+        total_pasiva=total_pasiva,
+        jurnal_penutup=jurnal_penutup,
+        nssp=nssp,
+    )
+
+
+def gabung_saldo(saldo_awal, saldo_periode):
+    """Menjumlahkan saldo awal (snapshot periode lalu) dengan saldo transaksi periode berjalan."""
+    if saldo_awal is None or saldo_awal.empty:
+        return saldo_periode
+    return jumlah_saldo([saldo_awal, saldo_periode])
+
+
+def jumlah_saldo(daftar_saldo):
+    """Menjumlahkan beberapa tabel saldo per (Akun, Ref), misalnya saldo beberapa outlet."""
+    kolom = ["Akun", "Ref", "Debit", "Kredit", "Tipe", "Normal"]
+    gabungan = pd.concat([saldo[kolom] for saldo in daftar_saldo], ignore_index=True)
+    hasil = gabungan.groupby(["Akun", "Ref"], sort=True).agg(
+        Debit=("Debit", "sum"), Kredit=("Kredit", "sum"), Tipe=("Tipe", "first"), Normal=("Normal", "first")
+    ).reset_index()
+    hasil.insert(0, "ID", pd.factorize(hasil["Akun"])[0])
+    return hasil
+
+
+def saldo_setelah_penutupan(laporan, saldo):
+    """NSSP sebagai tabel saldo (Debit/Kredit bersih) lengkap dengan tipe akunnya.
+
+    Dipakai sebagai saldo awal: akun nominal sudah ditutup ke baris Modal.
+    """
+    nssp = laporan.nssp
+    nssp = nssp[(nssp["Debit"] != 0) | (nssp["Kredit"] != 0)].reset_index(drop=True)
+    tipe = dict(zip(saldo["Akun"], saldo["Tipe"]))
+    normal = dict(zip(saldo["Akun"], saldo["Normal"]))
+
+    hasil = nssp[["Akun", "Ref", "Debit", "Kredit"]].copy()
+    hasil["Tipe"] = [tipe.get(akun) or klasifikasi(akun)[0] for akun in hasil["Akun"]]
+    hasil["Normal"] = [normal.get(akun) or klasifikasi(akun)[1] for akun in hasil["Akun"]]
+    return hasil
+
+
+def hitung_laporan(jurnal, tanggal_tutup=None, periode=None, mulai=None, akhir=None):
+    """Menghitung semua laporan dari jurnal (BukuJurnal atau JurnalSQLite).
+
+    Jika ``periode`` (DaftarPeriode) diberikan, hanya transaksi periode berjalan
+    yang dibaca, dimulai dari saldo akhir periode terakhir yang sudah ditutup.
+    ``mulai``/``akhir`` membatasi laporan ke rentang tanggal: laba rugi hanya
+    dari transaksi dalam rentang, sedangkan saldo harta, utang, dan modal
+    adalah posisi per ``akhir`` (transaksi sebelum ``mulai`` menjadi saldo awal).
+    """
+    return susun_laporan(saldo_laporan(jurnal, periode, mulai, akhir), tanggal_tutup)
+
+
+def awal_saldo_laporan(periode=None, mulai=None):
+    """Tanggal transaksi paling awal yang dibaca ``saldo_laporan`` (None: sejak awal jurnal).
+
+    Baris sebelum tanggal ini tidak memengaruhi hasilnya, jadi tidak perlu dimuat.
+    """
+    awal = periode.mulai_berjalan if periode is not None else None
+    if awal is not None and mulai is not None and pd.Timestamp(mulai).normalize() < awal:
+        return None
+    return awal
+
+
+def saldo_laporan(jurnal, periode=None, mulai=None, akhir=None):
+    """Tabel saldo per (Akun, Ref) yang menjadi dasar hitung_laporan (argumen sama)."""
+    awal = periode.mulai_berjalan if periode is not None else None
+    saldo_awal = periode.saldo_awal if periode is not None else None
+
+    if mulai is not None:
+        mulai = pd.Timestamp(mulai).normalize()
+        # Rentang yang masuk ke periode tertutup dihitung ulang dari riwayat jurnal
+        if awal is not None and mulai < awal:
+            awal, saldo_awal = None, None
+        if awal is None or mulai > awal:
+            sebelum = gabung_saldo(saldo_awal, jurnal.saldo_per_akun(mulai=awal, akhir=mulai - pd.Timedelta(days=1)))
+            saldo_awal = saldo_setelah_penutupan(susun_laporan(sebelum), sebelum)
+        awal = mulai
+
+    return gabung_saldo(saldo_awal, jurnal.saldo_per_akun(mulai=awal, akhir=akhir))
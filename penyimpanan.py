@@ -0,0 +1,638 @@
+"""Penyimpanan data warung: snapshot kolumnar + log jurnal append-only.
+
+Yang disimpan hanya data warung di ``SKEMA_DATA_WARUNG`` (jurnal dan periode
+tertutup); login, widget, dan nilai tampilan tetap milik sesi. Setiap bagian
+punya file sendiri dan hanya ditulis ulang jika berubah sejak terakhir dimuat
+atau disimpan (lihat ``penanda_data``), jadi menutup periode misalnya cukup
+menulis ``periode.json`` tanpa menyentuh jurnal.
+
+Snapshot jurnal (``session_state.parquet``) menyimpan keadaan lengkap, sedangkan setiap
+transaksi baru cukup ditambahkan sebagai satu baris kecil di ``jurnal.log``.
+Saat dimuat, log diputar ulang di atas snapshot. Setelah ``SNAPSHOT_SETIAP``
+rekaman, snapshot ditulis ulang dan log dikosongkan (compaction) supaya
+pemutaran ulang saat start tetap singkat.
+
+Snapshot Parquet berisi kolom jurnal (terkompresi zstd, Akun/Ref sebagai
+kolom dictionary, row group berurutan pencatatan) dan metadata JSON (bagan
+akun, nomor log), jadi bisa dibaca alat lain dan tidak
+menjalankan kode apa pun saat dimuat seperti pickle. File dibaca lewat memory
+map dan hanya kolom yang dibutuhkan (lihat ``baca_snapshot_kolom``). Tanpa
+pyarrow, atau dengan ``WARTEG_SNAPSHOT=pickle``, snapshot tetap ditulis
+sebagai ``session_state.pkl``; snapshot pickle lama tetap bisa dimuat.
+
+Setiap warung punya folder data sendiri (``DataWarung``). Kasir di warung
+yang sama berbagi folder itu; setiap penulisan dilakukan di dalam
+``DataWarung.kunci()`` (kunci thread + kunci file), jadi dua kasir yang
+mencatat bersamaan tidak saling menimpa.
+
+``muat_buku`` membaca satu buku (folder warung, database, atau file impor)
+tanpa Streamlit; dipakai ``cetak_laporan`` dan ``konsolidasi``.
+"""
+import json
+import os
+import pickle
+import re
+import threading
+import weakref
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow opsional: tanpa itu snapshot tetap pickle
+    pa = pq = None
+
+from buku_jurnal import BukuJurnal
+from impor_jurnal import impor_berkas
+from jurnal_sqlite import JurnalSQLite
+from laporan import awal_saldo_laporan
+from periode import DaftarPeriode
+from uang import baris_ke_sen
+
+FILE_SNAPSHOT = "session_state.pkl"
+FILE_SNAPSHOT_KOLOM = "session_state.parquet"
+FILE_PERIODE = "periode.json"
+FILE_LOG = "jurnal.log"
+FILE_KUNCI = ".kunci"
+
+# Folder induk data semua warung (satu subfolder per kode warung)
+FOLDER_DATA = os.environ.get("WARTEG_DATA", "data_warung")
+
+# Backend jurnal: "pickle" (snapshot + log, default) atau "sqlite"
+BACKEND_JURNAL = os.environ.get("WARTEG_BACKEND", "pickle")
+FILE_DB = os.environ.get("WARTEG_DB", "warteg.db")
+
+# Jumlah rekaman log sebelum snapshot baru ditulis
+SNAPSHOT_SETIAP = 500
+
+# Format snapshot baru: "parquet" (default jika pyarrow terpasang) atau "pickle"
+FORMAT_SNAPSHOT = os.environ.get("WARTEG_SNAPSHOT", "parquet") if pq is not None else "pickle"
+
+# Baris per row group snapshot Parquet; statistik Tanggal per row group dipakai untuk melewati baris lama
+BARIS_PER_GRUP = 1 << 16
+
+# Galat saat snapshot tidak bisa dibaca (file rusak atau terpotong)
+GALAT_SNAPSHOT = (EOFError, pickle.UnpicklingError, ValueError)
+
+# Akhiran file yang dikenali muat_buku selain folder data warung
+AKHIRAN_DB = (".db", ".sqlite", ".sqlite3")
+AKHIRAN_IMPOR = (".csv", ".xlsx")
+
+
+def tulis_snapshot(data, path=FILE_SNAPSHOT):
+    """Menulis snapshot secara atomik (file sementara lalu os.replace)."""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def baca_snapshot(path=FILE_SNAPSHOT):
+    """Membaca snapshot, atau dict kosong jika belum ada."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def tambah_ke_log(rekaman, path=FILE_LOG):
+    """Menambahkan satu rekaman ke akhir log dan memastikan sudah sampai ke disk."""
+    baris = json.dumps(rekaman, ensure_ascii=False, default=str) + "\n"
+    with open(path, "ab") as f:
+        f.write(baris.encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def baca_log(setelah_seq=0, path=FILE_LOG):
+    """Mengembalikan rekaman log dengan seq > setelah_seq, urut sesuai penulisan.
+
+    Jika aplikasi mati di tengah penulisan, baris terakhir bisa terpotong.
+    Potongan itu dibuang (file dipotong ke rekaman utuh terakhir) supaya
+    rekaman berikutnya tidak ikut rusak.
+    """
+    if not os.path.exists(path):
+        return []
+
+    rekaman = []
+    posisi_utuh = 0
+    with open(path, "rb") as f:
+        for baris in f:
+            if not baris.endswith(b"\n"):
+                break
+            try:
+                r = json.loads(baris)
+            except ValueError:
+                break
+            posisi_utuh += len(baris)
+            if r.get("seq", 0) > setelah_seq:
+                rekaman.append(r)
+
+    if posisi_utuh < os.path.getsize(path):
+        with open(path, "r+b") as f:
+            f.truncate(posisi_utuh)
+    return rekaman
+
+
+def putar_rekaman(jurnal, rekaman_log, periode=None):
+    """Memutar ulang rekaman log (tambah/edit) di atas jurnal; mengembalikan seq rekaman yang dilewati.
+
+    Rekaman yang ditulis setelah penanda periode terakhir tetapi mengubah
+    periode yang sudah ditutup (lihat ``DaftarPeriode.menyentuh_tertutup``)
+    dilewati utuh. Rekaman sebelum penanda itu ditulis sebelum penutupan dan
+    sudah tercakup di saldo periode, jadi tetap diputar.
+    """
+    periksa_dari = 0
+    for i, rekaman in enumerate(rekaman_log):
+        # Penanda snapshot versi lama (tanpa "bagian") menulis semua bagian, termasuk periode
+        if rekaman["op"] == "snapshot" and "periode" in rekaman.get("bagian", ["periode"]):
+            periksa_dari = i + 1
+
+    lewati = []
+    for i, rekaman in enumerate(rekaman_log):
+        # Rekaman lama (tanpa penanda "sen") mencatat nominal dalam rupiah
+        ke_jurnal = (lambda baris: baris) if rekaman.get("sen") else baris_ke_sen
+        if rekaman["op"] == "tambah":
+            ubah, tambah, hapus = {}, [ke_jurnal(rekaman["baris"])], []
+        elif rekaman["op"] == "edit":
+            # Kunci dict di JSON selalu teks; ID baris dikembalikan ke int
+            ubah = {int(k): ke_jurnal(v) for k, v in rekaman["ubah"].items()}
+            tambah, hapus = [ke_jurnal(b) for b in rekaman["tambah"]], rekaman["hapus"]
+        else:
+            continue
+        if i >= periksa_dari and periode is not None and periode.menyentuh_tertutup(jurnal, ubah, tambah, hapus):
+            lewati.append(rekaman["seq"])
+        elif rekaman["op"] == "tambah":
+            jurnal.append(tambah[0])
+        else:
+            jurnal.terapkan_perubahan(ubah, tambah, hapus)
+    return lewati
+
+
+def kosongkan_log(path=FILE_LOG):
+    """Menghapus log setelah isinya sudah masuk ke snapshot."""
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def hapus_semua(path_snapshot=FILE_SNAPSHOT, path_log=FILE_LOG, path_snapshot_kolom=FILE_SNAPSHOT_KOLOM,
+                path_periode=FILE_PERIODE):
+    """Menghapus snapshot (kedua format) dan periode beserta log-nya."""
+    for path in (path_snapshot, path_log, path_snapshot_kolom, path_periode):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def tulis_periode(periode, path=FILE_PERIODE):
+    """Menulis periode tertutup (``DaftarPeriode.ke_state``) sebagai JSON secara atomik."""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(periode.ke_state() if periode is not None else [], f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def baca_periode(path=FILE_PERIODE):
+    """DaftarPeriode dari file periode, atau None jika belum ada."""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return DaftarPeriode.dari_state(json.load(f))
+
+
+# --- Skema data warung ---
+def _penanda_jurnal(jurnal):
+    if getattr(jurnal, "persisten", False):
+        # Isi jurnal SQLite ada di database; snapshot hanya menyimpan path-nya
+        return ("sqlite", jurnal.path)
+    # Objek jurnal yang sama (tanpa menahannya di memori) dengan versi yang sama
+    return (weakref.ref(jurnal), jurnal.versi)
+
+
+# Data warung yang disimpan: kunci session_state -> fungsi penanda isinya.
+# Penanda yang sama berarti bagian itu tidak berubah, jadi tidak ditulis ulang.
+SKEMA_DATA_WARUNG = {
+    "jurnal": _penanda_jurnal,
+    "periode": lambda periode: periode.sidik(),
+}
+
+
+def penanda_data(data):
+    """{kunci: penanda} untuk setiap bagian SKEMA_DATA_WARUNG yang ada di ``data``."""
+    return {kunci: penanda(data[kunci]) for kunci, penanda in SKEMA_DATA_WARUNG.items() if data.get(kunci) is not None}
+
+
+# --- Snapshot kolumnar (Parquet) ---
+KUNCI_META = b"warteg"
+VERSI_SNAPSHOT = 1
+
+KOLOM_SNAPSHOT = ["ID", "Tanggal", "Keterangan", "Akun", "Ref", "Debit", "Kredit"]
+
+# Kolom yang dibutuhkan saldo_laporan (tanpa Keterangan)
+KOLOM_SALDO = ["ID", "Tanggal", "Akun", "Ref", "Debit", "Kredit"]
+
+
+def _tabel_jurnal(state):
+    """Tabel Arrow dari ``BukuJurnal.__getstate__``; Akun/Ref disimpan sebagai kolom dictionary."""
+    kolom = state["kolom"]
+    return pa.table({
+        "ID": kolom["ID"],
+        "Tanggal": kolom["Tanggal"],
+        "Keterangan": pa.array(kolom["Keterangan"], pa.string()),
+        "Akun": pa.DictionaryArray.from_arrays(kolom["Akun"], pa.array(list(state["bagan"]), pa.string())),
+        "Ref": pa.DictionaryArray.from_arrays(kolom["Ref"], pa.array(state["ref"], pa.string())),
+        "Debit": kolom["Debit"],
+        "Kredit": kolom["Kredit"],
+    })
+
+
+def tulis_snapshot_kolom(data, path=FILE_SNAPSHOT_KOLOM):
+    """Menulis snapshot jurnal ({"jurnal", "_log_seq"}) sebagai Parquet secara atomik."""
+    lain = set(data) - {"jurnal", "_log_seq"}
+    if lain:
+        raise ValueError(f"Data {', '.join(sorted(lain))} tidak bisa disimpan di snapshot Parquet.")
+
+    jurnal = data.get("jurnal")
+    meta = {"format": VERSI_SNAPSHOT, "_log_seq": data.get("_log_seq", 0), "jurnal": None}
+    state = BukuJurnal().__getstate__()
+    if getattr(jurnal, "persisten", False):
+        # Backend SQLite: isi jurnal ada di database, snapshot cukup menyimpan path-nya
+        meta["jurnal"] = {"sqlite": jurnal.path}
+    elif jurnal is not None:
+        state = jurnal.__getstate__()
+        meta["jurnal"] = {k: state[k] for k in ("bagan", "ref", "versi", "id_berikut")}
+
+    tabel = _tabel_jurnal(state)
+    tabel = tabel.replace_schema_metadata({KUNCI_META: json.dumps(meta, ensure_ascii=False)})
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        pq.write_table(tabel, f, compression="zstd", row_group_size=BARIS_PER_GRUP)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _larik(kolom, dtype=None):
+    """ChunkedArray Arrow sebagai array numpy milik sendiri (bisa ditulis)."""
+    arr = kolom.to_numpy()
+    if dtype is not None:
+        arr = arr.astype(dtype, copy=False)
+    return arr if arr.flags.writeable else arr.copy()
+
+
+def _kode_kolom(kolom, daftar):
+    """Kolom dictionary Arrow sebagai kode ke ``daftar`` (urutan kamus bisa berbeda per row group)."""
+    kode = {nilai: i for i, nilai in enumerate(daftar)}
+    bagian = [
+        np.array([kode[v] for v in potong.dictionary.to_pylist()], dtype=np.int32)[potong.indices.to_numpy()]
+        for potong in kolom.chunks
+    ]
+    return np.concatenate(bagian) if bagian else np.empty(0, dtype=np.int32)
+
+
+def _tanda_file(path):
+    info = os.stat(path)
+    return info.st_size, info.st_mtime_ns
+
+
+def baca_snapshot_kolom(path=FILE_SNAPSHOT_KOLOM, hanya_saldo=False, mulai=None, periode=None):
+    """Membaca snapshot Parquet menjadi dict seperti baca_snapshot, atau dict kosong jika belum ada.
+
+    ``periode`` adalah periode tertutup warung (dari file periode); snapshot
+    yang lebih lama masih menyimpannya di metadata. Keterangan dibaca sebagai kolom Arrow dan baru diubah menjadi teks Python
+    saat pertama dipakai. Dengan ``hanya_saldo``, hasilnya cukup untuk
+    ``saldo_laporan(jurnal, periode, mulai, ...)``: Keterangan tidak dibaca dan
+    baris sebelum ``awal_saldo_laporan`` dilewati (row group yang seluruhnya
+    lebih awal tidak dibaca sama sekali), jadi jurnalnya tidak untuk diputar ulang log.
+    """
+    if not os.path.exists(path):
+        return {}
+    meta = pq.read_schema(path, memory_map=True).metadata or {}
+    if KUNCI_META not in meta:
+        raise ValueError(f"{path} bukan snapshot data warung.")
+    meta = json.loads(meta[KUNCI_META])
+
+    data = {"_log_seq": meta["_log_seq"]}
+    if periode is None and meta.get("periode") is not None:
+        periode = DaftarPeriode.dari_state(meta["periode"])
+    if periode is not None:
+        data["periode"] = periode
+    info = meta["jurnal"]
+    if info is None:
+        return data
+    if "sqlite" in info:
+        data["jurnal"] = JurnalSQLite(info["sqlite"])
+        return data
+
+    saring = None
+    if hanya_saldo:
+        awal = awal_saldo_laporan(periode, mulai)
+        saring = [("Tanggal", ">=", awal)] if awal is not None else None
+    tabel = pq.read_table(path, columns=KOLOM_SALDO if hanya_saldo else KOLOM_SNAPSHOT,
+                          filters=saring, memory_map=True)
+
+    if hanya_saldo:
+        tanda = _tanda_file(path)
+
+        def keterangan():
+            # Dibaca dari file yang sama saat benar-benar dibutuhkan
+            if _tanda_file(path) != tanda:
+                raise ValueError(f"Snapshot {path} sudah berganti sejak dimuat; muat ulang bukunya.")
+            return pq.read_table(path, columns=["Keterangan"], filters=saring, memory_map=True).column(0)
+    else:
+        kolom_keterangan = tabel.column("Keterangan")
+
+        def keterangan():
+            return kolom_keterangan
+
+    kolom = {
+        "ID": _larik(tabel.column("ID")),
+        "Tanggal": _larik(tabel.column("Tanggal"), "datetime64[s]"),
+        "Akun": _kode_kolom(tabel.column("Akun"), list(info["bagan"])),
+        "Ref": _kode_kolom(tabel.column("Ref"), info["ref"]),
+        "Debit": _larik(tabel.column("Debit")),
+        "Kredit": _larik(tabel.column("Kredit")),
+    }
+    data["jurnal"] = BukuJurnal.dari_state({**info, "kolom": kolom}, tunda={"Keterangan": lambda: _larik(keterangan())})
+    return data
+
+
+def jurnal_baru(path_db=FILE_DB):
+    """Membuat objek jurnal sesuai backend yang dipilih lewat WARTEG_BACKEND."""
+    if BACKEND_JURNAL == "sqlite":
+        return JurnalSQLite(path_db)
+    return BukuJurnal()
+
+
+# --- Kunci tulis per folder warung ---
+def _kunci_file(berkas):
+    if fcntl is not None:
+        fcntl.flock(berkas.fileno(), fcntl.LOCK_EX)
+        return
+    berkas.seek(0)
+    while True:
+        try:
+            msvcrt.locking(berkas.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            # LK_LOCK menyerah setelah sekitar 10 detik; terus tunggu
+            continue
+
+
+def _lepas_file(berkas):
+    if fcntl is not None:
+        fcntl.flock(berkas.fileno(), fcntl.LOCK_UN)
+    else:
+        berkas.seek(0)
+        msvcrt.locking(berkas.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class _KunciFolder:
+    """Kunci eksklusif satu folder: RLock untuk sesi (thread) di proses ini, kunci file untuk proses lain.
+
+    Boleh dipakai bertingkat oleh thread yang sama; file hanya dikunci di tingkat terluar.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._rlock = threading.RLock()
+        self._tingkat = 0
+        self._berkas = None
+
+    def __enter__(self):
+        self._rlock.acquire()
+        if self._tingkat == 0:
+            try:
+                self._berkas = open(self.path, "a+b")
+                _kunci_file(self._berkas)
+            except BaseException:
+                if self._berkas is not None:
+                    self._berkas.close()
+                    self._berkas = None
+                self._rlock.release()
+                raise
+        self._tingkat += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._tingkat -= 1
+        if self._tingkat == 0:
+            try:
+                _lepas_file(self._berkas)
+            finally:
+                self._berkas.close()
+                self._berkas = None
+        self._rlock.release()
+
+
+_daftar_kunci = {}
+_daftar_kunci_lock = threading.Lock()
+
+
+def _kunci_untuk(folder):
+    """Satu _KunciFolder per folder untuk seluruh proses (semua sesi Streamlit)."""
+    path = os.path.abspath(os.path.join(folder, FILE_KUNCI))
+    with _daftar_kunci_lock:
+        if path not in _daftar_kunci:
+            _daftar_kunci[path] = _KunciFolder(path)
+        return _daftar_kunci[path]
+
+
+# --- Data per warung ---
+def nama_folder_warung(kode):
+    """Nama folder data untuk kode warung; karakter selain huruf, angka, _ dan - diganti "_"."""
+    return re.sub(r"[^\w-]", "_", kode) or "_"
+
+
+class DataWarung:
+    """Folder data satu warung: snapshot, log jurnal, database SQLite, dan kunci tulisnya."""
+
+    def __init__(self, kode, folder_induk=FOLDER_DATA):
+        self.kode = kode
+        self._pakai_folder(os.path.join(folder_induk, nama_folder_warung(kode)))
+
+    @classmethod
+    def dari_folder(cls, folder):
+        """DataWarung untuk folder data yang sudah ada (misalnya dipilih lewat baris perintah)."""
+        warung = cls.__new__(cls)
+        warung.kode = os.path.basename(os.path.abspath(folder))
+        warung._pakai_folder(folder)
+        return warung
+
+    def _pakai_folder(self, folder):
+        self.folder = folder
+        os.makedirs(self.folder, exist_ok=True)
+        self.snapshot = os.path.join(self.folder, FILE_SNAPSHOT)
+        self.snapshot_kolom = os.path.join(self.folder, FILE_SNAPSHOT_KOLOM)
+        self.periode = os.path.join(self.folder, FILE_PERIODE)
+        self.log = os.path.join(self.folder, FILE_LOG)
+        self.db = os.path.join(self.folder, os.path.basename(FILE_DB))
+
+    def kunci(self):
+        """Context manager kunci tulis warung ini (bisa bertingkat)."""
+        return _kunci_untuk(self.folder)
+
+    def jurnal_baru(self):
+        return jurnal_baru(self.db)
+
+    def muat(self, hanya_saldo=False, mulai=None):
+        """Snapshot jurnal (Parquet, atau pickle dari versi lama/``WARTEG_SNAPSHOT=pickle``) beserta periodenya."""
+        periode = self.muat_periode()
+        if os.path.exists(self.snapshot_kolom):
+            if pq is None:
+                raise ImportError(f"Snapshot {self.snapshot_kolom} butuh pyarrow (pip install pyarrow).")
+            return baca_snapshot_kolom(self.snapshot_kolom, hanya_saldo, mulai, periode)
+        data = baca_snapshot(self.snapshot)
+        # Snapshot pickle lama menyimpan periode di dalamnya
+        if periode is not None:
+            data["periode"] = periode
+        return data
+
+    def muat_periode(self):
+        return baca_periode(self.periode)
+
+    def rekaman_setelah(self, seq):
+        return baca_log(setelah_seq=seq, path=self.log)
+
+    def catat(self, rekaman):
+        tambah_ke_log(rekaman, self.log)
+
+    def tanda_log(self):
+        """(ukuran, waktu ubah) log; jika tidak berubah, tidak ada rekaman baru untuk dibaca."""
+        try:
+            info = os.stat(self.log)
+        except FileNotFoundError:
+            return None
+        return info.st_size, info.st_mtime_ns
+
+    def simpan(self, data, berubah=None):
+        """Menulis bagian ``berubah`` dari ``data`` (bawaan: semua bagian SKEMA_DATA_WARUNG).
+
+        Bagian yang belum punya file sendiri (misalnya periode dari snapshot
+        lama) tetap ditulis. Jika jurnal ditulis ulang, log diganti satu penanda
+        snapshot (compaction); jika tidak, penanda itu ditambahkan ke log.
+        Penanda mencatat bagian yang ditulis, jadi sesi lain yang belum membaca
+        sampai ``data["_log_seq"]`` cukup memuat ulang bagian itu.
+        Mengembalikan True jika snapshot jurnal ditulis ulang.
+        """
+        berubah = set(SKEMA_DATA_WARUNG if berubah is None else berubah)
+        if not os.path.exists(self.periode):
+            berubah.add("periode")
+        if FORMAT_SNAPSHOT == "parquet":
+            tulis, snapshot, usang = tulis_snapshot_kolom, self.snapshot_kolom, self.snapshot
+        else:
+            tulis, snapshot, usang = tulis_snapshot, self.snapshot, self.snapshot_kolom
+        if not os.path.exists(snapshot):
+            berubah.add("jurnal")
+
+        # Periode dulu: snapshot lama yang masih memuat periode baru dihapus setelah periode punya file sendiri
+        if "periode" in berubah:
+            tulis_periode(data.get("periode"), self.periode)
+        penanda = {"seq": data["_log_seq"], "op": "snapshot", "bagian": sorted(berubah)}
+        if "jurnal" not in berubah:
+            tambah_ke_log(penanda, self.log)
+            return False
+
+        tulis({k: data[k] for k in ("jurnal", "_log_seq") if k in data}, snapshot)
+        # Snapshot format lain (misalnya pickle sebelum pindah ke Parquet) tidak dibaca lagi
+        if os.path.exists(usang):
+            os.remove(usang)
+        tmp = self.log + ".tmp"
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        tambah_ke_log(penanda, tmp)
+        os.replace(tmp, self.log)
+        return True
+
+    def hapus(self):
+        hapus_semua(self.snapshot, self.log, self.snapshot_kolom, self.periode)
+
+    def pindahkan_data_lama(self, folder_lama="."):
+        """Memindahkan data versi lama (satu file bersama di folder kerja) ke warung ini.
+
+        Hanya jika warung ini belum punya data sama sekali; dipanggil di dalam kunci().
+        """
+        if any(os.path.exists(path) for path in (self.snapshot, self.snapshot_kolom, self.periode, self.log)):
+            return
+        pindah = [(FILE_SNAPSHOT, self.snapshot), (FILE_LOG, self.log)]
+        pindah += [(FILE_DB + akhiran, self.db + akhiran) for akhiran in ("", "-wal", "-shm")]
+        for nama, tujuan in pindah:
+            asal = os.path.join(folder_lama, nama)
+            if os.path.exists(asal) and not os.path.exists(tujuan):
+                os.replace(asal, tujuan)
+
+
+# --- Pembacaan buku tanpa Streamlit (cetak_laporan, konsolidasi) ---
+def _folder_warung(path):
+    """True jika ``path`` adalah folder data warung (ada snapshot, log, atau database)."""
+    return any(os.path.exists(os.path.join(path, nama))
+               for nama in (FILE_SNAPSHOT, FILE_SNAPSHOT_KOLOM, FILE_LOG, os.path.basename(FILE_DB)))
+
+
+def daftar_buku(daftar_path):
+    """Sumber jurnal dari daftar path; folder yang bukan folder data warung diurai menjadi isinya."""
+    buku = []
+    for path in daftar_path:
+        if os.path.isdir(path) and not _folder_warung(path):
+            for nama in sorted(os.listdir(path)):
+                isi = os.path.join(path, nama)
+                if (os.path.isdir(isi) and _folder_warung(isi)) or nama.lower().endswith(AKHIRAN_DB + AKHIRAN_IMPOR):
+                    buku.append(isi)
+        else:
+            buku.append(path)
+    return buku
+
+
+def _muat_warung(folder, hanya_saldo=False, mulai=None):
+    # Seperti sesi.muat_data_warung: snapshot lalu log diputar ulang, dibaca di dalam kunci warung
+    warung = DataWarung.dari_folder(folder)
+    with warung.kunci():
+        data = warung.muat(hanya_saldo, mulai)
+        rekaman_log = warung.rekaman_setelah(data.get("_log_seq", 0))
+        if hanya_saldo and any(r["op"] != "snapshot" for r in rekaman_log):
+            # Rekaman log merujuk ID baris mana pun, jadi diputar di atas jurnal lengkap
+            data = warung.muat()
+
+    jurnal = data.get("jurnal")
+    if isinstance(jurnal, list):
+        jurnal = BukuJurnal([baris_ke_sen(b) for b in jurnal])
+    if getattr(jurnal, "persisten", False) or (jurnal is None and os.path.exists(warung.db)):
+        jurnal = JurnalSQLite(warung.db)
+    elif rekaman_log:
+        if jurnal is None:
+            jurnal = BukuJurnal()
+        putar_rekaman(jurnal, rekaman_log, data.get("periode"))
+    return jurnal if jurnal is not None else BukuJurnal(), data.get("periode")
+
+
+def muat_buku(path, hanya_saldo=False, mulai=None):
+    """(jurnal, periode atau None) dari satu sumber jurnal.
+
+    ``hanya_saldo``: jurnal hanya dipakai untuk ``saldo_laporan(jurnal, periode,
+    mulai, ...)``, jadi dari snapshot Parquet cukup kolom dan baris yang
+    dibutuhkan (lihat ``baca_snapshot_kolom``); sumber lain tetap dimuat lengkap.
+    """
+    if os.path.isdir(path):
+        return _muat_warung(path, hanya_saldo, mulai)
+    if not os.path.exists(path):
+        raise ValueError(f"Sumber jurnal {path} tidak ditemukan.")
+    akhiran = os.path.splitext(path)[1].lower()
+    if akhiran in AKHIRAN_DB:
+        return JurnalSQLite(path), None
+    if akhiran in AKHIRAN_IMPOR:
+        with open(path, "rb") as f:
+            hasil = impor_berkas(f, os.path.basename(path))
+        if hasil.galat:
+            raise ValueError(hasil.galat)
+        return BukuJurnal.dari_frame(hasil.data), None
+    raise ValueError(f"Jenis file {path} tidak dikenali (folder warung, {', '.join(AKHIRAN_DB + AKHIRAN_IMPOR)}).")
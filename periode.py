@@ -0,0 +1,141 @@
+"""Periode akuntansi warteg.
+
+Menutup periode (misalnya satu bulan) membekukan saldo akun permanen hasil
+NSSP menjadi snapshot saldo awal. Laporan berikutnya mulai dari snapshot itu
+dan hanya menjumlahkan transaksi periode berjalan, sehingga biaya laporan
+tidak ikut membesar seiring bertambahnya riwayat jurnal.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+
+import pandas as pd
+
+from laporan import gabung_saldo, saldo_setelah_penutupan, susun_laporan
+from uang import frame_sen, ke_sen
+
+KOLOM_SALDO_AWAL = ["Akun", "Ref", "Debit", "Kredit", "Tipe", "Normal"]
+
+
+@dataclass
+class PeriodeTertutup:
+    """Satu periode yang sudah ditutup beserta saldo akhirnya."""
+
+    mulai: pd.Timestamp         # None untuk periode pertama (sejak awal jurnal)
+    akhir: pd.Timestamp
+    saldo_akhir: pd.DataFrame   # Saldo akun permanen setelah penutupan (KOLOM_SALDO_AWAL), dalam sen
+    laba_bersih: int            # sen
+    modal_akhir: int            # sen
+    ditutup_pada: datetime
+
+
+class DaftarPeriode:
+    """Riwayat periode yang sudah ditutup; periode berjalan mulai sehari setelah yang terakhir."""
+
+    def __init__(self):
+        self.tertutup = []
+
+    def __len__(self):
+        return len(self.tertutup)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # Snapshot lama menyimpan nominal periode sebagai rupiah float
+        for periode in self.tertutup:
+            if isinstance(periode.laba_bersih, float):
+                periode.saldo_akhir = frame_sen(periode.saldo_akhir)
+                periode.laba_bersih = ke_sen(periode.laba_bersih)
+                periode.modal_akhir = ke_sen(periode.modal_akhir)
+
+    def ke_state(self):
+        """Bentuk sederhana tanpa pickle (hanya tipe JSON), misalnya untuk snapshot Parquet."""
+        return [{
+            "mulai": p.mulai.isoformat() if p.mulai is not None else None,
+            "akhir": p.akhir.isoformat(),
+            "saldo_akhir": {k: p.saldo_akhir[k].tolist() for k in KOLOM_SALDO_AWAL},
+            "laba_bersih": int(p.laba_bersih),
+            "modal_akhir": int(p.modal_akhir),
+            "ditutup_pada": p.ditutup_pada.isoformat(),
+        } for p in self.tertutup]
+
+    @classmethod
+    def dari_state(cls, state):
+        daftar = cls()
+        for p in state:
+            saldo = pd.DataFrame(p["saldo_akhir"], columns=KOLOM_SALDO_AWAL)
+            daftar.tertutup.append(PeriodeTertutup(
+                mulai=pd.Timestamp(p["mulai"]) if p["mulai"] is not None else None,
+                akhir=pd.Timestamp(p["akhir"]),
+                saldo_akhir=saldo.astype({"Debit": "int64", "Kredit": "int64"}),
+                laba_bersih=p["laba_bersih"],
+                modal_akhir=p["modal_akhir"],
+                ditutup_pada=datetime.fromisoformat(p["ditutup_pada"]),
+            ))
+        return daftar
+
+    @property
+    def terakhir(self):
+        return self.tertutup[-1] if self.tertutup else None
+
+    @property
+    def mulai_berjalan(self):
+        """Tanggal pertama periode berjalan, atau None jika belum pernah ada penutupan."""
+        if not self.tertutup:
+            return None
+        return self.terakhir.akhir + pd.Timedelta(days=1)
+
+    @property
+    def saldo_awal(self):
+        """Saldo awal periode berjalan (snapshot periode terakhir), atau None."""
+        return self.terakhir.saldo_akhir if self.tertutup else None
+
+    def sidik(self):
+        """Penanda keadaan periode untuk kunci cache (berubah setiap tutup/buka kembali)."""
+        return tuple((p.akhir.strftime("%Y-%m-%d"), p.ditutup_pada.isoformat()) for p in self.tertutup)
+
+    def menyentuh_tertutup(self, jurnal, ubah=None, tambah=None, hapus=None):
+        """True jika hasil edit (argumen ``BukuJurnal.terapkan_perubahan``) mengubah periode yang sudah ditutup.
+
+        Yaitu mengubah atau menghapus baris bertanggal sebelum periode berjalan,
+        atau memindahkan/menambah baris ke tanggal sebelum itu. Saldo periode
+        tertutup sudah dibekukan, jadi perubahan seperti itu tidak akan terlihat
+        (atau terhitung dua kali) di laporan.
+        """
+        mulai = self.mulai_berjalan
+        if mulai is None:
+            return False
+        ubah = ubah or {}
+        if jurnal.ada_baris_sebelum([*ubah, *(hapus or [])], mulai):
+            return True
+        tanggal_baru = [kolom["Tanggal"] for kolom in ubah.values() if "Tanggal" in kolom]
+        tanggal_baru += [baris.get("Tanggal") for baris in tambah or []]
+        for tanggal in tanggal_baru:
+            tanggal = pd.Timestamp(tanggal)
+            if not pd.isna(tanggal) and tanggal.normalize() < mulai:
+                return True
+        return False
+
+    def tutup(self, jurnal, akhir):
+        """Menutup periode berjalan sampai tanggal ``akhir`` (inklusif) dan menyimpan snapshot-nya."""
+        akhir = pd.Timestamp(akhir).normalize()
+        mulai = self.mulai_berjalan
+        if mulai is not None and akhir < mulai:
+            raise ValueError(
+                f"Tanggal tutup {akhir:%Y-%m-%d} sebelum awal periode berjalan ({mulai:%Y-%m-%d})."
+            )
+
+        saldo = gabung_saldo(self.saldo_awal, jurnal.saldo_per_akun(mulai=mulai, akhir=akhir))
+        laporan = susun_laporan(saldo, akhir.strftime("%Y-%m-%d"))
+        periode = PeriodeTertutup(
+            mulai=mulai,
+            akhir=akhir,
+            saldo_akhir=saldo_setelah_penutupan(laporan, saldo)[KOLOM_SALDO_AWAL],
+            laba_bersih=laporan.laba_bersih,
+            modal_akhir=laporan.modal_akhir,
+            ditutup_pada=datetime.now(),
+        )
+        self.tertutup.append(periode)
+        return periode
+
+    def buka_kembali(self):
+        """Membatalkan penutupan periode terakhir (misalnya ada transaksi yang terlewat)."""
+        return self.tertutup.pop() if self.tertutup else None
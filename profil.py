@@ -0,0 +1,114 @@
+"""Profil waktu per rerun Streamlit (opt-in lewat ``WARTEG_PROFIL=1``).
+
+Langkah-langkah penting (login, muat data, hitung laporan, simpan, render
+tabel) diukur dengan ``ukur``/``diukur``. Di akhir rerun rinciannya ditulis
+sebagai satu baris JSON ke ``FILE_PROFIL`` dan ditampilkan di panel sidebar.
+Jika profil tidak aktif, ``ukur`` langsung menjalankan isinya tanpa mencatat.
+
+Catatan disimpan per thread: setiap sesi Streamlit menjalankan skripnya di
+thread sendiri, jadi rerun sesi yang berbeda tidak saling tercampur.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+AKTIF = os.environ.get("WARTEG_PROFIL", "").lower() in ("1", "ya", "true")
+FILE_PROFIL = os.environ.get("WARTEG_PROFIL_FILE", "profil_rerun.jsonl")
+
+_lokal = threading.local()
+_lock_file = threading.Lock()
+
+
+@contextmanager
+def ukur(nama):
+    """Mengukur lama blok ``with`` sebagai langkah ``nama`` di rerun yang sedang berjalan."""
+    catatan = getattr(_lokal, "catatan", None)
+    if catatan is None:
+        yield
+        return
+    mulai = time.perf_counter()
+    try:
+        yield
+    finally:
+        catatan.append((nama, time.perf_counter() - mulai))
+
+
+def diukur(nama):
+    """Dekorator: setiap pemanggilan fungsi dicatat sebagai langkah ``nama``."""
+    def bungkus(fungsi):
+        @functools.wraps(fungsi)
+        def fungsi_diukur(*args, **kwargs):
+            with ukur(nama):
+                return fungsi(*args, **kwargs)
+        return fungsi_diukur
+    return bungkus
+
+
+def mulai_rerun():
+    """Membuka catatan baru untuk rerun ini (tidak berbuat apa-apa jika profil tidak aktif)."""
+    if AKTIF:
+        _lokal.catatan = []
+        _lokal.mulai = time.perf_counter()
+
+
+def selesai_rerun(halaman, warung=None):
+    """Menutup catatan rerun, menulisnya ke FILE_PROFIL, dan mengembalikan rinciannya (atau None)."""
+    catatan = getattr(_lokal, "catatan", None)
+    if catatan is None:
+        return None
+    _lokal.catatan = None
+
+    hasil = {
+        "waktu": datetime.now().isoformat(timespec="milliseconds"),
+        "warung": warung,
+        "halaman": halaman,
+        "total_ms": round((time.perf_counter() - _lokal.mulai) * 1000, 2),
+        "langkah": [{"nama": nama, "ms": round(detik * 1000, 2)} for nama, detik in catatan],
+    }
+    with _lock_file:
+        with open(FILE_PROFIL, "a", encoding="utf-8") as f:
+            f.write(json.dumps(hasil, ensure_ascii=False) + "\n")
+    return hasil
+
+
+def ringkas(hasil):
+    """Langkah dikelompokkan per nama: [(nama, kali, total ms, persen dari rerun)], terlama dulu."""
+    per_nama = {}
+    for langkah in hasil["langkah"]:
+        kali, ms = per_nama.get(langkah["nama"], (0, 0.0))
+        per_nama[langkah["nama"]] = (kali + 1, ms + langkah["ms"])
+    total = hasil["total_ms"] or 1.0
+    baris = [(nama, kali, round(ms, 2), round(ms / total * 100, 1)) for nama, (kali, ms) in per_nama.items()]
+    return sorted(baris, key=lambda b: b[2], reverse=True)
+
+
+def pasang(objek, atribut, nama=None):
+    """Membungkus ``objek.atribut`` (misalnya ``st.dataframe``) supaya ikut diukur.
+
+    Hanya dipasang jika profil aktif, dan cukup sekali per proses.
+    """
+    asli = getattr(objek, atribut)
+    if not AKTIF or getattr(asli, "_diukur_profil", False):
+        return
+    terbungkus = diukur(nama or atribut)(asli)
+    terbungkus._diukur_profil = True
+    setattr(objek, atribut, terbungkus)
+
+
+def tampilkan_panel(hasil):
+    """Panel debug di sidebar berisi rincian rerun terakhir."""
+    if hasil is None:
+        return
+    import streamlit as st
+
+    with st.sidebar.expander(f"🐞 Profil Rerun ({hasil['total_ms']:.0f} ms)"):
+        st.table([
+            {"Langkah": nama, "Kali": kali, "ms": f"{ms:,.1f}", "%": f"{persen:.0f}"}
+            for nama, kali, ms, persen in ringkas(hasil)
+        ])
+        st.caption(f"Total rerun {hasil['total_ms']:,.1f} ms · halaman {hasil['halaman']} · "
+                   f"rincian lengkap di {FILE_PROFIL}")
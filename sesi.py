@@ -0,0 +1,253 @@
+"""Data warung di session_state Streamlit: muat, catat, dan simpan.
+
+Semua perubahan jurnal dan periode lewat modul ini supaya snapshot, log, dan
+kunci folder warung (lihat ``penyimpanan``) selalu dipakai dengan cara yang sama.
+Nominal yang masuk ke sini sudah dalam sen, kecuali hasil st.data_editor yang
+masih rupiah (lihat ``perubahan_editor``).
+Modul ini (dan pandas di belakangnya) baru diimpor setelah login.
+"""
+import io
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+
+from buku_jurnal import BukuJurnal
+from ekspor_excel import excel_laporan, nama_file_excel
+from penyimpanan import (
+    BACKEND_JURNAL,
+    GALAT_SNAPSHOT,
+    SKEMA_DATA_WARUNG,
+    SNAPSHOT_SETIAP,
+    penanda_data,
+    putar_rekaman,
+)
+from periode import DaftarPeriode
+from profil import diukur
+from turunan import graf_laporan
+from uang import KOLOM_NOMINAL, baris_ke_sen, ke_sen
+
+
+# --- Helper Functions (Fungsi Asli Anda - Tidak Diubah) ---
+
+# Kunci session_state yang merupakan data warung (disimpan dan dibagi antar kasir); selain ini tidak pernah ditulis
+KUNCI_DATA_WARUNG = tuple(SKEMA_DATA_WARUNG)
+
+# Fungsi menyimpan session state ke file
+@diukur("simpan_session_state")
+def simpan_session_state():
+    # Hanya data warung yang disimpan, dan hanya bagian yang berubah sejak terakhir dimuat/disimpan.
+    # Jika jurnal ikut ditulis, sekaligus compaction: isi log sudah tercakup di snapshot.
+    warung = st.session_state.warung
+    with warung.kunci():
+        seq = st.session_state.get("_log_seq", 0) + 1
+        data = {k: st.session_state[k] for k in KUNCI_DATA_WARUNG if k in st.session_state}
+        data["_log_seq"] = seq
+        penanda = penanda_data(data)
+        tersimpan = st.session_state.get("_penanda_tersimpan", {})
+        if warung.simpan(data, [k for k in KUNCI_DATA_WARUNG if penanda.get(k) != tersimpan.get(k)]):
+            st.session_state._snapshot_seq = seq
+        st.session_state._log_seq = seq
+        st.session_state._penanda_tersimpan = penanda
+        st.session_state._tanda_log = warung.tanda_log()
+
+# Fungsi memberi tahu rekaman log yang tidak diputar karena mengubah periode yang sudah ditutup
+def peringatan_rekaman_dilewati(lewati):
+    if lewati:
+        st.warning(f"⚠️ {len(lewati)} perubahan di log dilewati karena mengubah periode yang sudah ditutup.")
+
+# Fungsi memuat data warung (snapshot + log) ke session state, menggantikan data yang ada
+def muat_data_warung():
+    warung = st.session_state.warung
+    try:
+        data = warung.muat()
+    except GALAT_SNAPSHOT:
+        st.warning("File snapshot data warung rusak. Mengabaikan...")
+        warung.hapus()
+        data = {}
+
+    jurnal = data.get("jurnal")
+
+    # Snapshot lama menyimpan jurnal sebagai list of dict (nominal dalam rupiah)
+    if isinstance(jurnal, list):
+        jurnal = BukuJurnal([baris_ke_sen(b) for b in jurnal])
+
+    # Penanda isi file (sebelum log diputar): bagian yang berbeda dari ini ditulis saat disimpan
+    st.session_state._penanda_tersimpan = penanda_data({**data, "jurnal": jurnal})
+
+    # Putar ulang log jurnal di atas snapshot
+    seq = snapshot_seq = data.get("_log_seq", 0)
+    rekaman_log = warung.rekaman_setelah(seq)
+    if rekaman_log:
+        if not getattr(jurnal, "persisten", False):
+            if jurnal is None:
+                jurnal = BukuJurnal()
+            peringatan_rekaman_dilewati(putar_rekaman(jurnal, rekaman_log, data.get("periode")))
+        seq = rekaman_log[-1]["seq"]
+
+    # Backend SQLite: data langsung dibaca dari database, tidak dimuat ke memori.
+    # Jurnal dari snapshot dipindahkan sekali saat database masih kosong.
+    if BACKEND_JURNAL == "sqlite" and not getattr(jurnal, "persisten", False):
+        db = warung.jurnal_baru()
+        if jurnal and not db:
+            db.extend(jurnal.frame())
+        jurnal = db
+
+    st.session_state.jurnal = jurnal if jurnal is not None else warung.jurnal_baru()
+    st.session_state.periode = data.get("periode") or DaftarPeriode()
+    st.session_state._log_seq = seq
+    st.session_state._snapshot_seq = snapshot_seq
+    st.session_state._tanda_log = warung.tanda_log()
+
+# Fungsi memuat data warung pengguna yang login, atau mengejar tulisan kasir lain sejak muat terakhir
+@diukur("muat_session_state")
+def muat_session_state():
+    warung = st.session_state.warung
+    with warung.kunci():
+        if "jurnal" not in st.session_state:
+            warung.pindahkan_data_lama()
+            muat_data_warung()
+            return
+
+        tanda = warung.tanda_log()
+        if tanda == st.session_state.get("_tanda_log"):
+            return
+        rekaman_log = warung.rekaman_setelah(st.session_state.get("_log_seq", 0))
+        # Penanda snapshot dari versi lama (tanpa "bagian") berarti semua bagian ditulis ulang
+        bagian = {b for r in rekaman_log if r["op"] == "snapshot" for b in r.get("bagian", KUNCI_DATA_WARUNG)}
+        if "jurnal" in bagian:
+            # Kasir lain menulis snapshot jurnal baru (import, reset, compaction)
+            muat_data_warung()
+            return
+        if "periode" in bagian:
+            # Kasir lain menutup atau membuka kembali periode: cukup periode yang dimuat ulang
+            # (sebelum log diputar, supaya rekaman sesudahnya diperiksa terhadap periode itu)
+            st.session_state.periode = warung.muat_periode() or DaftarPeriode()
+            st.session_state._penanda_tersimpan = {
+                **st.session_state.get("_penanda_tersimpan", {}), **penanda_data({"periode": st.session_state.periode}),
+            }
+        if rekaman_log:
+            if not getattr(st.session_state.jurnal, "persisten", False):
+                peringatan_rekaman_dilewati(
+                    putar_rekaman(st.session_state.jurnal, rekaman_log, st.session_state.periode))
+            st.session_state._log_seq = rekaman_log[-1]["seq"]
+        st.session_state._tanda_log = tanda
+
+# Konteks untuk setiap perubahan data warung: kunci, kejar tulisan kasir lain, baru ubah
+@contextmanager
+def ubah_data_warung():
+    with st.session_state.warung.kunci():
+        muat_session_state()
+        yield
+
+# Fungsi menulis satu rekaman ke log jurnal (dengan compaction berkala)
+def catat_ke_log(rekaman):
+    # Dipanggil di dalam ubah_data_warung(), jadi _log_seq sudah yang terakhir di log
+    warung = st.session_state.warung
+    seq = st.session_state.get("_log_seq", 0) + 1
+    warung.catat({"seq": seq, "sen": True, **rekaman})
+    st.session_state._log_seq = seq
+    st.session_state._tanda_log = warung.tanda_log()
+
+    # Compaction berkala supaya pemutaran ulang log saat start tetap pendek
+    if seq - st.session_state.get("_snapshot_seq", 0) >= SNAPSHOT_SETIAP:
+        simpan_session_state()
+
+# Fungsi menambah satu baris jurnal tanpa menulis ulang seluruh session state
+def catat_jurnal(baris):
+    with ubah_data_warung():
+        st.session_state.jurnal.append(baris)
+        if getattr(st.session_state.jurnal, "persisten", False):
+            return
+        catat_ke_log({"op": "tambah", "baris": baris})
+
+# Fungsi menyimpan hasil edit: hanya baris yang diubah/ditambah/dihapus yang dicatat.
+# Ditolak utuh (False) jika menyentuh periode yang sudah ditutup, termasuk yang baru ditutup kasir lain.
+def catat_perubahan_jurnal(ubah, tambah, hapus):
+    with ubah_data_warung():
+        periode = st.session_state.periode
+        if periode.menyentuh_tertutup(st.session_state.jurnal, ubah, tambah, hapus):
+            st.error(f"❌ Periode sampai {periode.terakhir.akhir:%d-%m-%Y} sudah ditutup. "
+                     f"Baris sebelum {periode.mulai_berjalan:%d-%m-%Y} tidak bisa diubah, dihapus, atau ditambahkan.")
+            return False
+        st.session_state.jurnal.terapkan_perubahan(ubah, tambah, hapus)
+        if not getattr(st.session_state.jurnal, "persisten", False):
+            catat_ke_log({"op": "edit", "ubah": ubah, "tambah": tambah, "hapus": hapus})
+    return True
+
+# Fungsi membaca perubahan yang dilaporkan st.data_editor menjadi (ubah, tambah, hapus) per ID baris.
+# Editor menampilkan rupiah; Debit/Kredit dikembalikan ke sen di sini.
+def perubahan_editor(kunci, df_awal, df_edit):
+    laporan_edit = st.session_state.get(kunci) or {}
+    id_baris = [int(i) for i in df_awal.index]
+    hapus = [id_baris[int(i)] for i in laporan_edit.get("deleted_rows", [])]
+    # Nilai diambil dari df_edit yang sudah diubah Streamlit ke tipe kolom yang benar
+    ubah = {}
+    for i, kolom in laporan_edit.get("edited_rows", {}).items():
+        id_ubah = id_baris[int(i)]
+        if id_ubah not in hapus:
+            ubah[id_ubah] = {
+                k: ke_sen(df_edit.at[id_ubah, k]) if k in KOLOM_NOMINAL else df_edit.at[id_ubah, k]
+                for k in kolom if k in df_edit.columns
+            }
+    jumlah_tambah = len(laporan_edit.get("added_rows", []))
+    tambah = df_edit.iloc[len(df_edit) - jumlah_tambah:].to_dict("records") if jumlah_tambah else []
+    tambah = [baris_ke_sen(baris) for baris in tambah]
+    return ubah, tambah, hapus
+
+# Fungsi menambah banyak baris jurnal sekaligus (impor) dengan satu kali penyimpanan
+def catat_jurnal_banyak(df):
+    with ubah_data_warung():
+        st.session_state.jurnal.extend(df)
+        if getattr(st.session_state.jurnal, "persisten", False):
+            return
+        # Satu snapshot untuk seluruh batch, bukan satu rekaman log per baris
+        simpan_session_state()
+
+# Graf nilai turunan sesi ini (saldo, laporan, laba bersih, modal akhir), dibuat sekali per sesi
+def graf_turunan():
+    if "_turunan" not in st.session_state:
+        st.session_state._turunan = graf_laporan(lambda: st.session_state.jurnal, lambda: st.session_state.get("periode"))
+    return st.session_state._turunan
+
+# Fungsi menghitung laporan periode berjalan (mulai dari saldo periode yang sudah ditutup).
+# Hasilnya di-memo per versi jurnal dan periode, jadi berpindah halaman tidak menghitung ulang.
+@diukur("hitung_laporan")
+def laporan_berjalan(mulai=None, akhir=None):
+    return graf_turunan().ambil("laporan", mulai, akhir)
+
+# Fungsi mengambil satu nilai turunan periode berjalan (misalnya "laba_bersih", "modal_akhir"), dalam sen
+def nilai_berjalan(nama, mulai=None, akhir=None):
+    return graf_turunan().ambil(nama, mulai, akhir)
+
+# Fungsi memilih rentang tanggal laporan; None berarti batas bawaan (seluruh periode berjalan)
+def pilih_rentang_tanggal(kunci, ikut_periode=True):
+    pertama, terakhir = st.session_state.jurnal.batas_tanggal()
+    if pertama is None:
+        return None, None
+    awal_bawaan = pertama
+    periode = st.session_state.get("periode")
+    if ikut_periode and periode is not None and periode.mulai_berjalan is not None:
+        awal_bawaan = max(pertama, periode.mulai_berjalan)
+    akhir_bawaan = max(terakhir, awal_bawaan)
+
+    rentang = st.date_input("📅 Rentang Tanggal:", value=(awal_bawaan.date(), akhir_bawaan.date()), key=kunci)
+    if not isinstance(rentang, (tuple, list)):
+        rentang = (rentang,)
+    mulai = pd.Timestamp(rentang[0]) if len(rentang) > 0 else awal_bawaan
+    akhir = pd.Timestamp(rentang[1]) if len(rentang) > 1 else akhir_bawaan
+    return (
+        None if mulai == awal_bawaan else mulai,
+        None if akhir == akhir_bawaan else akhir,
+    )
+
+# --- Fungsi Excel Anda (Tidak Diubah) ---
+def simpan_semua_ke_excel():
+    if not st.session_state.get("jurnal"):
+        return None, None
+
+    filename = nama_file_excel(st.session_state.jurnal.frame())
+
+    # File yang sama diambil dari cache selama isi jurnal tidak berubah
+    buffer = io.BytesIO(excel_laporan(st.session_state.jurnal, periode=st.session_state.get("periode")))
+    return buffer, filename
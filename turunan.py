@@ -0,0 +1,93 @@
+"""Nilai turunan data warung yang dihitung malas dan di-memo menurut versi masukannya.
+
+Grafnya kecil dan eksplisit: setiap sumber (jurnal, periode, tanggal hari
+ini) punya penanda versi, dan setiap nilai turunan didaftarkan bersama nama
+masukannya (sumber atau nilai turunan lain), misalnya laba bersih dari
+laporan, laporan dari saldo, saldo dari jurnal dan periode. Saat diminta,
+penanda semua masukan dibandingkan dengan penanda waktu nilai itu terakhir
+dihitung. Nilai dihitung ulang hanya jika ada masukan yang berubah, dan
+nilai yang tidak pernah diminta tidak pernah dihitung, jadi tidak ada lagi
+nilai yang bergantung pada halaman mana yang sudah dikunjungi lebih dulu.
+"""
+import weakref
+from datetime import datetime
+from itertools import count
+
+from laporan import saldo_laporan, susun_laporan
+
+# Jumlah hasil (nilai x argumen) yang disimpan per graf; yang paling lama tidak dipakai dibuang dulu
+BATAS_MEMO = 32
+
+
+class GrafTurunan:
+    """Sumber dan nilai turunan beserta memonya (satu graf per sesi)."""
+
+    def __init__(self, batas_memo=BATAS_MEMO):
+        self._sumber = {}            # nama -> (fungsi ambil, fungsi penanda)
+        self._turunan = {}           # nama -> (fungsi hitung, nama masukan)
+        self._memo = {}              # (nama, argumen) -> (penanda masukan, nilai, generasi)
+        self._generasi = count(1)
+        self.batas_memo = batas_memo
+
+    def sumber(self, nama, ambil, penanda):
+        """Mendaftarkan data masukan: ``ambil()`` nilainya, ``penanda(nilai)`` versinya (sama = tidak berubah)."""
+        self._sumber[nama] = (ambil, penanda)
+
+    def turunan(self, nama, hitung, masukan):
+        """Mendaftarkan nilai ``hitung(*nilai masukan, *argumen)``.
+
+        Argumen permintaan (misalnya rentang tanggal) ikut diteruskan ke masukan
+        yang juga nilai turunan, dan setiap argumen punya memo sendiri.
+        """
+        self._turunan[nama] = (hitung, tuple(masukan))
+
+    def ambil(self, nama, *argumen):
+        return self._nilai(nama, argumen)[0]
+
+    def kosongkan(self):
+        self._memo.clear()
+
+    def _nilai(self, nama, argumen):
+        """(nilai, penanda); penanda nilai turunan adalah generasi perhitungannya."""
+        if nama in self._sumber:
+            ambil, penanda = self._sumber[nama]
+            nilai = ambil()
+            return nilai, penanda(nilai)
+
+        hitung, masukan = self._turunan[nama]
+        isi = [self._nilai(m, argumen) for m in masukan]
+        penanda_masukan = tuple(penanda for _, penanda in isi)
+        kunci = (nama, argumen)
+        memo = self._memo.pop(kunci, None)
+        if memo is None or memo[0] != penanda_masukan:
+            memo = (penanda_masukan, hitung(*(nilai for nilai, _ in isi), *argumen), next(self._generasi))
+        # Dimasukkan ulang di akhir: urutan dict menjadi urutan terakhir dipakai
+        self._memo[kunci] = memo
+        while len(self._memo) > self.batas_memo:
+            del self._memo[next(iter(self._memo))]
+        return memo[1], memo[2]
+
+
+# --- Graf laporan ---
+def _penanda_jurnal(jurnal):
+    # Objek jurnal yang sama (tanpa menahannya di memori) dengan versi yang sama
+    return (weakref.ref(jurnal), jurnal.versi)
+
+
+def graf_laporan(ambil_jurnal, ambil_periode):
+    """Graf laporan periode berjalan: saldo -> laporan -> laba bersih, modal akhir.
+
+    Semua nilai turunannya menerima argumen (mulai, akhir) seperti ``hitung_laporan``.
+    """
+    graf = GrafTurunan()
+    graf.sumber("jurnal", ambil_jurnal, _penanda_jurnal)
+    graf.sumber("periode", ambil_periode, lambda periode: periode.sidik() if periode is not None else None)
+    # Tanggal Jurnal Penutup: laporan yang sama dihitung ulang paling sering sekali sehari
+    graf.sumber("tanggal_tutup", lambda: datetime.today().strftime("%Y-%m-%d"), lambda tanggal: tanggal)
+
+    graf.turunan("saldo", saldo_laporan, ["jurnal", "periode"])
+    graf.turunan("laporan", lambda saldo, tanggal_tutup, *rentang: susun_laporan(saldo, tanggal_tutup),
+                 ["saldo", "tanggal_tutup"])
+    graf.turunan("laba_bersih", lambda laporan, *rentang: laporan.laba_bersih, ["laporan"])
+    graf.turunan("modal_akhir", lambda laporan, *rentang: laporan.modal_akhir, ["laporan"])
+    return graf
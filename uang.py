@@ -0,0 +1,55 @@
+"""Nominal uang sebagai bilangan bulat sen (int64).
+
+Debit/Kredit disimpan, dijumlahkan, dan dibandingkan dalam sen, jadi total
+selalu eksak dan cek seimbang cukup perbandingan bilangan bulat. Rupiah
+(float) hanya dipakai di tepi: input pengguna, tampilan, dan file Excel.
+"""
+import numpy as np
+import pandas as pd
+
+SEN_PER_RUPIAH = 100
+
+KOLOM_NOMINAL = ("Debit", "Kredit")
+
+
+def ke_sen(rupiah):
+    """Rupiah (angka/teks) menjadi sen (int); kosong atau bukan angka menjadi 0."""
+    try:
+        angka = float(rupiah)
+    except (TypeError, ValueError):
+        return 0
+    return 0 if np.isnan(angka) else int(round(angka * SEN_PER_RUPIAH))
+
+
+def ke_sen_array(rupiah):
+    """Versi vektor ke_sen: array/Series rupiah menjadi array int64 sen."""
+    angka = pd.to_numeric(pd.Series(rupiah, copy=False), errors="coerce").fillna(0).to_numpy(dtype=np.float64)
+    return np.rint(angka * SEN_PER_RUPIAH).astype(np.int64)
+
+
+def ke_rupiah(sen):
+    """Sen (int atau array) menjadi rupiah (float) untuk tampilan dan ekspor."""
+    if isinstance(sen, (np.ndarray, pd.Series)):
+        return sen / SEN_PER_RUPIAH
+    return int(sen) / SEN_PER_RUPIAH
+
+
+def frame_rupiah(df, kolom=KOLOM_NOMINAL):
+    """Salinan DataFrame dengan kolom nominal (sen) diubah ke rupiah."""
+    kolom = [k for k in kolom if k in df]
+    if not kolom:
+        return df
+    return df.assign(**{k: df[k] / SEN_PER_RUPIAH for k in kolom})
+
+
+def frame_sen(df, kolom=KOLOM_NOMINAL):
+    """Salinan DataFrame dengan kolom nominal (rupiah) diubah ke sen."""
+    kolom = [k for k in kolom if k in df]
+    if not kolom:
+        return df
+    return df.assign(**{k: ke_sen_array(df[k]) for k in kolom})
+
+
+def baris_ke_sen(baris):
+    """Salinan satu baris jurnal (dict) dengan Debit/Kredit rupiah diubah ke sen."""
+    return {**baris, **{k: ke_sen(baris.get(k)) for k in KOLOM_NOMINAL if k in baris}}